@@ -1,8 +1,11 @@
 from app.users import models as user_models
 from app.startups import models as startup_models
+from app.startups import stats_models as startup_stats_models
+from app.credibility import models as credibility_models
 from app.launches import models as launch_models
 from app.reviews import models as review_models
 from app.feedback import models as feedback_models
+from app.matches import models as match_models
 
 from logging.config import fileConfig
 from sqlalchemy import engine_from_config, pool
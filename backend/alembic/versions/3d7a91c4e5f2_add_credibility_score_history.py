@@ -0,0 +1,45 @@
+"""add credibility_score_history
+
+Revision ID: 3d7a91c4e5f2
+Revises: 8f3b2c6e1a7d
+Create Date: 2026-10-18 14:05:31.907412
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d7a91c4e5f2'
+down_revision: Union[str, Sequence[str], None] = '8f3b2c6e1a7d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('credibility_score_history',
+    sa.Column('startup_id', sa.UUID(), nullable=False),
+    sa.Column('ts', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('resolution', sa.String(), nullable=False, server_default='raw'),
+    sa.Column('score', sa.Integer(), nullable=False),
+    sa.Column('min_score', sa.Integer(), nullable=False),
+    sa.Column('max_score', sa.Integer(), nullable=False),
+    sa.Column('samples', sa.Integer(), nullable=False, server_default='1'),
+    sa.ForeignKeyConstraint(['startup_id'], ['startups.id'], ondelete='CASCADE'),
+    # (startup_id, ts) prefix serves trend range scans
+    sa.PrimaryKeyConstraint('startup_id', 'ts', 'resolution')
+    )
+
+    # Seed each series with the current score, bucketed like history.py
+    op.execute("""
+        INSERT INTO credibility_score_history (startup_id, ts, score, min_score, max_score)
+        SELECT id, date_trunc('minute', now()), credibility_score, credibility_score, credibility_score
+        FROM startups
+        WHERE credibility_score IS NOT NULL
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('credibility_score_history')
@@ -0,0 +1,68 @@
+"""add startup_stats
+
+Revision ID: 5c1e7a9d2b40
+Revises: 20bbe0158deb
+Create Date: 2026-10-18 09:12:44.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e7a9d2b40'
+down_revision: Union[str, Sequence[str], None] = '20bbe0158deb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('startup_stats',
+    sa.Column('startup_id', sa.UUID(), nullable=False),
+    sa.Column('total_upvotes', sa.BigInteger(), nullable=False, server_default='0'),
+    sa.Column('launch_count', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('verified_reviews', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('unverified_reviews', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('feedback_count', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('rating_sum', sa.BigInteger(), nullable=False, server_default='0'),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['startup_id'], ['startups.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('startup_id')
+    )
+
+    # Backfill from source tables
+    op.execute("""
+        INSERT INTO startup_stats (
+            startup_id, total_upvotes, launch_count, verified_reviews,
+            unverified_reviews, feedback_count, rating_sum
+        )
+        SELECT
+            s.id,
+            COALESCE(l.total_upvotes, 0),
+            COALESCE(l.launch_count, 0),
+            COALESCE(r.verified_reviews, 0),
+            COALESCE(r.unverified_reviews, 0),
+            COALESCE(f.feedback_count, 0),
+            COALESCE(f.rating_sum, 0)
+        FROM startups s
+        LEFT JOIN (
+            SELECT startup_id, SUM(upvotes) AS total_upvotes, COUNT(*) AS launch_count
+            FROM launches GROUP BY startup_id
+        ) l ON l.startup_id = s.id
+        LEFT JOIN (
+            SELECT startup_id,
+                   COUNT(*) FILTER (WHERE verified IS TRUE) AS verified_reviews,
+                   COUNT(*) FILTER (WHERE verified IS NOT TRUE) AS unverified_reviews
+            FROM reviews GROUP BY startup_id
+        ) r ON r.startup_id = s.id
+        LEFT JOIN (
+            SELECT startup_id, COUNT(*) AS feedback_count, SUM(rating) AS rating_sum
+            FROM enterprise_feedback WHERE verified IS TRUE GROUP BY startup_id
+        ) f ON f.startup_id = s.id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('startup_stats')
@@ -0,0 +1,29 @@
+"""index startup foreign keys
+
+Revision ID: 8f3b2c6e1a7d
+Revises: 5c1e7a9d2b40
+Create Date: 2026-10-18 10:41:07.522913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f3b2c6e1a7d'
+down_revision: Union[str, Sequence[str], None] = '5c1e7a9d2b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Set-wise credibility aggregation filters child tables by startup_id
+    op.create_index(op.f('ix_launches_startup_id'), 'launches', ['startup_id'], unique=False)
+    op.create_index(op.f('ix_reviews_startup_id'), 'reviews', ['startup_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_reviews_startup_id'), table_name='reviews')
+    op.drop_index(op.f('ix_launches_startup_id'), table_name='launches')
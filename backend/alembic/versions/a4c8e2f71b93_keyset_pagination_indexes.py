@@ -0,0 +1,58 @@
+"""keyset pagination indexes
+
+Revision ID: a4c8e2f71b93
+Revises: 3d7a91c4e5f2
+Create Date: 2026-10-18 16:22:09.614378
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c8e2f71b93'
+down_revision: Union[str, Sequence[str], None] = '3d7a91c4e5f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Sort keys must be non-null for (key, id) < (:key, :id) cursors
+    op.execute("UPDATE launches SET upvotes = 0 WHERE upvotes IS NULL")
+    op.alter_column('launches', 'upvotes', nullable=False, server_default='0')
+    op.execute("UPDATE startups SET credibility_score = 0 WHERE credibility_score IS NULL")
+    op.alter_column('startups', 'credibility_score', nullable=False, server_default='0')
+
+    # One index per list endpoint sort order (scanned backwards for DESC)
+    op.create_index('ix_launches_upvotes_id', 'launches', ['upvotes', 'id'])
+    op.create_index('ix_launches_startup_created_id', 'launches', ['startup_id', 'created_at', 'id'])
+    op.create_index('ix_startups_credibility_score_id', 'startups', ['credibility_score', 'id'])
+    op.create_index('ix_startups_created_id', 'startups', ['created_at', 'id'])
+    op.create_index(
+        'ix_reviews_verified_startup_created_id', 'reviews',
+        ['startup_id', 'created_at', 'id'],
+        postgresql_where=sa.text('verified'),
+    )
+    op.create_index(
+        'ix_enterprise_feedback_verified_startup_created_id', 'enterprise_feedback',
+        ['startup_id', 'created_at', 'id'],
+        postgresql_where=sa.text('verified'),
+    )
+    op.create_index(
+        'ix_enterprise_feedback_enterprise_created_id', 'enterprise_feedback',
+        ['enterprise_id', 'created_at', 'id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_enterprise_feedback_enterprise_created_id', table_name='enterprise_feedback')
+    op.drop_index('ix_enterprise_feedback_verified_startup_created_id', table_name='enterprise_feedback')
+    op.drop_index('ix_reviews_verified_startup_created_id', table_name='reviews')
+    op.drop_index('ix_startups_created_id', table_name='startups')
+    op.drop_index('ix_startups_credibility_score_id', table_name='startups')
+    op.drop_index('ix_launches_startup_created_id', table_name='launches')
+    op.drop_index('ix_launches_upvotes_id', table_name='launches')
+    op.alter_column('startups', 'credibility_score', nullable=True, server_default=None)
+    op.alter_column('launches', 'upvotes', nullable=True, server_default=None)
@@ -0,0 +1,33 @@
+"""gin index enterprise preferences
+
+Revision ID: a9e4b27c5d10
+Revises: f3c8d19b6a27
+Create Date: 2026-10-18 20:58:14.336029
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9e4b27c5d10'
+down_revision: Union[str, Sequence[str], None] = 'f3c8d19b6a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_enterprise_profiles_interested_industries', 'enterprise_profiles',
+        ['interested_industries'], postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_enterprise_profiles_preferred_arr_ranges', 'enterprise_profiles',
+        ['preferred_arr_ranges'], postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_enterprise_profiles_preferred_arr_ranges', table_name='enterprise_profiles')
+    op.drop_index('ix_enterprise_profiles_interested_industries', table_name='enterprise_profiles')
@@ -0,0 +1,35 @@
+"""add enterprise_profiles.matches_computed_at
+
+Revision ID: b6d2f4a81c39
+Revises: a9e4b27c5d10
+Create Date: 2026-10-19 10:12:44.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6d2f4a81c39'
+down_revision: Union[str, Sequence[str], None] = 'a9e4b27c5d10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'enterprise_profiles',
+        sa.Column('matches_computed_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    # Lists written so far came from full refreshes; the rest are built on first read
+    op.execute("""
+        UPDATE enterprise_profiles p
+        SET matches_computed_at = now()
+        WHERE EXISTS (SELECT 1 FROM startup_matches m WHERE m.enterprise_id = p.user_id)
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('enterprise_profiles', 'matches_computed_at')
@@ -0,0 +1,53 @@
+"""add launches.hot_score
+
+Revision ID: c2e5b8d40a17
+Revises: a4c8e2f71b93
+Create Date: 2026-10-18 17:48:52.140266
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2e5b8d40a17'
+down_revision: Union[str, Sequence[str], None] = 'a4c8e2f71b93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('launches', sa.Column('hot_score', sa.Float(), nullable=True))
+    op.create_index(
+        'ix_launches_hot_score_id', 'launches', ['hot_score', 'id'],
+        postgresql_where=sa.text('hot_score IS NOT NULL'),
+    )
+
+    # Backfill from vote timestamps (24h half-life, epoch 2025-01-01 UTC;
+    # scripts/rebuild_hot_scores.py recomputes with the configured values)
+    op.execute("""
+        UPDATE launches l
+        SET hot_score = s.hot
+        FROM (
+            SELECT launch_id, MAX(top) + LN(SUM(POWER(2.0, w - top))) / LN(2) AS hot
+            FROM (
+                SELECT launch_id,
+                       w,
+                       MAX(w) OVER (PARTITION BY launch_id) AS top
+                FROM (
+                    SELECT launch_id,
+                           (EXTRACT(EPOCH FROM created_at) - 1735689600) / 86400.0 AS w
+                    FROM launch_upvotes
+                ) weights
+            ) per_vote
+            GROUP BY launch_id
+        ) s
+        WHERE l.id = s.launch_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_launches_hot_score_id', table_name='launches')
+    op.drop_column('launches', 'hot_score')
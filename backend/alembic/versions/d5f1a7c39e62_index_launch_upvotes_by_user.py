@@ -0,0 +1,27 @@
+"""index launch_upvotes by user
+
+Revision ID: d5f1a7c39e62
+Revises: c2e5b8d40a17
+Create Date: 2026-10-18 18:31:07.402551
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5f1a7c39e62'
+down_revision: Union[str, Sequence[str], None] = 'c2e5b8d40a17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_launch_upvotes_user_launch', 'launch_upvotes', ['user_id', 'launch_id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_launch_upvotes_user_launch', table_name='launch_upvotes')
@@ -0,0 +1,43 @@
+"""add startups.search_vector
+
+Revision ID: e7b3c05d8a14
+Revises: d5f1a7c39e62
+Create Date: 2026-10-18 19:05:43.218870
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b3c05d8a14'
+down_revision: Union[str, Sequence[str], None] = 'd5f1a7c39e62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Stored generated column: rewrites the table once, then Postgres keeps
+    # it in step with name/industry/description on every write
+    op.add_column('startups', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('english', name), 'A') || "
+            "setweight(to_tsvector('english', industry), 'B') || "
+            "setweight(to_tsvector('english', description), 'C')",
+            persisted=True,
+        ),
+    ))
+    op.create_index(
+        'ix_startups_search_vector', 'startups', ['search_vector'],
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_startups_search_vector', table_name='startups')
+    op.drop_column('startups', 'search_vector')
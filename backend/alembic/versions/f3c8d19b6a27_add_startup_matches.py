@@ -0,0 +1,46 @@
+"""add startup_matches
+
+Revision ID: f3c8d19b6a27
+Revises: e7b3c05d8a14
+Create Date: 2026-10-18 20:12:36.905114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c8d19b6a27'
+down_revision: Union[str, Sequence[str], None] = 'e7b3c05d8a14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('startup_matches',
+    sa.Column('enterprise_id', sa.UUID(), nullable=False),
+    sa.Column('startup_id', sa.UUID(), nullable=False),
+    sa.Column('score', sa.Float(), nullable=False),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['enterprise_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['startup_id'], ['startups.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('enterprise_id', 'startup_id', name='unique_startup_match')
+    )
+    op.create_index(op.f('ix_startup_matches_id'), 'startup_matches', ['id'], unique=False)
+    op.create_index(op.f('ix_startup_matches_startup_id'), 'startup_matches', ['startup_id'], unique=False)
+    op.create_index(
+        'ix_startup_matches_enterprise_score', 'startup_matches',
+        ['enterprise_id', 'score', 'startup_id'],
+    )
+    # Lists are filled by scripts/rebuild_matches.py (or lazily on first read)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_startup_matches_enterprise_score', table_name='startup_matches')
+    op.drop_index(op.f('ix_startup_matches_startup_id'), table_name='startup_matches')
+    op.drop_index(op.f('ix_startup_matches_id'), table_name='startup_matches')
+    op.drop_table('startup_matches')
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+from app.startups.schemas import StartupResponse
+
+
+class SimilarStartupResponse(BaseModel):
+    # Cosine similarity (0-1) of description, industry and launch taglines
+    score: float
+    startup: StartupResponse
@@ -0,0 +1,45 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.ai.similar import load_documents, similar_index
+from app.startups.models import Startup
+
+
+async def index_startup(db: AsyncSession, startup_id):
+    """
+    Re-vectorize one startup after a write (new startup, new launch
+    tagline). Skipped until the index is loaded; loading picks it up.
+    """
+    if not similar_index.ready:
+        return
+    documents = await load_documents(db, [startup_id])
+    if startup_id in documents:
+        similar_index.upsert(startup_id, documents[startup_id])
+    else:
+        similar_index.remove(startup_id)
+
+
+async def get_similar_startups(db: AsyncSession, startup_id, limit: int) -> list | None:
+    """
+    Up to `limit` (score, startup) most similar to a startup, or None if
+    the startup does not exist.
+    """
+    await similar_index.warm()
+    if startup_id not in similar_index:
+        # Created by another worker since this one last rebuilt
+        await index_startup(db, startup_id)
+    matches = similar_index.similar(startup_id, limit)
+    if matches is None:
+        return None
+
+    startups = {
+        startup.id: startup
+        for startup in await db.scalars(
+            select(Startup).where(Startup.id.in_([match_id for _, match_id in matches]))
+        )
+    }
+    return [
+        (score, startups[match_id])
+        for score, match_id in matches
+        if match_id in startups
+    ]
@@ -0,0 +1,538 @@
+# app/ai/similar.py
+
+import asyncio
+import hashlib
+import logging
+import math
+import os
+import re
+import tempfile
+import time
+import uuid
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from functools import lru_cache
+
+import numpy as np
+from sqlalchemy import func, select
+
+from app.core.config import (
+    SIMILAR_CANDIDATES,
+    SIMILAR_DIM,
+    SIMILAR_INDEX_PATH,
+    SIMILAR_REBUILD_SECONDS,
+)
+from app.core.database import AsyncSessionLocal
+from app.launches.models import Launch
+from app.startups.models import Startup
+
+logger = logging.getLogger(__name__)
+
+# -------------------------------------------------
+# VECTORIZER
+# -------------------------------------------------
+# One document per startup: its description, its launch taglines and its
+# industry as a single token (counted INDUSTRY_BOOST times, so a shared
+# industry weighs about as much as a few shared words). Terms get
+# (1 + log tf) * idf, L2-normalized, and are kept two ways:
+#
+# - sparse: (term hash, weight) pairs, exact TF-IDF cosine;
+# - dense: the same weights hashed into `dim` float32 buckets with a
+#   hash-derived sign, so collisions cancel out on average. A dot product
+#   of dense rows approximates the exact cosine.
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOP_WORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or our "
+    "that the their this to we with you your".split()
+)
+INDUSTRY_BOOST = 3
+# Longer "words" are pasted URLs, hashes or base64, not vocabulary
+MAX_TOKEN_LENGTH = 32
+SIGN_BIT = 1 << 63
+
+
+def document_terms(industry: str | None, description: str | None, taglines=()) -> Counter:
+    counts = Counter(
+        token
+        for text in (description, *taglines)
+        for token in TOKEN_RE.findall((text or "").lower())
+        if 1 < len(token) <= MAX_TOKEN_LENGTH and token not in STOP_WORDS
+    )
+    if industry:
+        counts[f"industry:{industry.strip().lower()}"] += INDUSTRY_BOOST
+    return counts
+
+
+@lru_cache(maxsize=1 << 17)
+def _term_hash(term: str) -> int:
+    # Not hash(): keys must agree across processes and restarts
+    return int.from_bytes(hashlib.blake2b(term.encode(), digest_size=8).digest(), "little")
+
+
+def fit_idf(documents) -> tuple[dict, int]:
+    """
+    Smoothed idf per term, plus the number of documents it was fit on.
+    """
+    df = Counter()
+    docs = 0
+    for counts in documents:
+        df.update(counts.keys())
+        docs += 1
+    return {term: math.log((1 + docs) / (1 + n)) + 1 for term, n in df.items()}, docs
+
+
+def vectorize(counts: Counter, idf: dict, docs: int, dim: int):
+    """
+    (dense float32 vector, sparse (keys, weights)) of one document.
+    """
+    # Terms unseen at fit time count as the rarest
+    unseen = math.log(1 + docs) + 1
+    keys = np.fromiter((_term_hash(term) for term in counts), dtype=np.uint64, count=len(counts))
+    weights = np.fromiter(
+        ((1 + math.log(tf)) * idf.get(term, unseen) for term, tf in counts.items()),
+        dtype=np.float64,
+        count=len(counts),
+    )
+    norm = np.linalg.norm(weights)
+    if norm:
+        weights /= norm
+
+    signs = np.where(keys & np.uint64(SIGN_BIT), 1.0, -1.0)
+    dense = np.bincount(
+        (keys % np.uint64(dim)).astype(np.int64), weights * signs, minlength=dim
+    ).astype(np.float32)
+    dense_norm = np.linalg.norm(dense)
+    if dense_norm:
+        dense /= dense_norm
+
+    order = np.argsort(keys)
+    return dense, (keys[order], weights[order].astype(np.float32))
+
+
+def build_matrix(documents: dict, dim: int):
+    """
+    (vectors, terms, ids, idf, docs) for {startup_id: terms}; CPU only,
+    run off the event loop.
+    """
+    idf, docs = fit_idf(documents.values())
+    vectors = np.zeros((len(documents), dim), dtype=np.float32)
+    terms = []
+    for row, counts in enumerate(documents.values()):
+        vectors[row], sparse = vectorize(counts, idf, docs, dim)
+        terms.append(sparse)
+    return vectors, terms, list(documents), idf, docs
+
+
+async def load_rows(db, startup_ids=None) -> list:
+    """
+    (startup_id, industry, description, taglines) for the given startups
+    (all when None); tokenizing them is left to `documents_from_rows`.
+    """
+    startups = select(Startup.id, Startup.industry, Startup.description)
+    launches = select(Launch.startup_id, Launch.tagline)
+    if startup_ids is not None:
+        startups = startups.where(Startup.id.in_(startup_ids))
+        launches = launches.where(Launch.startup_id.in_(startup_ids))
+
+    taglines = defaultdict(list)
+    for startup_id, tagline in await db.execute(launches):
+        taglines[startup_id].append(tagline)
+    return [
+        (row.id, row.industry, row.description, taglines.get(row.id, ()))
+        for row in await db.execute(startups)
+    ]
+
+
+def documents_from_rows(rows) -> dict:
+    """
+    {startup_id: terms}; CPU only, run off the event loop for many rows.
+    """
+    return {
+        startup_id: document_terms(industry, description, taglines)
+        for startup_id, industry, description, taglines in rows
+    }
+
+
+async def load_documents(db, startup_ids=None) -> dict:
+    """
+    {startup_id: terms} for a few startups (tokenized on the caller's loop).
+    """
+    return documents_from_rows(await load_rows(db, startup_ids))
+
+
+def snapshot_arrays(vectors, terms, ids, idf, docs, dim, as_of) -> dict:
+    """
+    The arrays `save` writes for an index; `vectors` must not change
+    while they are written.
+    """
+    n = len(ids)
+    lengths = [len(keys) for keys, _ in terms]
+    encoded = [term.encode() for term in idf]
+    return {
+        "vectors": vectors[:n],
+        # uint8, not "S16": numpy strips trailing NUL bytes from S arrays
+        "ids": np.frombuffer(
+            b"".join(startup_id.bytes for startup_id in ids), dtype=np.uint8
+        ).reshape(n, 16),
+        # Sparse rows as CSR: row i is [offsets[i], offsets[i + 1])
+        "offsets": np.concatenate(([0], np.cumsum(lengths, dtype=np.int64))),
+        "keys": np.concatenate([keys for keys, _ in terms] or [np.empty(0, np.uint64)]),
+        "weights": np.concatenate(
+            [weights for _, weights in terms] or [np.empty(0, np.float32)]
+        ),
+        # Terms as one UTF-8 blob + offsets: a fixed-width str array
+        # would pad every term to the longest one
+        "vocabulary": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+        "vocabulary_offsets": np.concatenate(
+            ([0], np.cumsum([len(term) for term in encoded], dtype=np.int64))
+        ),
+        "idf": np.array(list(idf.values()), dtype=np.float64),
+        "meta": np.array([dim, docs], dtype=np.int64),
+        "as_of": np.array([as_of.timestamp()], dtype=np.float64),
+    }
+
+
+def _save_parts(path: str, parts):
+    _write_snapshot(path, snapshot_arrays(*parts))
+
+
+def _build_and_write(rows, dim: int, path: str, as_of):
+    """
+    Tokenize, vectorize and save a full rebuild in one worker thread;
+    nothing else holds the new arrays yet.
+    """
+    built = build_matrix(documents_from_rows(rows), dim)
+    _write_snapshot(path, snapshot_arrays(*built, dim, as_of))
+    return built
+
+
+# -------------------------------------------------
+# INDEX
+# -------------------------------------------------
+
+class SimilarStartupIndex:
+    """
+    Startup vectors as rows of one float32 matrix, plus each startup's
+    sparse TF-IDF terms.
+
+    A query is a matrix-vector product and an argpartition over the dense
+    rows (n * dim multiply-adds in numpy, no per-row Python) to shortlist
+    `candidates` startups, which are then ordered by exact cosine. Writes
+    update one row in place. The full rebuild (which also refreshes idf)
+    runs every `rebuild_interval` and is saved to `path`; on start the
+    file is loaded and only startups changed since are vectorized.
+    """
+
+    def __init__(self, dim: int, candidates: int, path: str, rebuild_interval: float):
+        self.dim = dim
+        self.candidates = candidates
+        self.path = path
+        self.rebuild_interval = rebuild_interval
+
+        # Rows [0, len(_ids)) are live; capacity grows by doubling
+        self._vectors = np.zeros((0, dim), dtype=np.float32)
+        # Per row: (sorted term hashes, weights)
+        self._terms: list = []
+        self._ids: list = []
+        # startup_id -> row
+        self._rows: dict = {}
+        self._idf: dict = {}
+        self._docs = 0
+        # Database time the last full rebuild read from
+        self._as_of: datetime | None = None
+
+        # Writes made while a rebuild is reading, applied again on top of
+        # it: startup_id -> terms, or None for a removal
+        self._rebuilding = False
+        self._replay: dict = {}
+        self._dirty = False
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+        self.ready = False
+        self.rebuilds = 0
+        self.file_loads = 0
+        self.errors = 0
+        self.last_rebuild_s = 0.0
+        self.last_warm_s = 0.0
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, startup_id):
+        return startup_id in self._rows
+
+    # ---------------------------------------------
+    # Updates
+    # ---------------------------------------------
+    def upsert(self, startup_id, counts: Counter):
+        if self._rebuilding:
+            self._replay[startup_id] = counts
+        dense, sparse = vectorize(counts, self._idf, self._docs, self.dim)
+
+        row = self._rows.get(startup_id)
+        if row is None:
+            row = len(self._ids)
+            if row == len(self._vectors):
+                grown = np.zeros((max(64, 2 * row), self.dim), dtype=np.float32)
+                grown[:row] = self._vectors[:row]
+                self._vectors = grown
+            self._ids.append(startup_id)
+            self._terms.append(sparse)
+            self._rows[startup_id] = row
+        self._vectors[row] = dense
+        self._terms[row] = sparse
+        self._dirty = True
+
+    def remove(self, startup_id):
+        if self._rebuilding:
+            self._replay[startup_id] = None
+        row = self._rows.pop(startup_id, None)
+        if row is None:
+            return
+        # Move the last row into the gap
+        last = len(self._ids) - 1
+        if row != last:
+            moved = self._ids[last]
+            self._vectors[row] = self._vectors[last]
+            self._terms[row] = self._terms[last]
+            self._ids[row] = moved
+            self._rows[moved] = row
+        self._ids.pop()
+        self._terms.pop()
+        self._dirty = True
+
+    # ---------------------------------------------
+    # Queries
+    # ---------------------------------------------
+    def _cosine(self, terms, row) -> float:
+        keys, weights = self._terms[row]
+        _, mine, theirs = np.intersect1d(terms[0], keys, assume_unique=True, return_indices=True)
+        return float(np.dot(terms[1][mine], weights[theirs]))
+
+    def similar(self, startup_id, k: int) -> list | None:
+        """
+        Up to `k` (cosine, startup_id) most similar to a startup, best
+        first; None if the startup is not indexed.
+        """
+        row = self._rows.get(startup_id)
+        if row is None:
+            return None
+
+        n = len(self._ids)
+        shortlist = min(max(self.candidates, k), n - 1)
+        if shortlist <= 0:
+            return []
+        approx = self._vectors[:n] @ self._vectors[row]
+        approx[row] = -np.inf
+        rows = np.argpartition(approx, n - shortlist)[n - shortlist :]
+
+        terms = self._terms[row]
+        scored = sorted(
+            ((self._cosine(terms, other), self._ids[other]) for other in rows.tolist()),
+            key=lambda match: match[0],
+            reverse=True,
+        )
+        return [match for match in scored[:k] if match[0] > 0]
+
+    # ---------------------------------------------
+    # Building / persistence
+    # ---------------------------------------------
+    def _install(self, vectors, terms, ids, idf, docs, as_of):
+        self._vectors = vectors
+        self._terms = terms
+        self._ids = ids
+        self._rows = {startup_id: row for row, startup_id in enumerate(ids)}
+        self._idf = idf
+        self._docs = docs
+        self._as_of = as_of
+        self.ready = True
+
+    async def rebuild(self):
+        """
+        Re-vectorize every startup with fresh idf weights and save it.
+        Only the row fetch runs on the event loop.
+        """
+        start = time.perf_counter()
+        self._rebuilding, self._replay = True, {}
+        try:
+            async with AsyncSessionLocal() as db:
+                as_of = await db.scalar(select(func.now()))
+                rows = await load_rows(db)
+            built = await asyncio.to_thread(_build_and_write, rows, self.dim, self.path, as_of)
+        finally:
+            self._rebuilding = False
+
+        replay, self._replay = self._replay, {}
+        self._install(*built, as_of)
+        self._dirty = False
+        for startup_id, counts in replay.items():
+            if counts is None:
+                self.remove(startup_id)
+            else:
+                self.upsert(startup_id, counts)
+
+        self.rebuilds += 1
+        self.last_rebuild_s = time.perf_counter() - start
+
+    async def save(self):
+        if not self.ready:
+            return
+        n = len(self._ids)
+        # Only shallow copies on the loop (upserts change rows in place);
+        # the arrays are assembled and written in a worker thread
+        parts = (
+            self._vectors[:n].copy(), self._terms[:], self._ids[:], self._idf,
+            self._docs, self.dim, self._as_of,
+        )
+        self._dirty = False
+        await asyncio.to_thread(_save_parts, self.path, parts)
+
+    def load_file(self) -> bool:
+        """
+        Install the saved index; False if there is none, it was built
+        with another dimension or it cannot be read.
+        """
+        if not os.path.exists(self.path):
+            return False
+        try:
+            return self._load_file()
+        except Exception:
+            # Truncated or corrupt file: the caller rebuilds (and overwrites it)
+            logger.exception("Ignoring unreadable similar startups index %s", self.path)
+            return False
+
+    def _load_file(self) -> bool:
+        with np.load(self.path, allow_pickle=False) as data:
+            dim, docs = (int(value) for value in data["meta"])
+            if dim != self.dim:
+                logger.info("Ignoring %s: built with dim %d, want %d", self.path, dim, self.dim)
+                return False
+            vectors = data["vectors"]
+            ids = [uuid.UUID(bytes=row.tobytes()) for row in data["ids"]]
+            offsets, keys, weights = data["offsets"], data["keys"], data["weights"]
+            if (
+                vectors.shape != (len(ids), dim)
+                or len(offsets) != len(ids) + 1
+                or len(keys) != len(weights)
+                or (len(offsets) and offsets[-1] != len(keys))
+            ):
+                raise ValueError("inconsistent array shapes")
+            terms = [
+                (keys[offsets[i] : offsets[i + 1]], weights[offsets[i] : offsets[i + 1]])
+                for i in range(len(ids))
+            ]
+            blob = data["vocabulary"].tobytes()
+            bounds = data["vocabulary_offsets"].tolist()
+            vocabulary = [blob[a:b].decode() for a, b in zip(bounds, bounds[1:])]
+            idf = dict(zip(vocabulary, data["idf"].tolist(), strict=True))
+            as_of = datetime.fromtimestamp(float(data["as_of"][0]), timezone.utc)
+            self._install(vectors, terms, ids, idf, docs, as_of)
+        self.file_loads += 1
+        return True
+
+    async def _catch_up(self):
+        """
+        Bring a loaded file up to date: drop deleted startups, vectorize
+        new ones and those with launches since the file was built.
+        """
+        async with AsyncSessionLocal() as db:
+            current = set(await db.scalars(select(Startup.id)))
+            stale = current - set(self._rows)
+            stale.update(
+                await db.scalars(
+                    select(Launch.startup_id).where(Launch.created_at > self._as_of).distinct()
+                )
+            )
+            stale = list(stale)
+            for i in range(0, len(stale), 1000):
+                rows = await load_rows(db, stale[i : i + 1000])
+                documents = await asyncio.to_thread(documents_from_rows, rows)
+                for startup_id, counts in documents.items():
+                    self.upsert(startup_id, counts)
+
+        for startup_id in set(self._rows) - current:
+            self.remove(startup_id)
+
+    async def warm(self):
+        """
+        Make the index ready: from the saved file when there is one,
+        otherwise with a full rebuild.
+        """
+        async with self._lock:
+            if self.ready:
+                return
+            start = time.perf_counter()
+            if await asyncio.to_thread(self.load_file):
+                await self._catch_up()
+            else:
+                await self.rebuild()
+            self.last_warm_s = time.perf_counter() - start
+
+    async def _run(self):
+        while True:
+            try:
+                if self.ready:
+                    await self.rebuild()
+                else:
+                    await self.warm()
+            except Exception:
+                self.errors += 1
+                logger.exception("Similar startups index refresh failed")
+            await asyncio.sleep(self.rebuild_interval)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        # Keep incremental writes for the next start
+        if self._dirty:
+            await self.save()
+
+    def metrics(self) -> dict:
+        return {
+            "ready": self.ready,
+            "startups": len(self._ids),
+            "dim": self.dim,
+            "matrix_mb": round(self._vectors.nbytes / 2**20, 1),
+            "candidates": self.candidates,
+            "terms": len(self._idf),
+            "rebuilds": self.rebuilds,
+            "file_loads": self.file_loads,
+            "errors": self.errors,
+            "last_rebuild_s": round(self.last_rebuild_s, 3),
+            "last_warm_s": round(self.last_warm_s, 3),
+        }
+
+
+def _write_snapshot(path: str, snapshot: dict):
+    # Write then rename, so readers never see a half-written file. Each
+    # writer (one per worker process) gets its own temp file.
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp", delete=False
+    ) as f:
+        tmp = f.name
+        try:
+            np.savez(f, **snapshot)
+        except BaseException:
+            f.close()
+            os.unlink(tmp)
+            raise
+    os.replace(tmp, path)
+
+
+similar_index = SimilarStartupIndex(
+    SIMILAR_DIM, SIMILAR_CANDIDATES, SIMILAR_INDEX_PATH, SIMILAR_REBUILD_SECONDS
+)
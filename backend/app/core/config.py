@@ -4,4 +4,117 @@ from dotenv import load_dotenv
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
-CLERK_SECRET_KEY = os.getenv("CLERK_SECRET_KEY")
\ No newline at end of file
+CLERK_SECRET_KEY = os.getenv("CLERK_SECRET_KEY")
+
+# Async driver URL for the API; defaults to DATABASE_URL on asyncpg
+def _asyncpg_url(url):
+    # postgresql://, postgresql+psycopg2://, ... -> postgresql+asyncpg://
+    return "postgresql+asyncpg://" + url.split("://", 1)[1] if url else None
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or _asyncpg_url(DATABASE_URL)
+
+# Optional read replica for public read paths; unset means "use primary"
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+ASYNC_DATABASE_REPLICA_URL = (
+    os.getenv("ASYNC_DATABASE_REPLICA_URL") or _asyncpg_url(DATABASE_REPLICA_URL)
+)
+# After a write, that user's reads stay on the primary for this long (the
+# response's X-Primary-Until header carries it across workers)
+REPLICA_STICKY_SECONDS = float(os.getenv("REPLICA_STICKY_SECONDS", "10"))
+
+# Connection pool (per engine, per uvicorn worker)
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+# Per-connection statement_timeout in ms (0 disables)
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))
+
+# Clerk JWKS / token verification caches
+JWKS_CACHE_TTL_SECONDS = int(os.getenv("JWKS_CACHE_TTL_SECONDS", "3600"))
+# Floor between refreshes triggered by unknown `kid`s
+JWKS_MIN_REFRESH_SECONDS = int(os.getenv("JWKS_MIN_REFRESH_SECONDS", "30"))
+VERIFIED_TOKEN_CACHE_SIZE = int(os.getenv("VERIFIED_TOKEN_CACHE_SIZE", "10000"))
+
+# Clerk sub -> (users.id, role, startup id) cache
+PRINCIPAL_CACHE_SIZE = int(os.getenv("PRINCIPAL_CACHE_SIZE", "10000"))
+PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "300"))
+
+# Credibility recompute after writes: "sync", "debounced" or "disabled"
+CREDIBILITY_RECOMPUTE_MODE = os.getenv("CREDIBILITY_RECOMPUTE_MODE", "debounced")
+CREDIBILITY_DEBOUNCE_SECONDS = float(os.getenv("CREDIBILITY_DEBOUNCE_SECONDS", "2"))
+
+# Credibility response cache (invalidated on writes; TTL bounds cross-worker staleness)
+CREDIBILITY_CACHE_SIZE = int(os.getenv("CREDIBILITY_CACHE_SIZE", "10000"))
+CREDIBILITY_CACHE_TTL_SECONDS = float(os.getenv("CREDIBILITY_CACHE_TTL_SECONDS", "60"))
+
+# Credibility score history: raw snapshots are kept this many days, then
+# folded into daily rows; daily rows older than the second window become weekly
+SCORE_HISTORY_RAW_DAYS = int(os.getenv("SCORE_HISTORY_RAW_DAYS", "7"))
+SCORE_HISTORY_DAILY_DAYS = int(os.getenv("SCORE_HISTORY_DAILY_DAYS", "90"))
+# Raw snapshots are bucketed ("minute" or "hour"): changes within a bucket
+# update one row, so a startup has at most one raw row per bucket
+SCORE_HISTORY_RAW_BUCKET = os.getenv("SCORE_HISTORY_RAW_BUCKET", "minute")
+
+# Launch upvote counters: "sync" updates launches.upvotes in the vote's
+# transaction; "buffered" inserts the vote synchronously and flushes
+# counter increments per launch every UPVOTE_FLUSH_MS
+UPVOTE_COUNTER_MODE = os.getenv("UPVOTE_COUNTER_MODE", "buffered")
+UPVOTE_FLUSH_MS = int(os.getenv("UPVOTE_FLUSH_MS", "250"))
+
+# Keyset pagination on list endpoints (?limit=&cursor=)
+PAGE_SIZE_DEFAULT = int(os.getenv("PAGE_SIZE_DEFAULT", "50"))
+PAGE_SIZE_MAX = int(os.getenv("PAGE_SIZE_MAX", "200"))
+
+# Trending launches: a vote's weight halves every TRENDING_HALF_LIFE_HOURS
+# (changing it requires scripts/rebuild_hot_scores.py)
+TRENDING_HALF_LIFE_HOURS = float(os.getenv("TRENDING_HALF_LIFE_HOURS", "24"))
+TRENDING_MAX_LIMIT = int(os.getenv("TRENDING_MAX_LIMIT", "100"))
+TRENDING_CACHE_TTL_SECONDS = float(os.getenv("TRENDING_CACHE_TTL_SECONDS", "5"))
+
+# In-process launch leaderboard (serves GET /launches/ without the DB);
+# resynced periodically to pick up votes taken by other workers
+LEADERBOARD_ENABLED = os.getenv("LEADERBOARD_ENABLED", "true").lower() == "true"
+LEADERBOARD_RESYNC_SECONDS = float(os.getenv("LEADERBOARD_RESYNC_SECONDS", "30"))
+
+# Per-user "already upvoted" cache (confirmed votes only, LRU by user)
+UPVOTE_CACHE_USERS = int(os.getenv("UPVOTE_CACHE_USERS", "10000"))
+UPVOTE_CACHE_TTL_SECONDS = float(os.getenv("UPVOTE_CACHE_TTL_SECONDS", "3600"))
+
+# Startup search (?q=): relevance order ranks every match up to this many;
+# beyond it only the most credible ones, flagged with X-Results-Truncated
+# (sort=credibility|recent page through all)
+SEARCH_RANK_CANDIDATES = int(os.getenv("SEARCH_RANK_CANDIDATES", "1000"))
+
+# Discover facet counts, cached per filter combination
+FACETS_CACHE_SIZE = int(os.getenv("FACETS_CACHE_SIZE", "1024"))
+FACETS_CACHE_TTL_SECONDS = float(os.getenv("FACETS_CACHE_TTL_SECONDS", "60"))
+
+# Enterprise -> startup matching: each enterprise keeps its best
+# MATCH_TOP_K startups; profile and score changes are coalesced for
+# MATCH_REFRESH_DEBOUNCE_SECONDS, and the in-memory index is reloaded
+# every MATCH_INDEX_RESYNC_SECONDS to pick up other workers' writes
+MATCH_TOP_K = int(os.getenv("MATCH_TOP_K", "50"))
+MATCH_REFRESH_DEBOUNCE_SECONDS = float(os.getenv("MATCH_REFRESH_DEBOUNCE_SECONDS", "2"))
+MATCH_INDEX_RESYNC_SECONDS = float(os.getenv("MATCH_INDEX_RESYNC_SECONDS", "300"))
+
+# "Similar startups" (app/ai/similar.py): hashed TF-IDF vectors of
+# description, industry and launch taglines, SIMILAR_DIM float32 each,
+# shortlist SIMILAR_CANDIDATES startups that are then ranked by exact
+# TF-IDF cosine. Rebuilt from the database every SIMILAR_REBUILD_SECONDS
+# (refreshing IDF weights and other workers' writes) and saved to
+# SIMILAR_INDEX_PATH so a restart loads the file instead of re-vectorizing
+SIMILAR_DIM = int(os.getenv("SIMILAR_DIM", "512"))
+SIMILAR_CANDIDATES = int(os.getenv("SIMILAR_CANDIDATES", "200"))
+SIMILAR_TOP_K_MAX = int(os.getenv("SIMILAR_TOP_K_MAX", "50"))
+SIMILAR_REBUILD_SECONDS = float(os.getenv("SIMILAR_REBUILD_SECONDS", "3600"))
+SIMILAR_INDEX_PATH = os.getenv("SIMILAR_INDEX_PATH", "var/similar_startups.npz")
+
+# Discover result pages, kept as serialized JSON per normalized filter
+# tuple; cleared on startup creation and credibility score changes (the
+# TTL bounds staleness from writes made by other worker processes)
+DISCOVER_CACHE_SIZE = int(os.getenv("DISCOVER_CACHE_SIZE", "256"))
+DISCOVER_CACHE_TTL_SECONDS = float(os.getenv("DISCOVER_CACHE_TTL_SECONDS", "30"))
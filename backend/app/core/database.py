@@ -1,8 +1,88 @@
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
-from app.core.config import DATABASE_URL
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+from app.core.config import (
+    DATABASE_URL,
+    ASYNC_DATABASE_URL,
+    ASYNC_DATABASE_REPLICA_URL,
+    DB_ECHO,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING,
+    DB_STATEMENT_TIMEOUT_MS,
+)
+from app.core.pool_metrics import instrumented_pool
 
-engine = create_engine(DATABASE_URL, echo=True)
+POOL_OPTIONS = dict(
+    echo=DB_ECHO,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=DB_POOL_PRE_PING,
+)
+
+
+def sync_connect_args():
+    if not DB_STATEMENT_TIMEOUT_MS:
+        return {}
+    return {"options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"}
+
+
+def async_connect_args():
+    if not DB_STATEMENT_TIMEOUT_MS:
+        return {}
+    return {"server_settings": {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}}
+
+
+# Sync engine: seed scripts, alembic and offline jobs
+engine = create_engine(
+    DATABASE_URL,
+    poolclass=instrumented_pool("primary_sync", QueuePool),
+    connect_args=sync_connect_args(),
+    **POOL_OPTIONS,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+class PrimarySession(Session):
+    """
+    Session class for the primary; commits mark read-your-writes.
+    """
+
+
+# Async engine: API request handlers
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    poolclass=instrumented_pool("primary", AsyncAdaptedQueuePool),
+    connect_args=async_connect_args(),
+    **POOL_OPTIONS,
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    sync_session_class=PrimarySession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+# Replica engine: read-only public endpoints (falls back to primary)
+if ASYNC_DATABASE_REPLICA_URL:
+    replica_engine = create_async_engine(
+        ASYNC_DATABASE_REPLICA_URL,
+        poolclass=instrumented_pool("replica", AsyncAdaptedQueuePool),
+        connect_args=async_connect_args(),
+        **POOL_OPTIONS,
+    )
+    ReplicaSessionLocal = async_sessionmaker(
+        bind=replica_engine,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+else:
+    replica_engine = async_engine
+    ReplicaSessionLocal = AsyncSessionLocal
+
 Base = declarative_base()
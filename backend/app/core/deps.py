@@ -1,4 +1,10 @@
-from app.core.database import SessionLocal
+from fastapi import Depends, HTTPException, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import SessionLocal, AsyncSessionLocal, ReplicaSessionLocal
+from app.core.read_routing import STICKY_HEADER, must_read_primary
+from app.core.security import get_current_user, require_role, unverified_subject
+from app.users.service import resolve_principal
 
 def get_db():
     db = SessionLocal()
@@ -6,3 +12,51 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db(request: Request):
+    async with AsyncSessionLocal() as db:
+        db.info["authorization"] = request.headers.get("authorization")
+        yield db
+
+
+async def get_read_db(request: Request):
+    """
+    Read-only session: replica, unless this caller wrote recently.
+    """
+    authorization = request.headers.get("authorization")
+    if must_read_primary(
+        unverified_subject(authorization), request.headers.get(STICKY_HEADER)
+    ):
+        factory = AsyncSessionLocal
+    else:
+        factory = ReplicaSessionLocal
+
+    async with factory() as db:
+        yield db
+
+
+async def get_principal(
+    user=Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Current user with `user_id`, `role` and `startup_id` resolved.
+    """
+    if user is None:
+        return None  # OPTIONS request
+
+    principal = await resolve_principal(db, user)
+    if principal is None:
+        raise HTTPException(status_code=409, detail="Email already registered")
+    return principal
+
+
+def require_principal(required_role: str):
+    async def principal_checker(
+        user=Depends(require_role(required_role)),
+        db: AsyncSession = Depends(get_async_db),
+    ):
+        return await get_principal(user=user, db=db)
+
+    return principal_checker
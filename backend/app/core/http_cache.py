@@ -0,0 +1,49 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request
+from fastapi.responses import Response
+
+
+class CachedBody:
+    """
+    Pre-serialized JSON body plus its HTTP validators.
+    """
+
+    __slots__ = ("body", "etag", "last_modified")
+
+    def __init__(self, body: bytes, etag_source: bytes | None = None):
+        self.body = body
+        digest = hashlib.sha1(etag_source if etag_source is not None else body)
+        self.etag = f'"{digest.hexdigest()}"'
+        self.last_modified = datetime.now(timezone.utc).replace(microsecond=0)
+
+
+def _not_modified(request: Request, entry: CachedBody) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip() for tag in if_none_match.split(",")}
+        return entry.etag in tags or "*" in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return entry.last_modified <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def cached_json_response(request: Request, entry: CachedBody) -> Response:
+    """
+    200 with the cached body, or 304 when the client's copy is current.
+    """
+    headers = {
+        "ETag": entry.etag,
+        "Last-Modified": format_datetime(entry.last_modified, usegmt=True),
+        "Cache-Control": "no-cache",
+    }
+    if _not_modified(request, entry):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
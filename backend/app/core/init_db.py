@@ -1,10 +1,13 @@
 from app.core.database import Base, engine
 from app.users.models import User
 from app.startups.models import Startup
+from app.startups.stats_models import StartupStats
+from app.credibility.models import CredibilityScoreSnapshot
 from app.launches.models import Launch
 from app.launches.vote_models import LaunchUpvote
 from app.reviews.models import Review
 from app.feedback.models import EnterpriseFeedback
+from app.matches.models import StartupMatch
 
 
 def init_db():
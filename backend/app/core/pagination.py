@@ -0,0 +1,112 @@
+# app/core/pagination.py
+
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import PAGE_SIZE_DEFAULT, PAGE_SIZE_MAX
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TRUNCATED_HEADER = "X-Results-Truncated"
+
+
+# -------------------------------------------------
+# OPAQUE CURSORS
+# -------------------------------------------------
+
+def encode_cursor(values) -> str:
+    """
+    Sort-key values of the last row -> url-safe token.
+    """
+    plain = [v.isoformat() if isinstance(v, datetime) else str(v) for v in values]
+    raw = json.dumps(plain, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, columns) -> list:
+    """
+    Token -> typed sort-key values, one per column.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        plain = json.loads(base64.urlsafe_b64decode(padded))
+        if len(plain) != len(columns):
+            raise ValueError(cursor)
+
+        values = []
+        for value, col in zip(plain, columns):
+            kind = col.type.python_type
+            if kind is datetime:
+                values.append(datetime.fromisoformat(value))
+            elif kind is UUID:
+                values.append(UUID(value))
+            else:
+                values.append(kind(value))
+        return values
+    except (ValueError, TypeError, json.JSONDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+# -------------------------------------------------
+# KEYSET PAGES
+# -------------------------------------------------
+
+@dataclass
+class PageParams:
+    limit: int
+    cursor: str | None
+
+
+def page_params(
+    limit: int = Query(PAGE_SIZE_DEFAULT, ge=1, le=PAGE_SIZE_MAX),
+    cursor: str | None = None,
+) -> PageParams:
+    return PageParams(limit=limit, cursor=cursor)
+
+
+async def keyset_page(db: AsyncSession, query, keys, page: PageParams):
+    """
+    One page of `query`, ordered by `keys` descending.
+
+    `keys` are non-null columns ending in a unique one (the id
+    tiebreaker). The cursor becomes a row comparison
+    `(k1, ..., id) < (v1, ..., v_id)`, which an index on the same
+    columns answers with a range scan, so page N costs the same as
+    page one. Returns (rows, next_cursor or None).
+    """
+    if page.cursor:
+        after = decode_cursor(page.cursor, keys)
+        query = query.where(tuple_(*keys) < tuple_(*after))
+
+    query = query.order_by(*(k.desc() for k in keys)).limit(page.limit + 1)
+    rows = (await db.scalars(query)).all()
+
+    if len(rows) <= page.limit:
+        return rows, None
+
+    rows = rows[: page.limit]
+    last = rows[-1]
+    return rows, encode_cursor([getattr(last, k.key) for k in keys])
+
+
+def set_next_cursor(response: Response, next_cursor: str | None):
+    """
+    List bodies stay plain arrays; the next page's cursor travels in a
+    header (absent on the last page).
+    """
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+
+def set_truncated(response: Response, truncated: bool):
+    """
+    Flag a list that stops short of every match (absent otherwise).
+    """
+    if truncated:
+        response.headers[TRUNCATED_HEADER] = "true"
@@ -0,0 +1,96 @@
+import os
+import threading
+import time
+
+from sqlalchemy import exc
+
+
+class PoolStats:
+    """
+    Per-process counters for one connection pool.
+
+    Each uvicorn worker has its own pools, so every snapshot is tagged
+    with the worker pid.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pool = None
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.overflow_checkouts = 0
+        self.overflow_peak = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record_checkout(self, waited: float, overflow: int):
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+            if overflow > 0:
+                self.overflow_checkouts += 1
+                self.overflow_peak = max(self.overflow_peak, overflow)
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        pool = self.pool
+        with self._lock:
+            return {
+                "pid": os.getpid(),
+                "size": pool.size() if pool else None,
+                "checked_out": pool.checkedout() if pool else 0,
+                "checked_in": pool.checkedin() if pool else 0,
+                "overflow": max(pool.overflow(), 0) if pool else 0,
+                "overflow_peak": self.overflow_peak,
+                "overflow_checkouts": self.overflow_checkouts,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_avg_ms": (
+                    round(self.wait_total / self.checkouts * 1000, 3)
+                    if self.checkouts else 0.0
+                ),
+                "wait_max_ms": round(self.wait_max * 1000, 3),
+            }
+
+
+_registry: dict[str, PoolStats] = {}
+
+
+class _InstrumentedPoolMixin:
+    stats: PoolStats
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Pools are rebuilt on engine.dispose(); always report the live one
+        self.stats.pool = self
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.record_timeout()
+            raise
+        self.stats.record_checkout(time.perf_counter() - start, self.overflow())
+        return conn
+
+
+def instrumented_pool(name: str, base):
+    """
+    Build a pool class that records checkout wait time and overflow use.
+    """
+    stats = _registry.setdefault(name, PoolStats(name))
+    return type(
+        f"Instrumented{base.__name__}",
+        (_InstrumentedPoolMixin, base),
+        {"stats": stats},
+    )
+
+
+def pool_metrics() -> dict:
+    return {name: stats.snapshot() for name, stats in _registry.items()}
@@ -0,0 +1,77 @@
+import threading
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import event
+
+from app.core.config import REPLICA_STICKY_SECONDS
+from app.core.database import PrimarySession
+from app.core.security import unverified_subject
+
+# Read-your-writes after a commit, two ways:
+#
+# - header: the response carries STICKY_HEADER (unix time until which
+#   reads should hit the primary) and the client sends it back, so any
+#   worker or instance honours it;
+# - in-process: this worker also remembers the subject, which covers
+#   clients that do not echo the header, but only within this process.
+STICKY_HEADER = "X-Primary-Until"
+
+# subject -> monotonic deadline until which reads go to the primary
+_recent_writers: dict[str, float] = {}
+_lock = threading.Lock()
+_PRUNE_AT = 10_000
+
+# Per-request holder for the sticky deadline, set by the middleware
+_request_sticky: ContextVar[dict | None] = ContextVar("request_sticky", default=None)
+
+
+def mark_write(subject: str):
+    now = time.monotonic()
+    with _lock:
+        _recent_writers[subject] = now + REPLICA_STICKY_SECONDS
+        if len(_recent_writers) > _PRUNE_AT:
+            for key, deadline in list(_recent_writers.items()):
+                if deadline < now:
+                    del _recent_writers[key]
+
+
+def must_read_primary(subject: str | None, sticky_until: str | None = None) -> bool:
+    if sticky_until:
+        try:
+            # Forging it only moves the caller's own reads to the primary
+            if float(sticky_until) > time.time():
+                return True
+        except ValueError:
+            pass
+    if not subject:
+        return False
+    with _lock:
+        deadline = _recent_writers.get(subject)
+    return deadline is not None and deadline > time.monotonic()
+
+
+@event.listens_for(PrimarySession, "after_commit")
+def _remember_writer(session):
+    # Runs before the response is sent, so the very next read is covered
+    subject = unverified_subject(session.info.get("authorization"))
+    if subject:
+        mark_write(subject)
+        sticky = _request_sticky.get()
+        if sticky is not None:
+            sticky["until"] = time.time() + REPLICA_STICKY_SECONDS
+
+
+async def sticky_reads_middleware(request, call_next):
+    """
+    Send STICKY_HEADER on responses to requests that committed a write.
+    """
+    sticky = {}
+    token = _request_sticky.set(sticky)
+    try:
+        response = await call_next(request)
+    finally:
+        _request_sticky.reset(token)
+    if "until" in sticky:
+        response.headers[STICKY_HEADER] = f"{sticky['until']:.3f}"
+    return response
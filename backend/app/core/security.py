@@ -1,8 +1,19 @@
 from fastapi import Header, HTTPException, Depends, Request
 from jose import jwt
-import requests
+from collections import OrderedDict
+import asyncio
+import hashlib
+import threading
+import time
+import httpx
 import os
 
+from app.core.config import (
+    JWKS_CACHE_TTL_SECONDS,
+    JWKS_MIN_REFRESH_SECONDS,
+    VERIFIED_TOKEN_CACHE_SIZE,
+)
+
 # ─────────────────────────────
 # Clerk config
 # ─────────────────────────────
@@ -12,22 +23,135 @@ if not CLERK_ISSUER:
 
 CLERK_JWKS_URL = f"{CLERK_ISSUER}/.well-known/jwks.json"
 
-_jwks_cache = None
 
+# ─────────────────────────────
+# JWKS key manager
+# ─────────────────────────────
+class JWKSKeyManager:
+    """
+    Clerk signing keys indexed by `kid`.
+
+    Refreshes when the TTL lapses or an unknown `kid` shows up (at most
+    once per `min_refresh` seconds). Concurrent refreshes share one fetch.
+    """
+
+    def __init__(self, url: str, ttl: int, min_refresh: int):
+        self.url = url
+        self.ttl = ttl
+        self.min_refresh = min_refresh
+        self._keys: dict[str, dict] = {}
+        self._fetched_at = 0.0
+        self._inflight: asyncio.Future | None = None
+
+    async def get_key(self, kid: str) -> dict | None:
+        now = time.monotonic()
+        if not self._keys or now - self._fetched_at > self.ttl:
+            await self.refresh()
+        elif kid not in self._keys and now - self._fetched_at > self.min_refresh:
+            # Key rotation: pick up the new key without a restart
+            await self.refresh()
+        return self._keys.get(kid)
+
+    async def refresh(self):
+        if self._inflight is None:
+            self._inflight = asyncio.ensure_future(self._fetch())
+        inflight = self._inflight
+        try:
+            # shield: one cancelled request must not cancel everyone's fetch
+            await asyncio.shield(inflight)
+        except Exception:
+            # Keep serving the last good key set if the refresh failed
+            if not self._keys:
+                raise
+        finally:
+            if inflight.done() and self._inflight is inflight:
+                self._inflight = None
+
+    async def _fetch(self):
+        async with httpx.AsyncClient(timeout=5) as client:
+            response = await client.get(self.url)
+            response.raise_for_status()
+        self._keys = {k["kid"]: k for k in response.json().get("keys", [])}
+        self._fetched_at = time.monotonic()
+
+
+jwks_keys = JWKSKeyManager(
+    CLERK_JWKS_URL,
+    ttl=JWKS_CACHE_TTL_SECONDS,
+    min_refresh=JWKS_MIN_REFRESH_SECONDS,
+)
 
-def get_jwks():
-    global _jwks_cache
-    if _jwks_cache is None:
-        response = requests.get(CLERK_JWKS_URL, timeout=5)
-        response.raise_for_status()
-        _jwks_cache = response.json()
-    return _jwks_cache
+
+# ─────────────────────────────
+# Verified token cache
+# ─────────────────────────────
+class VerifiedTokenCache:
+    """
+    Bounded LRU of already-verified JWT claims, keyed by token hash.
+
+    Entries are dropped once the token's `exp` has passed.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> dict | None:
+        key = self._key(token)
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                return None
+            if payload["exp"] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def put(self, token: str, payload: dict):
+        if not isinstance(payload.get("exp"), (int, float)):
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+verified_tokens = VerifiedTokenCache(VERIFIED_TOKEN_CACHE_SIZE)
+
+
+async def verify_token(token: str) -> dict:
+    payload = verified_tokens.get(token)
+    if payload is not None:
+        return payload
+
+    kid = jwt.get_unverified_header(token).get("kid")
+    key = await jwks_keys.get_key(kid)
+    if key is None:
+        raise ValueError("Unknown signing key")
+
+    payload = jwt.decode(
+        token,
+        key,
+        algorithms=["RS256"],
+        issuer=CLERK_ISSUER,
+        options={"verify_aud": False},
+    )
+    verified_tokens.put(token, payload)
+    return payload
 
 
 # ─────────────────────────────
 # Auth: get current user
 # ─────────────────────────────
-def get_current_user(
+async def get_current_user(
     request: Request,
     authorization: str = Header(None),
 ):
@@ -44,13 +168,7 @@ def get_current_user(
     token = authorization.replace("Bearer ", "")
 
     try:
-        payload = jwt.decode(
-            token,
-            get_jwks(),
-            algorithms=["RS256"],
-            issuer=CLERK_ISSUER,
-            options={"verify_aud": False},
-        )
+        payload = await verify_token(token)
     except Exception:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
 
@@ -69,11 +187,25 @@ def get_current_user(
     }
 
 
+def unverified_subject(authorization: str | None) -> str | None:
+    """
+    Read `sub` from a bearer token WITHOUT verifying it.
+
+    Only for routing decisions (e.g. replica stickiness), never for auth.
+    """
+    if not authorization or not authorization.startswith("Bearer "):
+        return None
+    try:
+        return jwt.get_unverified_claims(authorization[7:]).get("sub")
+    except Exception:
+        return None
+
+
 # ─────────────────────────────
 # Auth: role guard
 # ─────────────────────────────
 def require_role(required_role: str):
-    def role_checker(user=Depends(get_current_user)):
+    async def role_checker(user=Depends(get_current_user)):
         if user is None:
             return None  # OPTIONS request
 
@@ -0,0 +1,82 @@
+# app/credibility/cache.py
+
+from sqlalchemy import event
+
+from app.core.cache import TTLCache
+from app.core.config import CREDIBILITY_CACHE_SIZE, CREDIBILITY_CACHE_TTL_SECONDS
+from app.core.database import PrimarySession
+from app.core.http_cache import CachedBody
+
+# Response kinds cached per startup
+SCORE = "score"          # CredibilityScoreResponse
+BREAKDOWN = "breakdown"  # CredibilityOut
+
+# (kind, startup_id) -> CachedBody
+credibility_cache = TTLCache(CREDIBILITY_CACHE_SIZE, CREDIBILITY_CACHE_TTL_SECONDS)
+
+# Bumped by every invalidation; a body built across one is not stored
+_generation = 0
+
+
+def get_cached(kind: str, startup_id):
+    return credibility_cache.get((kind, str(startup_id)))
+
+
+def current_generation() -> int:
+    return _generation
+
+
+def store(kind: str, startup_id, model, generation: int) -> CachedBody:
+    """
+    Body for `model`, cached unless an invalidation happened since
+    `generation` (current_generation() taken before the build's query).
+    """
+    entry = CachedBody(
+        model.model_dump_json().encode(),
+        # last_updated is the compute time, not content: keep it out of the ETag
+        etag_source=model.model_dump_json(exclude={"last_updated"}).encode(),
+    )
+    if generation == _generation:
+        credibility_cache.set((kind, str(startup_id)), entry)
+    return entry
+
+
+async def get_or_build(kind: str, startup_id, build):
+    """
+    Cached body for `kind`/startup, building it with `build()` on a miss.
+
+    `build` returns a pydantic model, or None when the startup is unknown.
+    """
+    entry = get_cached(kind, startup_id)
+    if entry is None:
+        generation = _generation
+        model = await build()
+        if model is None:
+            return None
+        entry = store(kind, startup_id, model, generation)
+    return entry
+
+
+def invalidate_credibility(startup_id):
+    global _generation
+    _generation += 1
+    for kind in (SCORE, BREAKDOWN):
+        credibility_cache.invalidate((kind, str(startup_id)))
+
+
+def mark_credibility_dirty(db, startup_id):
+    """
+    Invalidate the cached responses for a startup once `db` commits.
+    """
+    db.info.setdefault("credibility_dirty", set()).add(startup_id)
+
+
+@event.listens_for(PrimarySession, "after_commit")
+def _invalidate_on_commit(session):
+    for startup_id in session.info.pop("credibility_dirty", ()):
+        invalidate_credibility(startup_id)
+
+
+@event.listens_for(PrimarySession, "after_soft_rollback")
+def _forget_on_rollback(session, previous_transaction):
+    session.info.pop("credibility_dirty", None)
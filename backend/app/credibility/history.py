@@ -0,0 +1,214 @@
+# app/credibility/history.py
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import (
+    Integer, column, delete, func, literal, literal_column, select, update, values,
+)
+from sqlalchemy.dialects.postgresql import UUID, aggregate_order_by, array_agg, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import (
+    SCORE_HISTORY_DAILY_DAYS,
+    SCORE_HISTORY_RAW_BUCKET,
+    SCORE_HISTORY_RAW_DAYS,
+)
+from app.credibility.models import CredibilityScoreSnapshot as Snapshot
+from app.startups.models import Startup
+
+RESOLUTIONS = ("raw", "day", "week")
+RAW_BUCKETS = ("minute", "hour")
+
+if SCORE_HISTORY_RAW_BUCKET not in RAW_BUCKETS:
+    raise ValueError(f"SCORE_HISTORY_RAW_BUCKET must be one of {RAW_BUCKETS}")
+
+
+def truncate(unit: str, ts):
+    """
+    date_trunc with the unit inlined, so SELECT and GROUP BY render the
+    same expression (a bound unit would be two different parameters).
+    """
+    if unit not in RAW_BUCKETS + RESOLUTIONS[1:]:
+        raise ValueError(f"Unknown resolution: {unit}")
+    return func.date_trunc(literal_column(f"'{unit}'"), ts)
+
+
+# -------------------------------------------------
+# WRITE PATH (score + snapshot in one statement)
+# -------------------------------------------------
+
+def persist_scores_stmt(scores):
+    """
+    UPDATE startups from (startup_id, score) pairs and snapshot every
+    score that actually changed.
+
+    WITH changed AS (UPDATE ... RETURNING) INSERT INTO history SELECT ...
+    RETURNING startup_id: one row per startup whose score changed.
+
+    Raw points are upserted into SCORE_HISTORY_RAW_BUCKET buckets keyed
+    by (startup_id, bucket, "raw"): a startup whose score flaps keeps
+    one row per bucket (closing, min and max score, change count), not
+    one per change.
+    """
+    new_scores = values(
+        column("id", UUID(as_uuid=True)),
+        column("score", Integer),
+        name="new_scores",
+    ).data(scores)
+
+    changed = (
+        update(Startup)
+        .where(Startup.id == new_scores.c.id)
+        .where(Startup.credibility_score.is_distinct_from(new_scores.c.score))
+        .values(credibility_score=new_scores.c.score)
+        .returning(Startup.id, Startup.credibility_score)
+        .cte("changed")
+    )
+
+    stmt = insert(Snapshot).from_select(
+        ["startup_id", "ts", "resolution", "score", "min_score", "max_score", "samples"],
+        select(
+            changed.c.id,
+            truncate(SCORE_HISTORY_RAW_BUCKET, func.now()),
+            literal("raw"),
+            changed.c.credibility_score,
+            changed.c.credibility_score,
+            changed.c.credibility_score,
+            literal(1),
+        ),
+    )
+    # Later changes in the same bucket: keep the last score, widen the range
+    return stmt.on_conflict_do_update(
+        index_elements=[Snapshot.startup_id, Snapshot.ts, Snapshot.resolution],
+        set_={
+            "score": stmt.excluded.score,
+            "min_score": func.least(Snapshot.min_score, stmt.excluded.min_score),
+            "max_score": func.greatest(Snapshot.max_score, stmt.excluded.max_score),
+            "samples": Snapshot.samples + 1,
+        },
+    ).returning(Snapshot.startup_id)
+
+
+# -------------------------------------------------
+# DOWNSAMPLING (bounded storage)
+# -------------------------------------------------
+
+def downsample_stmt(source: str, target: str, older_than: timedelta):
+    """
+    Fold `source` rows older than the cutoff into one `target` row per
+    startup per bucket.
+
+    The cutoff is aligned to a bucket boundary so only complete buckets
+    are folded, and each source row is rewritten exactly once.
+    """
+    cutoff = truncate(target, func.now() - older_than)
+
+    folded = (
+        delete(Snapshot)
+        .where(Snapshot.resolution == source)
+        .where(Snapshot.ts < cutoff)
+        .returning(
+            Snapshot.startup_id,
+            Snapshot.ts,
+            Snapshot.score,
+            Snapshot.min_score,
+            Snapshot.max_score,
+            Snapshot.samples,
+        )
+        .cte("folded")
+    )
+    bucket = truncate(target, folded.c.ts)
+
+    stmt = insert(Snapshot).from_select(
+        ["startup_id", "ts", "resolution", "score", "min_score", "max_score", "samples"],
+        select(
+            folded.c.startup_id,
+            bucket,
+            literal(target),
+            # Closing score of the bucket
+            array_agg(aggregate_order_by(folded.c.score, folded.c.ts.desc()))[1],
+            func.min(folded.c.min_score),
+            func.max(folded.c.max_score),
+            func.sum(folded.c.samples),
+        ).group_by(folded.c.startup_id, bucket),
+    )
+    # A bucket can already exist if compaction is run with a shorter window
+    return stmt.on_conflict_do_update(
+        index_elements=[Snapshot.startup_id, Snapshot.ts, Snapshot.resolution],
+        set_={
+            "score": stmt.excluded.score,
+            "min_score": func.least(Snapshot.min_score, stmt.excluded.min_score),
+            "max_score": func.greatest(Snapshot.max_score, stmt.excluded.max_score),
+            "samples": Snapshot.samples + stmt.excluded.samples,
+        },
+    )
+
+
+def compact_score_history_sync(
+    db: Session,
+    raw_days: int = SCORE_HISTORY_RAW_DAYS,
+    daily_days: int = SCORE_HISTORY_DAILY_DAYS,
+) -> dict:
+    """
+    raw -> day after `raw_days`, day -> week after `daily_days`.
+
+    Per startup this leaves at most the recent raw changes, `daily_days`
+    daily rows and one row per week before that, however many score
+    changes happened.
+    """
+    daily = db.execute(downsample_stmt("raw", "day", timedelta(days=raw_days)))
+    weekly = db.execute(downsample_stmt("day", "week", timedelta(days=daily_days)))
+    db.commit()
+    return {"day_buckets": daily.rowcount, "week_buckets": weekly.rowcount}
+
+
+# -------------------------------------------------
+# TREND (range scan on (startup_id, ts))
+# -------------------------------------------------
+
+async def get_score_trend(
+    db: AsyncSession,
+    startup_id,
+    since: datetime,
+    until: datetime,
+    resolution: str,
+) -> list:
+    in_range = (
+        Snapshot.startup_id == startup_id,
+        Snapshot.ts >= since,
+        Snapshot.ts < until,
+    )
+
+    if resolution == "raw":
+        query = (
+            select(
+                Snapshot.ts,
+                Snapshot.score,
+                Snapshot.min_score,
+                Snapshot.max_score,
+                Snapshot.samples,
+            )
+            .where(*in_range)
+            .order_by(Snapshot.ts)
+        )
+    else:
+        # Older rows may already be coarser than requested; they keep
+        # their own bucket
+        bucket = truncate(resolution, Snapshot.ts).label("ts")
+        query = (
+            select(
+                bucket,
+                array_agg(aggregate_order_by(Snapshot.score, Snapshot.ts.desc()))[1]
+                .label("score"),
+                func.min(Snapshot.min_score).label("min_score"),
+                func.max(Snapshot.max_score).label("max_score"),
+                func.sum(Snapshot.samples).label("samples"),
+            )
+            .where(*in_range)
+            .group_by(bucket)
+            .order_by(bucket)
+        )
+
+    result = await db.execute(query)
+    return [dict(row._mapping) for row in result]
@@ -0,0 +1,35 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class CredibilityScoreSnapshot(Base):
+    """
+    Time series of credibility scores.
+
+    "raw" rows hold the score changes of one SCORE_HISTORY_RAW_BUCKET
+    (minute or hour) each; `scripts/compact_score_history.py`
+    folds old rows into "day" and then "week" buckets carrying the
+    closing, min and max score of the bucket.
+    """
+    __tablename__ = "credibility_score_history"
+
+    # (startup_id, ts) prefix serves per-startup range scans
+    startup_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("startups.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    ts = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        primary_key=True,
+    )
+    resolution = Column(String, primary_key=True, default="raw", server_default="raw")
+
+    score = Column(Integer, nullable=False)
+    min_score = Column(Integer, nullable=False)
+    max_score = Column(Integer, nullable=False)
+    samples = Column(Integer, nullable=False, default=1, server_default="1")
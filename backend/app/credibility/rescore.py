@@ -0,0 +1,46 @@
+# app/credibility/rescore.py
+
+from sqlalchemy.orm import Session
+
+from app.credibility.history import persist_scores_stmt
+from app.credibility.stats import credibility_stats_query, startup_stats_query
+from app.credibility.vectorized import final_scores_from_stats
+
+
+def compute_scores_sync(db: Session, startup_ids, from_source: bool = False) -> list:
+    """
+    (startup_id, final_score) for a chunk, from one set-wise stats query
+    scored column-wise with numpy.
+
+    Reads startup_stats by default; `from_source` aggregates the source
+    tables instead (use when startup_stats may be stale).
+    """
+    query = (
+        credibility_stats_query(startup_ids)
+        if from_source
+        else startup_stats_query(startup_ids)
+    )
+    rows = db.execute(query).all()
+    scores = final_scores_from_stats(rows)
+    return [
+        (stats.Startup.id, int(score))
+        for stats, score in zip(rows, scores)
+    ]
+
+
+def write_scores_sync(db: Session, scores) -> int:
+    """
+    Persist scores (and their history snapshots) in one statement.
+
+    Rows whose score did not change are skipped. Returns rows updated.
+    """
+    if not scores:
+        return 0
+
+    changed = db.execute(persist_scores_stmt(scores)).scalars().all()
+    db.commit()
+    return len(changed)
+
+
+def rescore_startups_sync(db: Session, startup_ids, from_source: bool = False) -> int:
+    return write_scores_sync(db, compute_scores_sync(db, startup_ids, from_source))
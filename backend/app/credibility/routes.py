@@ -1,50 +1,135 @@
 # app/credibility/routes.py
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from datetime import datetime, timedelta, timezone
+from typing import Literal
+from uuid import UUID
 
-from app.core.deps import get_db
-from app.core.security import get_current_user
-from app.credibility.schemas import CredibilityScoreResponse
-from app.credibility.service import get_credibility_score
-from app.startups.service import get_startup_by_user
-from app.users.service import get_or_create_user 
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deps import get_async_db, get_read_db, get_principal
+from app.core.http_cache import cached_json_response
+from app.credibility.cache import SCORE, current_generation, get_cached, get_or_build, store
+from app.credibility.history import get_score_trend
+from app.credibility.schemas import (
+    CredibilityBatchRequest,
+    CredibilityScoreResponse,
+    CredibilityTrendResponse,
+)
+from app.credibility.service import get_credibility_score, get_credibility_scores
+from app.startups.models import Startup
 
 router = APIRouter(prefix="/credibility-score", tags=["Credibility"])
 
 
+def score_builder(db: AsyncSession, startup_id):
+    async def build():
+        result = await get_credibility_score(db, startup_id)
+        return CredibilityScoreResponse(**result) if result else None
+
+    return build
+
+
+async def build_trend(db: AsyncSession, startup_id, since, until, resolution):
+    until = until or datetime.now(timezone.utc)
+    since = since or until - timedelta(days=90)
+    if since >= until:
+        raise HTTPException(status_code=400, detail="since must be before until")
+
+    return {
+        "startup_id": str(startup_id),
+        "resolution": resolution,
+        "since": since,
+        "until": until,
+        "points": await get_score_trend(db, startup_id, since, until, resolution),
+    }
+
+
 # -----------------------------------
 # Startup viewing their own score
 # -----------------------------------
 @router.get("/", response_model=CredibilityScoreResponse)
-def my_credibility_score(
-    db: Session = Depends(get_db),
-    user=Depends(get_current_user),
+async def my_credibility_score(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    principal=Depends(get_principal),
+):
+    if not principal["startup_id"]:
+        raise HTTPException(status_code=404, detail="Startup not found")
+
+    startup_id = principal["startup_id"]
+    entry = await get_or_build(SCORE, startup_id, score_builder(db, startup_id))
+    return cached_json_response(request, entry)
+
+
+# -----------------------------------
+# Startup viewing their own score over time
+# -----------------------------------
+@router.get("/trend", response_model=CredibilityTrendResponse)
+async def my_credibility_trend(
+    since: datetime | None = None,
+    until: datetime | None = None,
+    resolution: Literal["raw", "day", "week"] = "day",
+    db: AsyncSession = Depends(get_async_db),
+    principal=Depends(get_principal),
 ):
-    db_user = get_or_create_user(
-        db,
-        clerk_user_id=user["clerk_user_id"],
-        email=user["email"],
-        role=user["role"],
-    )
-    startup = get_startup_by_user(db, db_user.id)
-    if not startup:
+    if not principal["startup_id"]:
         raise HTTPException(status_code=404, detail="Startup not found")
 
-    result = get_credibility_score(db, startup.id)
-    return result
+    return await build_trend(db, principal["startup_id"], since, until, resolution)
+
+
+# -----------------------------------
+# Many startups at once (dashboard cards)
+# -----------------------------------
+@router.post("/batch", response_model=list[CredibilityScoreResponse])
+async def batch_credibility_scores(
+    payload: CredibilityBatchRequest,
+    # Misses fill the shared cache: read them on the primary, not a lagging replica
+    db: AsyncSession = Depends(get_async_db),
+):
+    startup_ids = list(dict.fromkeys(payload.startup_ids))
+    entries = {sid: get_cached(SCORE, sid) for sid in startup_ids}
+
+    # All misses in one grouped query, whatever the batch size
+    missing = [sid for sid, entry in entries.items() if entry is None]
+    generation = current_generation()
+    for result in await get_credibility_scores(db, missing):
+        model = CredibilityScoreResponse(**result)
+        entries[UUID(result["startup_id"])] = store(SCORE, model.startup_id, model, generation)
+
+    # Unknown startups are left out; order follows the request
+    bodies = [entries[sid].body for sid in startup_ids if entries[sid] is not None]
+    return Response(content=b"[" + b",".join(bodies) + b"]", media_type="application/json")
 
 
 # -----------------------------------
 # Enterprise viewing a startup
 # -----------------------------------
 @router.get("/{startup_id}", response_model=CredibilityScoreResponse)
-def startup_credibility_score(
-    startup_id: str,
-    db: Session = Depends(get_db),
+async def startup_credibility_score(
+    startup_id: UUID,
+    request: Request,
+    # Misses fill the shared cache: read them on the primary, not a lagging replica
+    db: AsyncSession = Depends(get_async_db),
+):
+    entry = await get_or_build(SCORE, startup_id, score_builder(db, startup_id))
+    if not entry:
+        raise HTTPException(status_code=404, detail="Startup not found")
+
+    return cached_json_response(request, entry)
+
+
+@router.get("/{startup_id}/trend", response_model=CredibilityTrendResponse)
+async def startup_credibility_trend(
+    startup_id: UUID,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    resolution: Literal["raw", "day", "week"] = "day",
+    db: AsyncSession = Depends(get_read_db),
 ):
-    result = get_credibility_score(db, startup_id)
-    if not result:
+    if await db.get(Startup, startup_id) is None:
         raise HTTPException(status_code=404, detail="Startup not found")
 
-    return result
+    return await build_trend(db, startup_id, since, until, resolution)
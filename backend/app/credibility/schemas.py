@@ -1,8 +1,11 @@
 # app/credibility/schemas.py
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional, Dict
 from datetime import datetime
+from uuid import UUID
+
+MAX_BATCH_SIZE = 500
 
 
 class ScoreDetails(BaseModel):
@@ -23,3 +26,23 @@ class CredibilityScoreResponse(BaseModel):
     overall_score: int
     breakdown: CredibilityBreakdown
     last_updated: datetime
+
+
+class CredibilityBatchRequest(BaseModel):
+    startup_ids: List[UUID] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class ScoreTrendPoint(BaseModel):
+    ts: datetime
+    score: int
+    min_score: int
+    max_score: int
+    samples: int
+
+
+class CredibilityTrendResponse(BaseModel):
+    startup_id: str
+    resolution: str
+    since: datetime
+    until: datetime
+    points: List[ScoreTrendPoint]
@@ -1,12 +1,10 @@
 # app/credibility/service.py
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 
 from app.startups.models import Startup
-from app.launches.models import Launch
-from app.reviews.models import Review
-from app.feedback.models import EnterpriseFeedback
+from app.credibility.stats import fetch_credibility_stats
 
 
 # -------------------------------------------------
@@ -52,40 +50,32 @@ def calculate_profile_score(startup: Startup):
 # MAIN SERVICE
 # -------------------------------------------------
 
-def get_credibility_score(db: Session, startup_id):
-    startup = db.query(Startup).filter(Startup.id == startup_id).first()
-    if not startup:
-        return None
+def score_from_stats(stats):
+    """
+    CredibilityScoreResponse payload from one `credibility_stats_query` row.
+    """
+    startup = stats.Startup
 
     # -------------------------------
     # Launch Engagement
     # -------------------------------
-    launches = db.query(Launch).filter(Launch.startup_id == startup.id).all()
-    total_upvotes = sum(l.upvotes for l in launches)
+    total_upvotes = stats.total_upvotes
     launch_score = calculate_launch_score(total_upvotes)
 
     # -------------------------------
     # Reviews
     # -------------------------------
-    reviews = db.query(Review).filter(Review.startup_id == startup.id).all()
-    verified_reviews = sum(1 for r in reviews if r.verified)
-    unverified_reviews = sum(1 for r in reviews if not r.verified)
+    verified_reviews = stats.verified_reviews
+    unverified_reviews = stats.unverified_reviews
     review_score = calculate_review_score(verified_reviews, unverified_reviews)
 
     # -------------------------------
     # Enterprise Feedback
     # -------------------------------
-    feedback = (
-        db.query(EnterpriseFeedback)
-        .filter(
-            EnterpriseFeedback.startup_id == startup.id,
-            EnterpriseFeedback.verified == True,
-        )
-        .all()
-    )
+    feedback_count = stats.feedback_count
 
-    if feedback:
-        avg_rating = sum(f.rating for f in feedback) / len(feedback)
+    if feedback_count:
+        avg_rating = stats.rating_sum / feedback_count
     else:
         avg_rating = None
 
@@ -115,14 +105,14 @@ def get_credibility_score(db: Session, startup_id):
                 "max": 25,
                 "details": {
                     "total_upvotes": total_upvotes,
-                    "launch_count": len(launches),
+                    "launch_count": stats.launch_count,
                 },
             },
             "peer_reviews": {
                 "score": review_score,
                 "max": 25,
                 "details": {
-                    "total_reviews": len(reviews),
+                    "total_reviews": verified_reviews + unverified_reviews,
                     "verified_reviews": verified_reviews,
                 },
             },
@@ -131,7 +121,7 @@ def get_credibility_score(db: Session, startup_id):
                 "max": 30,
                 "details": {
                     "avg_rating": avg_rating,
-                    "feedback_count": len(feedback),
+                    "feedback_count": feedback_count,
                 },
             },
             "profile_completeness": {
@@ -144,3 +134,20 @@ def get_credibility_score(db: Session, startup_id):
         },
         "last_updated": datetime.utcnow(),
     }
+
+
+async def get_credibility_scores(db: AsyncSession, startup_ids) -> list:
+    """
+    Score payloads for many startups from one grouped stats query.
+
+    Unknown ids are skipped.
+    """
+    return [score_from_stats(stats) for stats in await fetch_credibility_stats(db, startup_ids)]
+
+
+async def get_credibility_score(db: AsyncSession, startup_id):
+    rows = await fetch_credibility_stats(db, [startup_id])
+    if not rows:
+        return None
+
+    return score_from_stats(rows[0])
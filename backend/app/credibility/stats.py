@@ -0,0 +1,173 @@
+# app/credibility/stats.py
+
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.credibility.cache import mark_credibility_dirty
+from app.startups.models import Startup
+from app.startups.stats_models import StartupStats
+from app.launches.models import Launch
+from app.reviews.models import Review
+from app.feedback.models import EnterpriseFeedback
+
+STAT_COLUMNS = (
+    "total_upvotes",
+    "launch_count",
+    "verified_reviews",
+    "unverified_reviews",
+    "feedback_count",
+    "rating_sum",
+)
+
+
+# -------------------------------------------------
+# AGGREGATE QUERY (source of truth)
+# -------------------------------------------------
+
+def credibility_stats_query(startup_ids=None, with_startup=True):
+    """
+    One statement returning every credibility input per startup.
+
+    Each child table is aggregated on its own before the join, so the
+    result is one row per startup regardless of how many launches,
+    reviews or feedback rows it has. `startup_ids=None` means all startups.
+    """
+    def scoped(query, column):
+        if startup_ids is None:
+            return query
+        return query.where(column.in_(startup_ids))
+
+    launches = scoped(
+        select(
+            Launch.startup_id,
+            func.sum(Launch.upvotes).label("total_upvotes"),
+            func.count().label("launch_count"),
+        ),
+        Launch.startup_id,
+    ).group_by(Launch.startup_id).subquery()
+
+    reviews = scoped(
+        select(
+            Review.startup_id,
+            func.count().filter(Review.verified.is_(True)).label("verified_reviews"),
+            func.count().filter(Review.verified.isnot(True)).label("unverified_reviews"),
+        ),
+        Review.startup_id,
+    ).group_by(Review.startup_id).subquery()
+
+    feedback = scoped(
+        select(
+            EnterpriseFeedback.startup_id,
+            func.count().label("feedback_count"),
+            func.sum(EnterpriseFeedback.rating).label("rating_sum"),
+        ).where(EnterpriseFeedback.verified.is_(True)),
+        EnterpriseFeedback.startup_id,
+    ).group_by(EnterpriseFeedback.startup_id).subquery()
+
+    leading = Startup if with_startup else Startup.id.label("startup_id")
+
+    return scoped(
+        select(
+            leading,
+            func.coalesce(launches.c.total_upvotes, 0).label("total_upvotes"),
+            func.coalesce(launches.c.launch_count, 0).label("launch_count"),
+            func.coalesce(reviews.c.verified_reviews, 0).label("verified_reviews"),
+            func.coalesce(reviews.c.unverified_reviews, 0).label("unverified_reviews"),
+            func.coalesce(feedback.c.feedback_count, 0).label("feedback_count"),
+            func.coalesce(feedback.c.rating_sum, 0).label("rating_sum"),
+        )
+        .select_from(Startup)
+        .outerjoin(launches, launches.c.startup_id == Startup.id)
+        .outerjoin(reviews, reviews.c.startup_id == Startup.id)
+        .outerjoin(feedback, feedback.c.startup_id == Startup.id),
+        Startup.id,
+    )
+
+
+# -------------------------------------------------
+# DENORMALIZED STATS (startup_stats)
+# -------------------------------------------------
+
+def startup_stats_query(startup_ids):
+    """
+    Same row shape as `credibility_stats_query`, read from startup_stats.
+    """
+    return (
+        select(
+            Startup,
+            *(
+                func.coalesce(getattr(StartupStats, name), 0).label(name)
+                for name in STAT_COLUMNS
+            ),
+        )
+        .outerjoin(StartupStats, StartupStats.startup_id == Startup.id)
+        .where(Startup.id.in_(startup_ids))
+    )
+
+
+async def fetch_credibility_stats(db: AsyncSession, startup_ids) -> list:
+    if not startup_ids:
+        return []
+    result = await db.execute(startup_stats_query(list(startup_ids)))
+    return result.all()
+
+
+def _add_deltas(stmt, names):
+    return stmt.on_conflict_do_update(
+        index_elements=[StartupStats.startup_id],
+        set_={
+            **{
+                name: getattr(StartupStats, name) + getattr(stmt.excluded, name)
+                for name in names
+            },
+            "updated_at": func.now(),
+        },
+    )
+
+
+def bump_stats_from_select(source, *names):
+    """
+    Upsert adding the (startup_id, *names) rows of `source` to the counters.
+
+    For chaining into a larger statement as a CTE; unlike
+    `bump_startup_stats` it does not mark the credibility cache dirty.
+    """
+    return _add_deltas(
+        # Columns not listed fall back to their server defaults (0)
+        insert(StartupStats).from_select(
+            ["startup_id", *names], source, include_defaults=False
+        ),
+        names,
+    )
+
+
+async def bump_startup_stats(db: AsyncSession, startup_id, **deltas):
+    """
+    Atomically add `deltas` to a startup's counters (upsert).
+
+    Does not commit: callers run it inside the transaction of the write
+    that changed the counters.
+    """
+    stmt = insert(StartupStats).values(startup_id=startup_id, **deltas)
+    await db.execute(_add_deltas(stmt, deltas))
+    mark_credibility_dirty(db, startup_id)
+
+
+def rebuild_startup_stats_sync(db: Session, startup_ids=None) -> int:
+    """
+    Regenerate startup_stats from source tables (all startups by default).
+    """
+    source = credibility_stats_query(startup_ids, with_startup=False)
+    stmt = insert(StartupStats).from_select(["startup_id", *STAT_COLUMNS], source)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[StartupStats.startup_id],
+        set_={
+            **{name: getattr(stmt.excluded, name) for name in STAT_COLUMNS},
+            "updated_at": func.now(),
+        },
+    )
+    result = db.execute(stmt)
+    db.commit()
+    return result.rowcount
@@ -0,0 +1,146 @@
+# app/credibility/vectorized.py
+
+import math
+
+import numpy as np
+
+from app.startups.credibility import calculate_profile_completeness
+
+
+# -------------------------------------------------
+# STARTUP ENGINE (app/startups/credibility.py)
+# -------------------------------------------------
+
+def _launch_engagement_table() -> np.ndarray:
+    """
+    Launch engagement for every upvote total below saturation.
+
+    `int(log_1.3(u + 1) * 15)` reaches the 100 cap after a handful of
+    upvotes, so a lookup table built with the scalar math gives exact
+    parity without depending on numpy's log rounding.
+    """
+    table = [0]
+    upvotes = 1
+    while True:
+        score = min(int(math.log(upvotes + 1, 1.3) * 15), 100)
+        if score == 100:
+            return np.array(table, dtype=np.int64)
+        table.append(score)
+        upvotes += 1
+
+
+_LAUNCH_TABLE = _launch_engagement_table()
+
+
+def credibility_scores(
+    total_upvotes,
+    verified_reviews,
+    feedback_count,
+    rating_sum,
+    profile_completeness,
+) -> dict:
+    """
+    Vectorized `build_credibility_breakdown` over column arrays.
+
+    Returns every component and `final_score` as int64 arrays; results are
+    identical to the scalar function element by element.
+    """
+    upvotes = np.asarray(total_upvotes, dtype=np.int64)
+    verified = np.asarray(verified_reviews, dtype=np.int64)
+    count = np.asarray(feedback_count, dtype=np.int64)
+    ratings = np.asarray(rating_sum, dtype=np.float64)
+    profile = np.asarray(profile_completeness, dtype=np.int64)
+
+    # 1. Launch Engagement
+    saturated = upvotes >= len(_LAUNCH_TABLE)
+    launch = np.where(
+        saturated,
+        100,
+        _LAUNCH_TABLE[np.minimum(upvotes, len(_LAUNCH_TABLE) - 1)],
+    )
+
+    # 2. Verified Reviews
+    reviews = np.minimum(verified * 10, 100)
+
+    # 3. Enterprise Feedback
+    has_feedback = count > 0
+    safe_count = np.where(has_feedback, count, 1)
+    avg_rating = ratings / safe_count
+    base = np.trunc((avg_rating / 5) * 100)
+    confidence = np.minimum(safe_count / 3.0, 1.0)
+    enterprise = np.where(has_feedback, np.trunc(base * confidence), 0).astype(np.int64)
+
+    # Final Weighted Score (same evaluation order as the scalar formula)
+    final = np.trunc(
+        launch * 0.25 +
+        reviews * 0.25 +
+        enterprise * 0.30 +
+        profile * 0.20
+    ).astype(np.int64)
+
+    return {
+        "launch_engagement": launch,
+        "verified_reviews": reviews,
+        "enterprise_feedback": enterprise,
+        "profile_completeness": profile,
+        "final_score": final,
+    }
+
+
+# -------------------------------------------------
+# SCORE SERVICE (app/credibility/service.py)
+# -------------------------------------------------
+
+def overall_scores(
+    total_upvotes,
+    verified_reviews,
+    unverified_reviews,
+    avg_rating,
+    profile_score,
+) -> dict:
+    """
+    Vectorized `calculate_*_score` helpers and their sum.
+
+    `avg_rating` uses NaN (or 0) where the scalar code has None.
+    """
+    upvotes = np.asarray(total_upvotes, dtype=np.int64)
+    verified = np.asarray(verified_reviews, dtype=np.int64)
+    unverified = np.asarray(unverified_reviews, dtype=np.int64)
+    rating = np.nan_to_num(np.asarray(avg_rating, dtype=np.float64), nan=0.0)
+    profile = np.asarray(profile_score, dtype=np.int64)
+
+    launch = np.select(
+        [upvotes >= 1500, upvotes >= 1000, upvotes >= 500, upvotes >= 200, upvotes > 0],
+        [25, 22, 18, 12, 6],
+        default=0,
+    )
+    reviews = np.minimum(verified * 6 + unverified * 2, 25)
+    enterprise = np.trunc((rating / 5) * 30).astype(np.int64)
+
+    return {
+        "launch_engagement": launch,
+        "peer_reviews": reviews,
+        "enterprise_feedback": enterprise,
+        "profile_completeness": profile,
+        "overall_score": launch + reviews + enterprise + profile,
+    }
+
+
+def final_scores_from_stats(rows) -> np.ndarray:
+    """
+    `final_score` for a list of `credibility_stats_query` rows.
+    """
+    columns = np.array(
+        [
+            (
+                row.total_upvotes,
+                row.verified_reviews,
+                row.feedback_count,
+                row.rating_sum,
+                calculate_profile_completeness(row.Startup),
+            )
+            for row in rows
+        ],
+        dtype=np.int64,
+    ).reshape(-1, 5)
+    return credibility_scores(*columns.T)["final_score"]
@@ -0,0 +1,146 @@
+# app/credibility/worker.py
+
+import asyncio
+import logging
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import CREDIBILITY_RECOMPUTE_MODE, CREDIBILITY_DEBOUNCE_SECONDS
+from app.core.database import AsyncSessionLocal
+from app.credibility.history import persist_scores_stmt
+from app.credibility.stats import fetch_credibility_stats
+from app.matches.worker import notify_startups_changed
+from app.startups.discover_cache import invalidate_discover
+from app.startups.credibility import breakdown_from_stats, calculate_credibility
+from app.startups.models import Startup
+
+logger = logging.getLogger(__name__)
+
+
+class CredibilityRecomputeWorker:
+    """
+    Coalesces "startup X is dirty" events and rescores each dirty startup
+    once per window, in one batched stats query.
+    """
+
+    def __init__(self, window: float):
+        self.window = window
+        # startup_id -> monotonic time it was first marked dirty
+        self._dirty: dict = {}
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+        self.events = 0
+        self.recomputed = 0
+        self.batches = 0
+        self.errors = 0
+        self.last_batch_size = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def mark_dirty(self, startup_id):
+        self.events += 1
+        self._dirty.setdefault(startup_id, time.monotonic())
+        self._wakeup.set()
+
+    def start(self):
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        # Don't drop work that was already accepted
+        if self._dirty:
+            await self._flush()
+
+    async def _run(self):
+        while True:
+            await self._wakeup.wait()
+            # Let the burst accumulate before recomputing
+            await asyncio.sleep(self.window)
+            self._wakeup.clear()
+            await self._flush()
+
+    async def _flush(self):
+        batch, self._dirty = self._dirty, {}
+        if not batch:
+            return
+
+        try:
+            async with AsyncSessionLocal() as db:
+                scores = [
+                    (stats.Startup.id, breakdown_from_stats(stats)["final_score"])
+                    for stats in await fetch_credibility_stats(db, list(batch))
+                ]
+                if scores:
+                    result = await db.execute(persist_scores_stmt(scores))
+                    changed = result.scalars().all()
+                    await db.commit()
+                    notify_startups_changed(changed)
+                    invalidate_discover(changed)
+        except Exception:
+            self.errors += 1
+            logger.exception("Credibility recompute failed for %d startups", len(batch))
+            # Retry on the next window
+            for startup_id, dirtied_at in batch.items():
+                self._dirty.setdefault(startup_id, dirtied_at)
+            self._wakeup.set()
+            return
+
+        now = time.monotonic()
+        lag = now - min(batch.values())
+        self.batches += 1
+        self.recomputed += len(batch)
+        self.last_batch_size = len(batch)
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+
+    def metrics(self) -> dict:
+        now = time.monotonic()
+        return {
+            "mode": CREDIBILITY_RECOMPUTE_MODE,
+            "running": self.running,
+            "queue_depth": len(self._dirty),
+            "oldest_pending_s": (
+                round(now - min(self._dirty.values()), 3) if self._dirty else 0.0
+            ),
+            "events": self.events,
+            "recomputed": self.recomputed,
+            "batches": self.batches,
+            "errors": self.errors,
+            "last_batch_size": self.last_batch_size,
+            "last_lag_s": round(self.last_lag, 3),
+            "max_lag_s": round(self.max_lag, 3),
+        }
+
+
+credibility_worker = CredibilityRecomputeWorker(CREDIBILITY_DEBOUNCE_SECONDS)
+
+
+async def request_credibility_recompute(db: AsyncSession, startup_id):
+    """
+    Rescore a startup after a write, according to CREDIBILITY_RECOMPUTE_MODE.
+    """
+    if CREDIBILITY_RECOMPUTE_MODE == "disabled":
+        return
+
+    if CREDIBILITY_RECOMPUTE_MODE == "debounced" and credibility_worker.running:
+        credibility_worker.mark_dirty(startup_id)
+        return
+
+    # "sync", or no worker running (e.g. outside the API process)
+    startup = await db.get(Startup, startup_id)
+    if startup:
+        await calculate_credibility(db, startup)
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -9,6 +9,19 @@ from app.core.database import Base
 
 class EnterpriseProfile(Base):
     __tablename__ = "enterprise_profiles"
+    __table_args__ = (
+        # Reverse matching: "which enterprises list this industry / range?"
+        Index(
+            "ix_enterprise_profiles_interested_industries",
+            "interested_industries",
+            postgresql_using="gin",
+        ),
+        Index(
+            "ix_enterprise_profiles_preferred_arr_ranges",
+            "preferred_arr_ranges",
+            postgresql_using="gin",
+        ),
+    )
 
     id = Column(
         UUID(as_uuid=True),
@@ -44,6 +57,9 @@ class EnterpriseProfile(Base):
     # 🔄 Buying intent / maturity
     engagement_stage = Column(String, nullable=True)
 
+    # 🧮 When the top-K match list was last recomputed in full (NULL: never)
+    matches_computed_at = Column(DateTime(timezone=True), nullable=True)
+
     # 🕒 Timestamps
     created_at = Column(
         DateTime(timezone=True),
@@ -1,9 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import get_db
-from app.core.security import require_role
-from app.users.service import get_or_create_user
+from app.core.deps import get_async_db, require_principal
 from app.enterprises.schemas import (
     EnterpriseProfileCreate,
     EnterpriseProfileUpdate,
@@ -25,18 +23,12 @@ router = APIRouter(
     "/me",
     response_model=EnterpriseProfileResponse,
 )
-def get_my_enterprise_profile(
-    db: Session = Depends(get_db),
-    user=Depends(require_role("enterprise")),
+async def get_my_enterprise_profile(
+    db: AsyncSession = Depends(get_async_db),
+    principal=Depends(require_principal("enterprise")),
 ):
-    db_user = get_or_create_user(
-        db,
-        clerk_user_id=user["clerk_user_id"],
-        email=user["email"],
-        role=user["role"],
-    )
 
-    profile = get_enterprise_profile(db, db_user.id)
+    profile = await get_enterprise_profile(db, principal["user_id"])
     if not profile:
         raise HTTPException(status_code=404, detail="Profile not found")
 
@@ -47,43 +39,31 @@ def get_my_enterprise_profile(
     "/me",
     response_model=EnterpriseProfileResponse,
 )
-def create_my_enterprise_profile(
+async def create_my_enterprise_profile(
     payload: EnterpriseProfileCreate,
-    db: Session = Depends(get_db),
-    user=Depends(require_role("enterprise")),
+    db: AsyncSession = Depends(get_async_db),
+    principal=Depends(require_principal("enterprise")),
 ):
-    db_user = get_or_create_user(
-        db,
-        clerk_user_id=user["clerk_user_id"],
-        email=user["email"],
-        role=user["role"],
-    )
 
-    existing = get_enterprise_profile(db, db_user.id)
+    existing = await get_enterprise_profile(db, principal["user_id"])
     if existing:
         raise HTTPException(status_code=400, detail="Profile already exists")
 
-    return create_enterprise_profile(db, db_user.id, payload)
+    return await create_enterprise_profile(db, principal["user_id"], payload)
 
 
 @router.put(
     "/me",
     response_model=EnterpriseProfileResponse,
 )
-def update_my_enterprise_profile(
+async def update_my_enterprise_profile(
     payload: EnterpriseProfileUpdate,
-    db: Session = Depends(get_db),
-    user=Depends(require_role("enterprise")),
+    db: AsyncSession = Depends(get_async_db),
+    principal=Depends(require_principal("enterprise")),
 ):
-    db_user = get_or_create_user(
-        db,
-        clerk_user_id=user["clerk_user_id"],
-        email=user["email"],
-        role=user["role"],
-    )
 
-    profile = get_enterprise_profile(db, db_user.id)
+    profile = await get_enterprise_profile(db, principal["user_id"])
     if not profile:
         raise HTTPException(status_code=404, detail="Profile not found")
 
-    return update_enterprise_profile(db, profile, payload)
+    return await update_enterprise_profile(db, profile, payload)
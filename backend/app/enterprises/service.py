@@ -1,21 +1,22 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.enterprises.models import EnterpriseProfile
+from app.matches.worker import request_match_refresh
 from app.enterprises.schemas import (
     EnterpriseProfileCreate,
     EnterpriseProfileUpdate,
 )
 
 
-def get_enterprise_profile(db: Session, user_id):
-    return (
-        db.query(EnterpriseProfile)
+async def get_enterprise_profile(db: AsyncSession, user_id):
+    return await db.scalar(
+        select(EnterpriseProfile)
         .filter(EnterpriseProfile.user_id == user_id)
-        .first()
     )
 
 
-def create_enterprise_profile(
-    db: Session,
+async def create_enterprise_profile(
+    db: AsyncSession,
     user_id,
     payload: EnterpriseProfileCreate,
 ):
@@ -25,19 +26,23 @@ def create_enterprise_profile(
     )
 
     db.add(profile)
-    db.commit()
-    db.refresh(profile)
+    await db.commit()
+    await db.refresh(profile)
+
+    await request_match_refresh(db, user_id)
     return profile
 
 
-def update_enterprise_profile(
-    db: Session,
+async def update_enterprise_profile(
+    db: AsyncSession,
     profile: EnterpriseProfile,
     payload: EnterpriseProfileUpdate,
 ):
     for field, value in payload.model_dump(exclude_unset=True).items():
         setattr(profile, field, value)
 
-    db.commit()
-    db.refresh(profile)
+    await db.commit()
+    await db.refresh(profile)
+
+    await request_match_refresh(db, profile.user_id)
     return profile
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Boolean, ForeignKey, Integer, Text, UniqueConstraint
+from sqlalchemy import Column, Boolean, ForeignKey, Index, Integer, Text, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.core.models import BaseModel
@@ -12,6 +12,15 @@ class EnterpriseFeedback(BaseModel):
             "enterprise_id",
             name="uq_enterprise_feedback_once",
         ),
+        Index(
+            "ix_enterprise_feedback_verified_startup_created_id",
+            "startup_id", "created_at", "id",
+            postgresql_where=text("verified"),
+        ),
+        Index(
+            "ix_enterprise_feedback_enterprise_created_id",
+            "enterprise_id", "created_at", "id",
+        ),
     )
 
     startup_id = Column(
@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
+from uuid import UUID
 
-from app.core.deps import get_db
+from app.core.deps import get_async_db, get_read_db, require_principal
+from app.core.pagination import PageParams, page_params, set_next_cursor
 from app.core.security import require_role
-from app.users.service import get_or_create_user
 
 from app.feedback.schemas import (
     EnterpriseFeedbackCreate,
@@ -29,18 +30,17 @@ router = APIRouter(
     "/me",
     response_model=List[EnterpriseFeedbackResponse],
 )
-def get_my_feedback(
-    db: Session = Depends(get_db),
-    user=Depends(require_role("enterprise")),
+async def get_my_feedback(
+    response: Response,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_async_db),
+    principal=Depends(require_principal("enterprise")),
 ):
-    db_user = get_or_create_user(
-        db=db,
-        clerk_user_id=user["clerk_user_id"],
-        email=user["email"],
-        role=user["role"],
+    feedback, next_cursor = await get_feedback_by_enterprise(
+        db, principal["user_id"], page
     )
-
-    return get_feedback_by_enterprise(db, db_user.id)
+    set_next_cursor(response, next_cursor)
+    return feedback
 
 
 # -------------------------------------------------
@@ -50,22 +50,15 @@ def get_my_feedback(
     "/",
     response_model=EnterpriseFeedbackResponse,
 )
-def submit_enterprise_feedback(
+async def submit_enterprise_feedback(
     payload: EnterpriseFeedbackCreate,
-    db: Session = Depends(get_db),
-    user=Depends(require_role("enterprise")),
+    db: AsyncSession = Depends(get_async_db),
+    principal=Depends(require_principal("enterprise")),
 ):
-    enterprise_user = get_or_create_user(
-        db=db,
-        clerk_user_id=user["clerk_user_id"],
-        email=user["email"],
-        role=user["role"],
-    )
-
-    return create_feedback(
+    return await create_feedback(
         db=db,
         startup_id=payload.startup_id,
-        enterprise_id=enterprise_user.id,
+        enterprise_id=principal["user_id"],
         data=payload,
     )
 
@@ -77,11 +70,15 @@ def submit_enterprise_feedback(
     "/startup/{startup_id}",
     response_model=List[EnterpriseFeedbackResponse],
 )
-def get_public_enterprise_feedback(
-    startup_id: str,
-    db: Session = Depends(get_db),
+async def get_public_enterprise_feedback(
+    startup_id: UUID,
+    response: Response,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    return list_verified_feedback(db, startup_id)
+    feedback, next_cursor = await list_verified_feedback(db, startup_id, page)
+    set_next_cursor(response, next_cursor)
+    return feedback
 
 
 # -------------------------------------------------
@@ -91,12 +88,12 @@ def get_public_enterprise_feedback(
     "/{feedback_id}/verify",
     response_model=EnterpriseFeedbackResponse,
 )
-def admin_verify_enterprise_feedback(
+async def admin_verify_enterprise_feedback(
     feedback_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user=Depends(require_role("admin")),
 ):
-    feedback = verify_feedback(db, feedback_id)
+    feedback = await verify_feedback(db, feedback_id)
 
     if not feedback:
         raise HTTPException(
@@ -1,16 +1,18 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
+from app.core.pagination import PageParams, keyset_page
 from app.feedback.models import EnterpriseFeedback
-from app.startups.credibility import calculate_credibility
+from app.credibility.worker import request_credibility_recompute
+from app.credibility.stats import bump_startup_stats
+from app.matches.service import match_id_for
 
-def create_feedback(db: Session, startup_id, enterprise_id, data):
-    existing = (
-        db.query(EnterpriseFeedback)
-        .filter(
+async def create_feedback(db: AsyncSession, startup_id, enterprise_id, data):
+    existing = await db.scalar(
+        select(EnterpriseFeedback).filter(
             EnterpriseFeedback.startup_id == startup_id,
             EnterpriseFeedback.enterprise_id == enterprise_id,
         )
-        .first()
     )
 
     if existing:
@@ -22,43 +24,63 @@ def create_feedback(db: Session, startup_id, enterprise_id, data):
     feedback = EnterpriseFeedback(
         startup_id=startup_id,
         enterprise_id=enterprise_id,
+        # The enterprise's match with this startup, if it had one
+        match_id=await match_id_for(db, enterprise_id, startup_id),
         rating=data.rating,
         content=data.content,
         verified=False,
     )
 
     db.add(feedback)
-    db.commit()
-    db.refresh(feedback)
+    await db.commit()
+    await db.refresh(feedback)
     return feedback
 
 
-def list_verified_feedback(db: Session, startup_id):
-    return (
-        db.query(EnterpriseFeedback)
-        .filter_by(startup_id=startup_id, verified=True)
-        .all()
+async def list_verified_feedback(db: AsyncSession, startup_id, page: PageParams):
+    return await keyset_page(
+        db,
+        select(EnterpriseFeedback).filter_by(startup_id=startup_id, verified=True),
+        (EnterpriseFeedback.created_at, EnterpriseFeedback.id),
+        page,
     )
 
 
-def verify_feedback(db: Session, feedback_id):
-    feedback = db.query(EnterpriseFeedback).filter_by(id=feedback_id).first()
-    if not feedback:
-        return None
-
-    feedback.verified = True
-    db.commit()
+async def verify_feedback(db: AsyncSession, feedback_id):
+    # Flip the flag only if it is still unset, so concurrent verifications
+    # of one feedback count it once
+    verified = (
+        await db.execute(
+            update(EnterpriseFeedback)
+            .where(
+                EnterpriseFeedback.id == feedback_id,
+                EnterpriseFeedback.verified.is_not(True),
+            )
+            .values(verified=True)
+            .returning(EnterpriseFeedback.startup_id, EnterpriseFeedback.rating)
+        )
+    ).first()
+    if verified is not None:
+        await bump_startup_stats(
+            db, verified.startup_id, feedback_count=1, rating_sum=verified.rating
+        )
+        await db.commit()
 
-    result = calculate_credibility(db, feedback.startup)
-    feedback.startup.credibility_score = result["overall_score"]
-    db.commit()
+        await request_credibility_recompute(db, verified.startup_id)
 
-    return feedback
+    return await db.scalar(select(EnterpriseFeedback).filter_by(id=feedback_id))
 
 
-def get_feedback_by_enterprise(db: Session, enterprise_user_id: int):
-    return (
-        db.query(EnterpriseFeedback)
-        .filter(EnterpriseFeedback.enterprise_id == enterprise_user_id)
-        .all()
+async def get_feedback_by_enterprise(
+    db: AsyncSession,
+    enterprise_user_id,
+    page: PageParams,
+):
+    return await keyset_page(
+        db,
+        select(EnterpriseFeedback).filter(
+            EnterpriseFeedback.enterprise_id == enterprise_user_id
+        ),
+        (EnterpriseFeedback.created_at, EnterpriseFeedback.id),
+        page,
     )
@@ -0,0 +1,247 @@
+# app/launches/counters.py
+
+import asyncio
+import logging
+import time
+from collections import Counter
+
+from sqlalchemy import BigInteger, Float, column, func, select, update, values
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Session
+
+from app.core.config import UPVOTE_COUNTER_MODE, UPVOTE_FLUSH_MS
+from app.core.database import AsyncSessionLocal
+from app.credibility.cache import mark_credibility_dirty
+from app.credibility.stats import bump_stats_from_select
+from app.credibility.worker import request_credibility_recompute
+from app.launches.models import Launch
+from app.launches.trending import combine, combine_sql, vote_weight
+from app.launches.vote_models import LaunchUpvote
+from app.startups.stats_models import StartupStats
+
+logger = logging.getLogger(__name__)
+
+
+def flush_counters_stmt(deltas, hot):
+    """
+    Apply {launch_id: k} (and the launches' combined vote weights) in one
+    statement:
+
+    WITH deltas AS (VALUES ...),
+         bumped AS (UPDATE launches SET upvotes = upvotes + k ... RETURNING)
+    INSERT INTO startup_stats ... SELECT startup_id, sum(k) FROM bumped
+    RETURNING startup_id
+    """
+    pending = values(
+        column("launch_id", UUID(as_uuid=True)),
+        column("k", BigInteger),
+        column("w", Float),
+        name="deltas",
+    ).data(sorted((launch_id, k, hot[launch_id]) for launch_id, k in deltas.items()))
+
+    bumped = (
+        update(Launch)
+        .where(Launch.id == pending.c.launch_id)
+        .values(
+            upvotes=Launch.upvotes + pending.c.k,
+            hot_score=combine_sql(Launch.hot_score, pending.c.w),
+        )
+        .returning(Launch.startup_id, pending.c.k)
+        .cte("bumped")
+    )
+    return bump_stats_from_select(
+        select(bumped.c.startup_id, func.sum(bumped.c.k))
+        .group_by(bumped.c.startup_id),
+        "total_upvotes",
+    ).returning(StartupStats.startup_id)
+
+
+class UpvoteCounterBuffer:
+    """
+    Write-behind aggregator for launches.upvotes.
+
+    Vote rows are inserted synchronously (uniqueness stays enforced by
+    the database); only the counter increments are buffered here and
+    applied as one `upvotes = upvotes + k` per launch per flush, so a
+    trending launch takes one row lock per interval instead of one per
+    vote.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        # launch_id -> increments not yet written
+        self._pending: Counter = Counter()
+        # launch_id -> log2 trending weight of those votes
+        self._hot: dict = {}
+        # monotonic time of the oldest increment in `_pending`
+        self._oldest: float | None = None
+        self._task: asyncio.Task | None = None
+        # The flush in progress, if any; outlives a cancelled `_task`
+        self._flushing: asyncio.Task | None = None
+        # Increments swapped out by that flush and not yet committed
+        self._in_flight: Counter = Counter()
+
+        self.votes = 0
+        self.flushes = 0
+        self.flushed_votes = 0
+        self.errors = 0
+        self.last_flush_launches = 0
+        self.last_flush_votes = 0
+        self.max_flush_votes = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def add(self, launch_id):
+        self.votes += 1
+        self._pending[launch_id] += 1
+        self._hot[launch_id] = combine(self._hot.get(launch_id), vote_weight())
+        if self._oldest is None:
+            self._oldest = time.monotonic()
+
+    def pending(self, launch_id) -> int:
+        return self._pending.get(launch_id, 0)
+
+    def unflushed(self) -> set:
+        """
+        Launches with increments not yet committed (buffered or in flight).
+        """
+        return set(self._pending) | set(self._in_flight)
+
+    def start(self):
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        # Let a shielded flush finish (or put its batch back), then write
+        # what is left: increments acknowledged to clients must reach the DB
+        if self._flushing is not None:
+            await asyncio.wait([self._flushing])
+            self._flushing = None
+        if self._pending:
+            await self._flush()
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            if self._pending:
+                # Cancelling the loop must not drop the swapped-out batch
+                self._flushing = asyncio.create_task(self._flush())
+                try:
+                    await asyncio.shield(self._flushing)
+                finally:
+                    if self._flushing.done():
+                        self._flushing = None
+
+    async def _flush(self):
+        batch, self._pending = self._pending, Counter()
+        hot, self._hot = self._hot, {}
+        oldest, self._oldest = self._oldest, None
+        self._in_flight = batch
+
+        try:
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(flush_counters_stmt(batch, hot))
+                startup_ids = result.scalars().all()
+                for startup_id in startup_ids:
+                    mark_credibility_dirty(db, startup_id)
+                await db.commit()
+        except BaseException as exc:
+            self._in_flight = Counter()
+            # Keep the increments for the next flush
+            self._pending.update(batch)
+            for launch_id, weight in hot.items():
+                self._hot[launch_id] = combine(self._hot.get(launch_id), weight)
+            self._oldest = min(filter(None, (oldest, self._oldest)), default=None)
+            if not isinstance(exc, Exception):
+                raise
+            self.errors += 1
+            logger.exception("Upvote counter flush failed for %d launches", len(batch))
+            return
+        self._in_flight = Counter()
+
+        votes = sum(batch.values())
+        lag = time.monotonic() - oldest if oldest is not None else 0.0
+        self.flushes += 1
+        self.flushed_votes += votes
+        self.last_flush_launches = len(batch)
+        self.last_flush_votes = votes
+        self.max_flush_votes = max(self.max_flush_votes, votes)
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+
+        # Committed: a failure from here on must not re-queue the batch
+        try:
+            async with AsyncSessionLocal() as db:
+                for startup_id in startup_ids:
+                    await request_credibility_recompute(db, startup_id)
+        except Exception:
+            logger.exception("Credibility recompute after upvote flush failed")
+
+    def metrics(self) -> dict:
+        now = time.monotonic()
+        return {
+            "mode": UPVOTE_COUNTER_MODE,
+            "running": self.running,
+            "interval_ms": int(self.interval * 1000),
+            "pending_launches": len(self._pending),
+            "pending_votes": sum(self._pending.values()),
+            "oldest_pending_s": (
+                round(now - self._oldest, 3) if self._oldest is not None else 0.0
+            ),
+            "votes": self.votes,
+            "flushes": self.flushes,
+            "flushed_votes": self.flushed_votes,
+            "errors": self.errors,
+            "last_flush_launches": self.last_flush_launches,
+            "last_flush_votes": self.last_flush_votes,
+            "max_flush_votes": self.max_flush_votes,
+            "last_lag_s": round(self.last_lag, 3),
+            "max_lag_s": round(self.max_lag, 3),
+        }
+
+
+upvote_buffer = UpvoteCounterBuffer(UPVOTE_FLUSH_MS / 1000)
+
+
+# -------------------------------------------------
+# CRASH RECOVERY
+# -------------------------------------------------
+
+def reconcile_upvote_counters_sync(db: Session) -> list:
+    """
+    Reset launches.upvotes to the number of launch_upvotes rows.
+
+    Increments still buffered when a process died are lost; the vote rows
+    are not. Run with no API process holding buffered increments (they
+    would be counted twice). Returns the startup ids whose launches
+    changed, for a follow-up startup_stats rebuild.
+    """
+    # Served by the (launch_id, user_id) unique index
+    actual = (
+        select(func.count())
+        .select_from(LaunchUpvote)
+        .where(LaunchUpvote.launch_id == Launch.id)
+        .scalar_subquery()
+    )
+    result = db.execute(
+        update(Launch)
+        .where(Launch.upvotes.is_distinct_from(actual))
+        .values(upvotes=actual)
+        .returning(Launch.startup_id)
+        .execution_options(synchronize_session=False)
+    )
+    startup_ids = sorted(set(result.scalars()))
+    db.commit()
+    return startup_ids
@@ -0,0 +1,242 @@
+# app/launches/leaderboard.py
+
+import asyncio
+import logging
+import time
+
+from sortedcontainers import SortedList
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.config import LEADERBOARD_ENABLED, LEADERBOARD_RESYNC_SECONDS
+from app.core.database import AsyncSessionLocal
+from app.core.pagination import PageParams, decode_cursor, encode_cursor
+from app.launches.counters import upvote_buffer
+from app.launches.models import Launch
+
+logger = logging.getLogger(__name__)
+
+# Same order (and cursor format) as the SQL keyset path
+SORT_KEYS = (Launch.upvotes, Launch.id)
+# Rows per fetch while reloading counts
+RESYNC_CHUNK = 1000
+
+
+class LaunchLeaderboard:
+    """
+    Process-local launch ranking by (upvotes, id) descending.
+
+    A SortedList of (upvotes, id) keys gives O(log n) rank lookups,
+    top-K in O(log n + K) and vote updates in O(log n). Only the keys are
+    kept: a page's launch rows are then read by primary key, so memory
+    per worker stays at one key per launch. A periodic resync folds in
+    votes taken by other worker processes.
+    """
+
+    def __init__(self, resync_interval: float):
+        self.resync_interval = resync_interval
+        self._keys = SortedList()
+        # launch_id -> upvotes (the key currently in `_keys`)
+        self._upvotes: dict = {}
+        # Launches written by this process during a resync, else None
+        self._touched: set | None = None
+        self._task: asyncio.Task | None = None
+
+        self.ready = False
+        self.resyncs = 0
+        self.errors = 0
+        self.last_resync_s = 0.0
+
+    def __len__(self):
+        return len(self._keys)
+
+    # ---------------------------------------------
+    # Updates
+    # ---------------------------------------------
+    def upsert(self, launch: Launch):
+        """
+        Add a new launch (or re-key a known one).
+        """
+        if self._touched is not None:
+            self._touched.add(launch.id)
+        self._set(launch.id, launch.upvotes or 0)
+
+    def set_upvotes(self, launch_id, upvotes: int):
+        """
+        Re-key a known launch; unknown ones wait for `upsert` or a resync.
+        """
+        if launch_id not in self._upvotes:
+            return
+        if self._touched is not None:
+            self._touched.add(launch_id)
+        self._set(launch_id, upvotes)
+
+    def _set(self, launch_id, upvotes: int):
+        current = self._upvotes.get(launch_id)
+        if current == upvotes:
+            return
+        if current is not None:
+            self._keys.remove((current, launch_id))
+        self._keys.add((upvotes, launch_id))
+        self._upvotes[launch_id] = upvotes
+
+    def remove(self, launch_id):
+        upvotes = self._upvotes.pop(launch_id, None)
+        if upvotes is not None:
+            self._keys.remove((upvotes, launch_id))
+
+    # ---------------------------------------------
+    # Queries
+    # ---------------------------------------------
+    def upvotes(self, launch_id) -> int | None:
+        return self._upvotes.get(launch_id)
+
+    def rank(self, launch_id) -> int | None:
+        """
+        1-based position of a launch, or None if unknown.
+        """
+        upvotes = self._upvotes.get(launch_id)
+        if upvotes is None:
+            return None
+        return len(self._keys) - self._keys.bisect_left((upvotes, launch_id))
+
+    def top(self, k: int, after=None) -> list:
+        """
+        Next `k` (upvotes, id) keys below `after` (from the top if None).
+        """
+        end = len(self._keys) if after is None else self._keys.bisect_left(tuple(after))
+        start = max(end - k, 0)
+        return list(reversed(self._keys[start:end]))
+
+    def page_keys(self, page: PageParams):
+        """
+        (keys, next_cursor) of a page; the cursor format is keyset_page's.
+        """
+        after = decode_cursor(page.cursor, SORT_KEYS) if page.cursor else None
+        keys = self.top(page.limit + 1, after)
+        next_cursor = encode_cursor(keys[page.limit - 1]) if len(keys) > page.limit else None
+        return keys[: page.limit], next_cursor
+
+    async def page(self, db: AsyncSession, page: PageParams):
+        """
+        Same contract as `keyset_page` on the SQL path: (launches,
+        next_cursor), ordered here and loaded with one primary-key IN.
+        """
+        keys, next_cursor = self.page_keys(page)
+        launches = {
+            launch.id: launch
+            for launch in await db.scalars(
+                select(Launch).where(Launch.id.in_([launch_id for _, launch_id in keys]))
+            )
+        }
+        rows = []
+        for upvotes, launch_id in keys:
+            launch = launches.get(launch_id)
+            # Deleted since, or not on this (replica) connection yet
+            if launch is None:
+                continue
+            # This process's count includes votes still being buffered
+            set_committed_value(launch, "upvotes", upvotes)
+            rows.append(launch)
+        return rows, next_cursor
+
+    # ---------------------------------------------
+    # Seeding / resync
+    # ---------------------------------------------
+    async def resync(self):
+        """
+        Reload (id, upvotes) for every launch; the replacement ranking is
+        built in a worker thread and swapped in.
+
+        Launches this process writes while the snapshot loads (and those
+        with increments still unflushed when it starts) may be ahead of
+        it: they keep the higher count and are never dropped. Counts only
+        go down through reconcile, which the next resync picks up.
+        """
+        start = time.perf_counter()
+        self._touched = upvote_buffer.unflushed()
+        try:
+            counts = []
+            async with AsyncSessionLocal() as db:
+                # Streamed in chunks so decoding yields to other requests
+                # Index order: the SortedList is then built from sorted input
+                result = await db.stream(
+                    select(Launch.id, Launch.upvotes)
+                    .order_by(Launch.upvotes, Launch.id)
+                    .execution_options(yield_per=RESYNC_CHUNK)
+                )
+                async for chunk in result.partitions():
+                    counts.extend(chunk)
+            # Votes still sitting in this process's write-behind buffer
+            pending = {
+                launch_id: upvote_buffer.pending(launch_id)
+                for launch_id in self._touched | upvote_buffer.unflushed()
+            }
+            upvotes, keys = await asyncio.to_thread(_ranking, counts, pending)
+
+            touched, self._touched = self._touched, None
+            for launch_id in touched:
+                live = self._upvotes.get(launch_id)
+                if live is None:
+                    continue
+                fresh = upvotes.get(launch_id)
+                if fresh is None or live > fresh:
+                    if fresh is not None:
+                        keys.remove((fresh, launch_id))
+                    keys.add((live, launch_id))
+                    upvotes[launch_id] = live
+        finally:
+            self._touched = None
+
+        self._keys, self._upvotes = keys, upvotes
+        self.ready = True
+        self.resyncs += 1
+        self.last_resync_s = time.perf_counter() - start
+
+    async def _run(self):
+        while True:
+            try:
+                await self.resync()
+            except Exception:
+                self.errors += 1
+                logger.exception("Launch leaderboard resync failed")
+            await asyncio.sleep(self.resync_interval)
+
+    def start(self):
+        if LEADERBOARD_ENABLED and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def metrics(self) -> dict:
+        return {
+            "enabled": LEADERBOARD_ENABLED,
+            "ready": self.ready,
+            "launches": len(self._keys),
+            "resyncs": self.resyncs,
+            "errors": self.errors,
+            "last_resync_s": round(self.last_resync_s, 3),
+        }
+
+
+def _ranking(counts, pending: dict):
+    """
+    ({launch_id: upvotes}, SortedList of keys) from (id, upvotes) rows;
+    CPU only.
+    """
+    upvotes = {
+        launch_id: count + pending.get(launch_id, 0) for launch_id, count in counts
+    }
+    return upvotes, SortedList((count, launch_id) for launch_id, count in upvotes.items())
+
+
+launch_leaderboard = LaunchLeaderboard(LEADERBOARD_RESYNC_SECONDS)
@@ -1,18 +1,31 @@
-from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, Text
+from sqlalchemy import Column, String, Integer, Float, Boolean, ForeignKey, Text, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.core.models import BaseModel
 
 class Launch(BaseModel):
     __tablename__ = "launches"
+    __table_args__ = (
+        # Keyset pagination sort orders
+        Index("ix_launches_upvotes_id", "upvotes", "id"),
+        Index("ix_launches_startup_created_id", "startup_id", "created_at", "id"),
+        # Trending feed (top K by hot score)
+        Index(
+            "ix_launches_hot_score_id", "hot_score", "id",
+            postgresql_where=text("hot_score IS NOT NULL"),
+        ),
+    )
 
-    startup_id = Column(UUID(as_uuid=True), ForeignKey("startups.id"), nullable=False)
+    startup_id = Column(UUID(as_uuid=True), ForeignKey("startups.id"), nullable=False, index=True)
 
     title = Column(String, nullable=False)
     tagline = Column(String, nullable=False)
     description = Column(Text, nullable=False)
 
-    upvotes = Column(Integer, default=0)
+    upvotes = Column(Integer, nullable=False, default=0, server_default="0")
     featured = Column(Boolean, default=False)
 
+    # log2 of the time-decayed vote sum; see app/launches/trending.py
+    hot_score = Column(Float, nullable=True)
+
     startup = relationship("Startup", backref="launches")
@@ -1,13 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-
-from app.core.deps import get_db
-from app.core.security import get_current_user, require_role
-from app.users.service import get_or_create_user
-from app.startups.service import get_startup_by_user
-from app.launches.schemas import LaunchCreate, LaunchResponse
-from app.launches.service import list_launches, upvote_launch
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.ai.service import index_startup
+from app.core.config import TRENDING_MAX_LIMIT
+from app.core.deps import get_async_db, get_read_db, get_principal, require_principal
+from app.core.pagination import PageParams, page_params, set_next_cursor
+from app.launches.schemas import (
+    LaunchCreate,
+    LaunchRankResponse,
+    LaunchResponse,
+    TrendingLaunchResponse,
+    UpvoteStatusRequest,
+)
+from app.launches.leaderboard import launch_leaderboard
+from app.launches.service import (
+    launch_rank,
+    list_launches,
+    list_launches_by_startup,
+    upvote_launch,
+)
+from app.launches.trending import get_trending_launches
+from app.launches.upvote_status import get_upvote_status
 from app.launches.models import Launch
+from app.credibility.stats import bump_startup_stats
 
 router = APIRouter(prefix="/launches", tags=["Launches"])
 
@@ -18,29 +35,19 @@ router = APIRouter(prefix="/launches", tags=["Launches"])
 @router.post(
     "/",
     response_model=LaunchResponse,
-    dependencies=[Depends(require_role("startup"))],
 )
-def create_my_launch(
+async def create_my_launch(
     launch: LaunchCreate,
-    db: Session = Depends(get_db),
-    user=Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    principal=Depends(require_principal("startup")),
 ):
-    # 1️⃣ Ensure user exists in DB
-    db_user = get_or_create_user(
-        db=db,
-        clerk_user_id=user["clerk_user_id"],
-        email=user["email"],
-        role=user["role"],
-    )
-
-    # 2️⃣ Fetch startup owned by this user
-    startup = get_startup_by_user(db, db_user.id)
-    if not startup:
+    # 1️⃣ Startup owned by this user (resolved with the principal)
+    if not principal["startup_id"]:
         raise HTTPException(status_code=404, detail="Startup not found")
 
-    # 3️⃣ Create launch
+    # 2️⃣ Create launch
     db_launch = Launch(
-        startup_id=startup.id,
+        startup_id=principal["startup_id"],
         title=launch.title,
         tagline=launch.tagline,
         description=launch.description,
@@ -49,8 +56,12 @@ def create_my_launch(
     )
 
     db.add(db_launch)
-    db.commit()
-    db.refresh(db_launch)
+    await bump_startup_stats(db, principal["startup_id"], launch_count=1)
+    await db.commit()
+    await db.refresh(db_launch)
+    launch_leaderboard.upsert(db_launch)
+    # The tagline is part of the startup's similarity document
+    await index_startup(db, principal["startup_id"])
 
     return db_launch
 
@@ -61,51 +72,93 @@ def create_my_launch(
 @router.get(
     "/me",
     response_model=list[LaunchResponse],
-    dependencies=[Depends(require_role("startup"))],
 )
-def get_my_launches(
-    db: Session = Depends(get_db),
-    user=Depends(get_current_user),
+async def get_my_launches(
+    response: Response,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_async_db),
+    principal=Depends(require_principal("startup")),
 ):
-    db_user = get_or_create_user(
-        db=db,
-        clerk_user_id=user["clerk_user_id"],
-        email=user["email"],
-        role=user["role"],
-    )
-
-    startup = get_startup_by_user(db, db_user.id)
-    if not startup:
+    if not principal["startup_id"]:
         return []  # 👈 empty state, not error
 
-    return db.query(Launch).filter_by(startup_id=startup.id).all()
+    launches, next_cursor = await list_launches_by_startup(
+        db, principal["startup_id"], page
+    )
+    set_next_cursor(response, next_cursor)
+    return launches
 
 
 # -----------------------------------
 # Public launches (enterprise view)
 # -----------------------------------
 @router.get("/", response_model=list[LaunchResponse])
-def get_public_launches(db: Session = Depends(get_db)):
-    return list_launches(db)
+async def get_public_launches(
+    response: Response,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+):
+    # In-process leaderboard; SQL keyset path until it has loaded
+    if launch_leaderboard.ready:
+        launches, next_cursor = await launch_leaderboard.page(db, page)
+    else:
+        launches, next_cursor = await list_launches(db, page)
+    set_next_cursor(response, next_cursor)
+    return launches
+
+
+# -----------------------------------
+# Leaderboard position of a launch
+# -----------------------------------
+@router.get("/{launch_id}/rank", response_model=LaunchRankResponse)
+async def get_launch_rank(
+    launch_id: UUID,
+    db: AsyncSession = Depends(get_read_db),
+):
+    result = await launch_rank(db, launch_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Launch not found")
+
+    rank, upvotes = result
+    return {"launch_id": launch_id, "rank": rank, "upvotes": upvotes}
+
+
+# -----------------------------------
+# Trending launches (time-decayed votes)
+# -----------------------------------
+@router.get("/trending", response_model=list[TrendingLaunchResponse])
+async def get_trending(
+    limit: int = Query(20, ge=1, le=TRENDING_MAX_LIMIT),
+    db: AsyncSession = Depends(get_read_db),
+):
+    return await get_trending_launches(db, limit)
+
+
+# -----------------------------------
+# Which launches has the current user upvoted?
+# -----------------------------------
+@router.post("/upvote-status", response_model=dict[UUID, bool])
+async def upvote_status(
+    body: UpvoteStatusRequest,
+    db: AsyncSession = Depends(get_async_db),
+    principal=Depends(get_principal),
+):
+    # Primary, not the replica: a vote cast a moment ago must show up
+    return await get_upvote_status(db, principal["user_id"], body.launch_ids)
 
 
 # -----------------------------------
 # Upvote launch
 # -----------------------------------
 @router.post("/{launch_id}/upvote", response_model=LaunchResponse)
-def upvote(
-    launch_id: str,
-    db: Session = Depends(get_db),
-    user=Depends(get_current_user),
+async def upvote(
+    launch_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    principal=Depends(get_principal),
 ):
-    db_user = get_or_create_user(
-        db=db,
-        clerk_user_id=user["clerk_user_id"],   # ✅ FIXED
-        email=user["email"],
-        role=user["role"],
-    )
-
     try:
-        return upvote_launch(db, launch_id, db_user.id)
+        return await upvote_launch(db, launch_id, principal["user_id"])
+    except LookupError:
+        raise HTTPException(status_code=404, detail="Launch not found")
     except ValueError:
         raise HTTPException(status_code=400, detail="Already upvoted")
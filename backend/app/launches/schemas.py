@@ -1,7 +1,9 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from uuid import UUID
 from datetime import datetime
 
+from app.core.config import PAGE_SIZE_MAX
+
 class LaunchCreate(BaseModel):
     title: str
     tagline: str
@@ -17,3 +19,19 @@ class LaunchResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class LaunchRankResponse(BaseModel):
+    launch_id: UUID
+    rank: int
+    upvotes: int
+
+
+class UpvoteStatusRequest(BaseModel):
+    # One page of the feed
+    launch_ids: list[UUID] = Field(max_length=PAGE_SIZE_MAX)
+
+
+class TrendingLaunchResponse(LaunchResponse):
+    # Time-decayed vote count (each vote halves every half-life)
+    trending_score: float
@@ -1,52 +1,152 @@
-from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
+import uuid
 
+from sqlalchemy import func, literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.config import UPVOTE_COUNTER_MODE
+from app.core.pagination import PageParams, keyset_page
+from app.launches.counters import upvote_buffer
+from app.launches.leaderboard import launch_leaderboard
 from app.launches.models import Launch
+from app.launches.trending import combine_sql, vote_weight_sql
+from app.launches.upvote_status import has_upvoted, remember_upvotes
 from app.launches.vote_models import LaunchUpvote
-from app.startups.models import Startup
-from app.startups.credibility import calculate_credibility
-
-def create_launch(db: Session, startup_id, data):
-    launch = Launch(
-        startup_id=startup_id,
-        title=data.title,
-        tagline=data.tagline,
-        description=data.description,
+from app.credibility.cache import mark_credibility_dirty
+from app.credibility.worker import request_credibility_recompute
+from app.credibility.stats import bump_stats_from_select
+
+async def list_launches(db: AsyncSession, page: PageParams):
+    return await keyset_page(db, select(Launch), (Launch.upvotes, Launch.id), page)
+
+
+async def launch_rank(db: AsyncSession, launch_id):
+    """
+    (rank, upvotes) of a launch in the upvotes leaderboard, or None.
+
+    Answered in memory when the leaderboard is loaded; otherwise one
+    index range count.
+    """
+    if launch_leaderboard.ready:
+        rank = launch_leaderboard.rank(launch_id)
+        if rank is not None:
+            return rank, launch_leaderboard.upvotes(launch_id)
+
+    upvotes = await db.scalar(select(Launch.upvotes).where(Launch.id == launch_id))
+    if upvotes is None:
+        return None
+    ahead = await db.scalar(
+        select(func.count())
+        .select_from(Launch)
+        .where(tuple_(Launch.upvotes, Launch.id) > tuple_(upvotes, launch_id))
+    )
+    return ahead + 1, upvotes
+
+
+async def list_launches_by_startup(db: AsyncSession, startup_id, page: PageParams):
+    return await keyset_page(
+        db,
+        select(Launch).filter_by(startup_id=startup_id),
+        (Launch.created_at, Launch.id),
+        page,
+    )
+
+
+def vote_cte(launch_id, user_id):
+    """
+    INSERT the vote row ... ON CONFLICT DO NOTHING RETURNING launch_id.
+    """
+    return (
+        insert(LaunchUpvote)
+        .from_select(
+            ["id", "launch_id", "user_id"],
+            # Selecting from launches makes an unknown launch a no-op
+            # instead of a foreign key error
+            select(literal(uuid.uuid4()), Launch.id, literal(user_id))
+            .where(Launch.id == launch_id),
+        )
+        .on_conflict_do_nothing(index_elements=["launch_id", "user_id"])
+        .returning(LaunchUpvote.launch_id)
+        .cte("vote")
     )
-    db.add(launch)
-    db.commit()
-    db.refresh(launch)
-
-    startup = db.query(Startup).filter_by(id=startup_id).first()
-    if startup:
-        calculate_credibility(db, startup)
-    
-    return launch
 
 
-def list_launches(db: Session):
-    return db.query(Launch).order_by(Launch.upvotes.desc()).all()
+def upvote_stmt(launch_id, user_id):
+    """
+    Vote, counter and startup_stats in one statement:
 
+    WITH vote AS (INSERT ... ON CONFLICT DO NOTHING RETURNING launch_id),
+         bumped AS (UPDATE launches SET upvotes = upvotes + 1
+                    FROM vote ... RETURNING launches.*),
+         stats AS (INSERT INTO startup_stats ... FROM bumped ...)
+    SELECT * FROM bumped
 
-def upvote_launch(db: Session, launch_id, user_id):
-    vote = LaunchUpvote(
-        launch_id=launch_id,
-        user_id=user_id,
+    The counter only moves if the vote row was inserted, and the increment
+    happens in the database, so concurrent votes cannot be lost.
+    """
+    vote = vote_cte(launch_id, user_id)
+    bumped = (
+        update(Launch)
+        .where(Launch.id == vote.c.launch_id)
+        .values(
+            upvotes=Launch.upvotes + 1,
+            hot_score=combine_sql(Launch.hot_score, vote_weight_sql()),
+        )
+        .returning(*Launch.__table__.c)
+        .cte("bumped")
     )
-    db.add(vote)
+    stats = bump_stats_from_select(
+        select(bumped.c.startup_id, literal(1)),
+        "total_upvotes",
+    ).cte("stats")
+
+    return select(aliased(Launch, bumped)).add_cte(stats)
+
+
+def vote_only_stmt(launch_id, user_id):
+    """
+    Insert the vote and return its launch without touching the counter
+    (buffered mode: `upvote_buffer` applies the increment later).
+    """
+    vote = vote_cte(launch_id, user_id)
+    return select(Launch).join(vote, vote.c.launch_id == Launch.id)
+
+
+async def upvote_launch(db: AsyncSession, launch_id, user_id):
+    # Repeat attempts are rejected without a round trip
+    if has_upvoted(user_id, launch_id):
+        raise ValueError("Already upvoted")
+
+    buffered = UPVOTE_COUNTER_MODE == "buffered" and upvote_buffer.running
+    stmt = vote_only_stmt if buffered else upvote_stmt
+    launch = await db.scalar(stmt(launch_id, user_id))
 
-    try:
-        db.commit()
-    except IntegrityError:
-        db.rollback()
+    if launch is None:
+        await db.rollback()
+        if await db.get(Launch, launch_id) is None:
+            raise LookupError("Launch not found")
+        remember_upvotes(user_id, [launch_id])
         raise ValueError("Already upvoted")
 
-    # increment counter
-    launch = db.query(Launch).filter_by(id=launch_id).first()
-    launch.upvotes += 1
-    db.commit()
-    
-    # Calculate credibility after upvote
-    calculate_credibility(db, launch.startup)
-    
+    remember_upvotes(user_id, [launch.id])
+
+    if buffered:
+        # Counter, startup_stats and credibility follow on the next flush
+        await db.commit()
+        upvote_buffer.add(launch.id)
+        set_committed_value(
+            launch, "upvotes", launch.upvotes + upvote_buffer.pending(launch.id)
+        )
+        launch_leaderboard.set_upvotes(launch.id, launch.upvotes)
+        return launch
+
+    mark_credibility_dirty(db, launch.startup_id)
+    await db.commit()
+    launch_leaderboard.set_upvotes(launch.id, launch.upvotes)
+
+    # Recalculate credibility after upvote (debounced by default)
+    await request_credibility_recompute(db, launch.startup_id)
+
     return launch
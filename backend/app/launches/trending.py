@@ -0,0 +1,162 @@
+# app/launches/trending.py
+
+import math
+from datetime import datetime, timezone
+
+from sqlalchemy import case, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import (
+    TRENDING_HALF_LIFE_HOURS,
+    TRENDING_MAX_LIMIT,
+    TRENDING_CACHE_TTL_SECONDS,
+)
+from app.launches.models import Launch
+from app.launches.schemas import LaunchResponse, TrendingLaunchResponse
+from app.launches.vote_models import LaunchUpvote
+
+# -------------------------------------------------
+# HOT SCORE
+# -------------------------------------------------
+# A vote cast at t is worth 2^-((now - t) / half_life). Summed over votes,
+#
+#   hot(now) = 2^-(now - EPOCH)/h * Σ 2^((t - EPOCH)/h)
+#
+# The first factor is the same for every launch, so ranking only needs
+# the sum, which never changes as time passes. launches.hot_score stores
+# log2 of it, updated with log-sum-exp so it cannot overflow; decay is
+# applied only when a score is displayed.
+
+EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+HALF_LIFE_SECONDS = TRENDING_HALF_LIFE_HOURS * 3600
+_INV_LN2 = 1 / math.log(2)
+
+trending_cache = TTLCache(maxsize=8, ttl=TRENDING_CACHE_TTL_SECONDS)
+
+
+def vote_weight(at: datetime | None = None) -> float:
+    """
+    log2 weight of a vote cast at `at` (now by default).
+    """
+    at = at or datetime.now(timezone.utc)
+    return (at - EPOCH).total_seconds() / HALF_LIFE_SECONDS
+
+
+def combine(a: float | None, b: float | None) -> float | None:
+    """
+    log2(2^a + 2^b), with None as "no votes".
+    """
+    if a is None:
+        return b
+    if b is None:
+        return a
+    high, low = max(a, b), min(a, b)
+    return high + math.log2(1 + 2 ** (low - high))
+
+
+def decayed(hot_score: float | None, at: datetime | None = None) -> float:
+    """
+    Time-decayed vote count as of `at` (now by default).
+    """
+    if hot_score is None:
+        return 0.0
+    return 2 ** (hot_score - vote_weight(at))
+
+
+def vote_weight_sql():
+    return (func.extract("epoch", func.now()) - EPOCH.timestamp()) / HALF_LIFE_SECONDS
+
+
+def combine_sql(current, weight):
+    """
+    SQL twin of `combine` (hot_score is NULL until the first vote).
+    """
+    merged = func.greatest(current, weight) + func.ln(
+        1 + func.power(2.0, -func.abs(current - weight))
+    ) * _INV_LN2
+    return case((current.is_(None), weight), else_=merged)
+
+
+# -------------------------------------------------
+# READ PATH (index scan, no vote scan)
+# -------------------------------------------------
+
+async def get_trending_launches(db: AsyncSession, limit: int) -> list:
+    """
+    Top `limit` launches by hot score, served from
+    ix_launches_hot_score_id and cached for a few seconds.
+    """
+    cached = trending_cache.get(limit)
+    if cached is not None:
+        return cached
+
+    result = await db.scalars(
+        select(Launch)
+        .where(Launch.hot_score.isnot(None))
+        .order_by(Launch.hot_score.desc(), Launch.id.desc())
+        .limit(min(limit, TRENDING_MAX_LIMIT))
+    )
+    now = datetime.now(timezone.utc)
+    launches = [
+        TrendingLaunchResponse(
+            **LaunchResponse.model_validate(launch).model_dump(),
+            trending_score=round(decayed(launch.hot_score, now), 3),
+        )
+        for launch in result
+    ]
+    trending_cache.set(limit, launches)
+    return launches
+
+
+# -------------------------------------------------
+# PERIODIC REBUILD (from launch_upvotes)
+# -------------------------------------------------
+
+def rebuild_hot_scores_sync(db: Session) -> int:
+    """
+    Recompute every hot_score from vote timestamps.
+
+    Needed after changing TRENDING_HALF_LIFE_HOURS or reconciling
+    counters; normal operation only ever adds votes incrementally.
+    Computed as max + log2(Σ 2^(w - max)) so it cannot overflow.
+    """
+    weight = (
+        func.extract("epoch", LaunchUpvote.created_at) - EPOCH.timestamp()
+    ) / HALF_LIFE_SECONDS
+    per_vote = select(
+        LaunchUpvote.launch_id,
+        weight.label("w"),
+        func.max(weight).over(partition_by=LaunchUpvote.launch_id).label("top"),
+    ).subquery()
+    scores = (
+        select(
+            per_vote.c.launch_id,
+            (
+                func.max(per_vote.c.top)
+                + func.ln(func.sum(func.power(2.0, per_vote.c.w - per_vote.c.top)))
+                * _INV_LN2
+            ).label("hot"),
+        )
+        .group_by(per_vote.c.launch_id)
+        .subquery()
+    )
+
+    result = db.execute(
+        update(Launch)
+        .where(Launch.id == scores.c.launch_id)
+        .values(hot_score=scores.c.hot)
+        .execution_options(synchronize_session=False)
+    )
+    # Launches whose votes are all gone
+    db.execute(
+        update(Launch)
+        .where(Launch.hot_score.isnot(None))
+        .where(~select(LaunchUpvote.id).where(LaunchUpvote.launch_id == Launch.id).exists())
+        .values(hot_score=None)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    trending_cache.clear()
+    return result.rowcount
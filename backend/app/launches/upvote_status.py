@@ -0,0 +1,54 @@
+# app/launches/upvote_status.py
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import UPVOTE_CACHE_TTL_SECONDS, UPVOTE_CACHE_USERS
+from app.launches.vote_models import LaunchUpvote
+
+# user_id -> set of launch ids the user is known to have upvoted.
+# Only confirmed votes are stored and votes are never withdrawn, so a hit
+# is always right; a miss just means "ask the database".
+upvoted_cache = TTLCache(maxsize=UPVOTE_CACHE_USERS, ttl=UPVOTE_CACHE_TTL_SECONDS)
+
+
+def remember_upvotes(user_id, launch_ids):
+    known = upvoted_cache.get(user_id)
+    if known is None:
+        known = set()
+        upvoted_cache.set(user_id, known)
+    known.update(launch_ids)
+
+
+def has_upvoted(user_id, launch_id) -> bool:
+    """
+    True if the user is known to have upvoted the launch (no DB access).
+    """
+    known = upvoted_cache.get(user_id)
+    return known is not None and launch_id in known
+
+
+async def get_upvote_status(db: AsyncSession, user_id, launch_ids) -> dict:
+    """
+    {launch_id: upvoted} for a page of launches.
+
+    Launches already cached as upvoted are answered in memory; the rest
+    in one query served by ix_launch_upvotes_user_launch.
+    """
+    known = upvoted_cache.get(user_id) or set()
+    unknown = [launch_id for launch_id in launch_ids if launch_id not in known]
+
+    found = set()
+    if unknown:
+        found = set(
+            await db.scalars(
+                select(LaunchUpvote.launch_id)
+                .where(LaunchUpvote.user_id == user_id)
+                .where(LaunchUpvote.launch_id.in_(unknown))
+            )
+        )
+        if found:
+            remember_upvotes(user_id, found)
+
+    return {launch_id: launch_id in known or launch_id in found for launch_id in launch_ids}
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from app.core.models import BaseModel
 
@@ -10,4 +10,6 @@ class LaunchUpvote(BaseModel):
 
     __table_args__ = (
         UniqueConstraint("launch_id", "user_id", name="unique_launch_upvote"),
+        # "Which of these launches has this user upvoted?"
+        Index("ix_launch_upvotes_user_launch", "user_id", "launch_id"),
     )
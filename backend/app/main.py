@@ -1,20 +1,47 @@
 from dotenv import load_dotenv
 load_dotenv()
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request, Depends
 from fastapi.responses import Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.security import require_role
+from app.core.pagination import NEXT_CURSOR_HEADER, TRUNCATED_HEADER
+from app.core.read_routing import STICKY_HEADER, sticky_reads_middleware
+from app.core.pool_metrics import pool_metrics
+from app.ai.similar import similar_index
+from app.credibility.worker import credibility_worker
+from app.launches.counters import upvote_buffer
+from app.launches.leaderboard import launch_leaderboard
+from app.matches.worker import match_worker
 from app.startups.routes import router as startup_router
 from app.launches.routes import router as launch_router
 from app.reviews.routes import router as review_router
 from app.feedback.routes import router as enterprise_feedback_router
 from app.credibility.routes import router as credibility_router
 from app.enterprises.routes import router as enterprise_profile_router
+from app.matches.routes import router as match_router
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    credibility_worker.start()
+    upvote_buffer.start()
+    launch_leaderboard.start()
+    match_worker.start()
+    similar_index.start()
+    yield
+    await similar_index.stop()
+    await match_worker.stop()
+    await launch_leaderboard.stop()
+    # Buffer first: its last flush feeds the credibility worker
+    await upvote_buffer.stop()
+    await credibility_worker.stop()
 
 
-app = FastAPI(title="EthAum.ai API")
+app = FastAPI(title="EthAum.ai API", lifespan=lifespan)
 
 @app.middleware("http")
 async def allow_preflight(request: Request, call_next):
@@ -22,12 +49,15 @@ async def allow_preflight(request: Request, call_next):
         return Response(status_code=200)
     return await call_next(request)
 
+app.middleware("http")(sticky_reads_middleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, TRUNCATED_HEADER, STICKY_HEADER],
 )
 
 
@@ -38,6 +68,30 @@ app.add_middleware(
 def health_check():
     return {"status": "ok"}
 
+@app.get("/health/db-pool")
+def db_pool_health():
+    return pool_metrics()
+
+@app.get("/health/credibility-worker")
+def credibility_worker_health():
+    return credibility_worker.metrics()
+
+@app.get("/health/upvote-buffer")
+def upvote_buffer_health():
+    return upvote_buffer.metrics()
+
+@app.get("/health/launch-leaderboard")
+def launch_leaderboard_health():
+    return launch_leaderboard.metrics()
+
+@app.get("/health/match-worker")
+def match_worker_health():
+    return match_worker.metrics()
+
+@app.get("/health/similar-index")
+def similar_index_health():
+    return similar_index.metrics()
+
 # --------------------
 # Role test endpoints
 # --------------------
@@ -62,3 +116,4 @@ app.include_router(review_router)
 app.include_router(enterprise_feedback_router)
 app.include_router(credibility_router)
 app.include_router(enterprise_profile_router)
+app.include_router(match_router)
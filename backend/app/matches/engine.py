@@ -0,0 +1,210 @@
+# app/matches/engine.py
+
+import asyncio
+import heapq
+import time
+from collections import defaultdict
+from itertools import islice
+
+from sortedcontainers import SortedList
+from sqlalchemy import any_, case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.startups.models import Startup
+
+# -------------------------------------------------
+# SCORING
+# -------------------------------------------------
+# score = 100 * ((1 - w) * fit + w * credibility / 100), where fit is
+# INDUSTRY_WEIGHT for an interested industry plus the rest for a
+# preferred ARR range. w grows with the enterprise's buying stage: early
+# on fit matters most, closer to a purchase the track record does.
+
+INDUSTRY_WEIGHT = 0.6
+STAGE_CREDIBILITY_WEIGHTS = {
+    "exploring": 0.15,
+    "research": 0.15,
+    "evaluation": 0.25,
+    "pilot": 0.35,
+    "procurement": 0.45,
+    "purchase": 0.45,
+}
+DEFAULT_CREDIBILITY_WEIGHT = 0.25
+
+
+def credibility_weight(engagement_stage: str | None) -> float:
+    stage = (engagement_stage or "").strip().lower()
+    return STAGE_CREDIBILITY_WEIGHTS.get(stage, DEFAULT_CREDIBILITY_WEIGHT)
+
+
+def fit(profile, industry: str, arr_range: str) -> float:
+    return (
+        INDUSTRY_WEIGHT * (industry in profile.interested_industries)
+        + (1 - INDUSTRY_WEIGHT) * (arr_range in profile.preferred_arr_ranges)
+    )
+
+
+def match_score(profile, industry: str, arr_range: str, credibility_score: int) -> float:
+    """
+    0-100 score of one startup for one enterprise profile.
+    """
+    w = credibility_weight(profile.engagement_stage)
+    return 100 * ((1 - w) * fit(profile, industry, arr_range) + w * credibility_score / 100)
+
+
+def match_score_sql(profile, industry, arr_range, credibility_score):
+    """
+    SQL twin of `match_score` over enterprise_profiles columns.
+    """
+    w = case(
+        *(
+            (func.lower(func.trim(profile.engagement_stage)) == stage, weight)
+            for stage, weight in STAGE_CREDIBILITY_WEIGHTS.items()
+        ),
+        else_=DEFAULT_CREDIBILITY_WEIGHT,
+    )
+    fit_sql = (
+        case((industry == any_(profile.interested_industries), INDUSTRY_WEIGHT), else_=0.0)
+        + case((arr_range == any_(profile.preferred_arr_ranges), 1 - INDUSTRY_WEIGHT), else_=0.0)
+    )
+    return 100 * ((1 - w) * fit_sql + w * credibility_score / 100.0)
+
+
+# -------------------------------------------------
+# INVERTED INDEX
+# -------------------------------------------------
+
+class MatchIndex:
+    """
+    Startups bucketed by (industry, arr_range), each bucket sorted by
+    credibility, with industry -> buckets and arr_range -> buckets
+    postings on top.
+
+    Every startup in a bucket has the same fit for a given profile, so
+    within a bucket match_score follows credibility. A profile's top K
+    is a lazy k-way merge of the buckets its industries and ARR ranges
+    point at: O(buckets + K log buckets), independent of catalog size.
+    """
+
+    def __init__(self):
+        # startup_id -> (industry, arr_range, credibility_score)
+        self._startups: dict = {}
+        # (industry, arr_range) -> SortedList of (credibility_score, startup_id)
+        self._buckets: dict = {}
+        self._by_industry = defaultdict(set)
+        self._by_arr_range = defaultdict(set)
+
+        self.ready = False
+        self.loads = 0
+        self.last_load_s = 0.0
+
+    def __len__(self):
+        return len(self._startups)
+
+    def get(self, startup_id):
+        return self._startups.get(startup_id)
+
+    # ---------------------------------------------
+    # Updates
+    # ---------------------------------------------
+    def upsert(self, startup_id, industry: str, arr_range: str, credibility_score: int) -> bool:
+        """
+        Index a startup; False if it was already indexed as-is.
+        """
+        entry = (industry, arr_range, credibility_score or 0)
+        if self._startups.get(startup_id) == entry:
+            return False
+
+        self.remove(startup_id)
+        self._startups[startup_id] = entry
+
+        key = (industry, arr_range)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = SortedList()
+            self._by_industry[industry].add(key)
+            self._by_arr_range[arr_range].add(key)
+        bucket.add((entry[2], startup_id))
+        return True
+
+    def remove(self, startup_id):
+        entry = self._startups.pop(startup_id, None)
+        if entry is None:
+            return
+
+        industry, arr_range, score = entry
+        key = (industry, arr_range)
+        bucket = self._buckets[key]
+        bucket.remove((score, startup_id))
+        if not bucket:
+            del self._buckets[key]
+            self._by_industry[industry].discard(key)
+            self._by_arr_range[arr_range].discard(key)
+
+    # ---------------------------------------------
+    # Queries
+    # ---------------------------------------------
+    def candidate_buckets(self, profile) -> set:
+        keys = set()
+        for industry in profile.interested_industries or ():
+            keys |= self._by_industry.get(industry, set())
+        for arr_range in profile.preferred_arr_ranges or ():
+            keys |= self._by_arr_range.get(arr_range, set())
+        return keys
+
+    def top_matches(self, profile, k: int) -> list:
+        """
+        Best `k` (score, startup_id) for a profile, best first; ties go
+        to the higher startup_id, as in the SQL reads and trims.
+        """
+        w = credibility_weight(profile.engagement_stage)
+
+        def ranked(key):
+            base = 100 * (1 - w) * fit(profile, *key)
+            for score, startup_id in reversed(self._buckets[key]):
+                yield base + w * score, startup_id
+
+        merged = heapq.merge(
+            *(ranked(key) for key in self.candidate_buckets(profile)),
+            reverse=True,
+        )
+        return list(islice(merged, k))
+
+    # ---------------------------------------------
+    # Loading
+    # ---------------------------------------------
+    async def load(self, db: AsyncSession):
+        """
+        Rebuild from the startups table (startup, resync). Rows are read
+        on the event loop; the buckets are built in a worker thread and
+        swapped in.
+        """
+        start = time.perf_counter()
+        rows = (
+            await db.execute(
+                select(Startup.id, Startup.industry, Startup.arr_range, Startup.credibility_score)
+            )
+        ).all()
+        fresh = await asyncio.to_thread(MatchIndex.from_rows, rows)
+
+        self._startups = fresh._startups
+        self._buckets = fresh._buckets
+        self._by_industry = fresh._by_industry
+        self._by_arr_range = fresh._by_arr_range
+
+        self.ready = True
+        self.loads += 1
+        self.last_load_s = time.perf_counter() - start
+
+    @classmethod
+    def from_rows(cls, rows) -> "MatchIndex":
+        """
+        Index of (id, industry, arr_range, credibility_score) rows; CPU only.
+        """
+        index = cls()
+        for row in rows:
+            index.upsert(*row)
+        return index
+
+
+match_index = MatchIndex()
@@ -0,0 +1,34 @@
+from sqlalchemy import Column, Float, ForeignKey, Index, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.core.models import BaseModel
+
+
+class StartupMatch(BaseModel):
+    """
+    One entry of an enterprise's precomputed top-K startup list.
+
+    Rows are replaced wholesale by the match refresher; `id` is the
+    match_id stamped onto enterprise feedback.
+    """
+    __tablename__ = "startup_matches"
+    __table_args__ = (
+        UniqueConstraint("enterprise_id", "startup_id", name="unique_startup_match"),
+        # GET /matches/me: one enterprise's list, best first
+        Index("ix_startup_matches_enterprise_score", "enterprise_id", "score", "startup_id"),
+    )
+
+    # users.id of the enterprise (same as EnterpriseFeedback.enterprise_id)
+    enterprise_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    startup_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("startups.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    score = Column(Float, nullable=False)
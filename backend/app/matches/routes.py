@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import MATCH_TOP_K
+from app.core.deps import get_async_db, require_principal
+from app.matches.schemas import MatchResponse
+from app.matches.service import get_enterprise_matches
+
+router = APIRouter(prefix="/matches", tags=["matches"])
+
+
+# -------------------------------------------------
+# Best-matching startups for the current enterprise
+# -------------------------------------------------
+@router.get("/me", response_model=list[MatchResponse])
+async def get_my_matches(
+    limit: int = Query(20, ge=1, le=MATCH_TOP_K),
+    db: AsyncSession = Depends(get_async_db),
+    principal=Depends(require_principal("enterprise")),
+):
+    rows = await get_enterprise_matches(db, principal["user_id"], limit)
+    return [
+        {"id": match.id, "score": round(match.score, 2), "startup": startup}
+        for match, startup in rows
+    ]
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+from uuid import UUID
+
+from app.startups.schemas import StartupResponse
+
+
+class MatchResponse(BaseModel):
+    id: UUID
+    # 0-100: profile fit blended with credibility (see app/matches/engine.py)
+    score: float
+    startup: StartupResponse
@@ -0,0 +1,289 @@
+from sqlalchemy import Float, bindparam, column, delete, func, or_, select, true, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID, array, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import MATCH_TOP_K
+from app.enterprises.models import EnterpriseProfile
+from app.matches.engine import match_index, match_score_sql
+from app.matches.models import StartupMatch
+from app.startups.models import Startup
+
+
+async def ensure_match_index(db: AsyncSession):
+    if not match_index.ready:
+        await match_index.load(db)
+
+
+# -------------------------------------------------
+# FULL LIST RECOMPUTE (from the in-memory index)
+# -------------------------------------------------
+
+# Lists written per DELETE + INSERT pair. Rows travel as three array
+# parameters, so statement size (and compile time) does not grow with
+# the batch; the cap only bounds memory per round trip.
+WRITE_BATCH = 1000
+
+
+def match_rows(enterprise_ids, startup_ids, scores):
+    """
+    (enterprise_id, startup_id, score) rows from parallel arrays, bound
+    as three parameters and expanded with unnest().
+    """
+    return func.unnest(
+        bindparam("enterprise_ids", enterprise_ids, type_=ARRAY(UUID(as_uuid=True))),
+        bindparam("startup_ids", startup_ids, type_=ARRAY(UUID(as_uuid=True))),
+        bindparam("scores", scores, type_=ARRAY(Float)),
+    ).table_valued(
+        column("enterprise_id", UUID(as_uuid=True)),
+        column("startup_id", UUID(as_uuid=True)),
+        column("score", Float),
+        name="rows",
+    ).render_derived()
+
+
+async def refresh_enterprises_matches(db: AsyncSession, profiles) -> int:
+    """
+    Recompute the top-K lists of `profiles` and write them with one
+    DELETE + one INSERT per WRITE_BATCH enterprises.
+
+    Startups that stay in a list keep their row (and match id); only
+    scores move. Stamps the profiles' matches_computed_at (an empty list
+    is a computed list too). The caller commits. Returns the number of
+    rows written.
+    """
+    if not profiles:
+        return 0
+
+    await ensure_match_index(db)
+    written = 0
+    for i in range(0, len(profiles), WRITE_BATCH):
+        written += await _write_lists(db, profiles[i : i + WRITE_BATCH])
+    return written
+
+
+async def _write_lists(db: AsyncSession, profiles) -> int:
+    enterprise_ids, startup_ids, scores = [], [], []
+    for profile in profiles:
+        for score, startup_id in match_index.top_matches(profile, MATCH_TOP_K):
+            enterprise_ids.append(profile.user_id)
+            startup_ids.append(startup_id)
+            scores.append(score)
+    rows = match_rows(enterprise_ids, startup_ids, scores)
+
+    await db.execute(
+        delete(StartupMatch)
+        .where(StartupMatch.enterprise_id.in_([profile.user_id for profile in profiles]))
+        .where(
+            tuple_(StartupMatch.enterprise_id, StartupMatch.startup_id).notin_(
+                select(rows.c.enterprise_id, rows.c.startup_id)
+            )
+        )
+    )
+
+    await db.execute(
+        update(EnterpriseProfile)
+        .where(EnterpriseProfile.user_id.in_([profile.user_id for profile in profiles]))
+        # Bookkeeping, not a profile edit: leave updated_at alone
+        .values(matches_computed_at=func.now(), updated_at=EnterpriseProfile.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+
+    if scores:
+        stmt = insert(StartupMatch).from_select(
+            ["id", "enterprise_id", "startup_id", "score"],
+            select(func.gen_random_uuid(), rows.c.enterprise_id, rows.c.startup_id, rows.c.score),
+        )
+        await db.execute(
+            stmt.on_conflict_do_update(
+                constraint="unique_startup_match",
+                set_={"score": stmt.excluded.score},
+                # Unchanged rows are left alone (no dead tuples)
+                where=StartupMatch.score != stmt.excluded.score,
+            )
+        )
+    return len(scores)
+
+
+async def refresh_enterprise_matches(db: AsyncSession, profile: EnterpriseProfile) -> int:
+    return await refresh_enterprises_matches(db, [profile])
+
+
+# -------------------------------------------------
+# REVERSE MATCHING (one startup -> many enterprises)
+# -------------------------------------------------
+
+def interested_enterprises_condition(industry, arr_range):
+    """
+    Profiles that list the industry or the ARR range; each arm is an
+    array containment served by its GIN index (BitmapOr).
+    """
+    return or_(
+        EnterpriseProfile.interested_industries.contains(array([industry])),
+        EnterpriseProfile.preferred_arr_ranges.contains(array([arr_range])),
+    )
+
+
+def fan_out_matches_stmt(startup_ids):
+    """
+    Score the given startups against every interested enterprise and
+    upsert them into each list they now make, in one statement:
+
+    INSERT INTO startup_matches
+    SELECT p.user_id, s.id, <score>
+    FROM startups s JOIN enterprise_profiles p ON <containment>
+    WHERE <score> > that list's K-th score (or the list is short)
+    ON CONFLICT DO UPDATE SET score
+    RETURNING enterprise_id
+
+    Lists can then be longer than K; `trim_matches_stmt` cuts them back.
+    """
+    score = match_score_sql(
+        EnterpriseProfile, Startup.industry, Startup.arr_range, Startup.credibility_score
+    )
+    pairs = (
+        select(
+            EnterpriseProfile.user_id.label("enterprise_id"),
+            Startup.id.label("startup_id"),
+            score.label("score"),
+        )
+        .select_from(Startup)
+        .join(
+            EnterpriseProfile,
+            interested_enterprises_condition(Startup.industry, Startup.arr_range),
+        )
+        .where(Startup.id.in_(startup_ids))
+        .cte("pairs")
+    )
+
+    # One K-th score lookup per list (ix_startup_matches_enterprise_score),
+    # not one per (startup, enterprise) pair
+    lists = select(pairs.c.enterprise_id).distinct().subquery("lists")
+    kth = (
+        select(StartupMatch.score)
+        .where(StartupMatch.enterprise_id == lists.c.enterprise_id)
+        .order_by(StartupMatch.score.desc())
+        .offset(MATCH_TOP_K - 1)
+        .limit(1)
+        .lateral("kth")
+    )
+    cut = (
+        select(lists.c.enterprise_id, kth.c.score)
+        .select_from(lists.outerjoin(kth, true()))
+        .subquery("cut")
+    )
+    scored = (
+        select(func.gen_random_uuid(), pairs.c.enterprise_id, pairs.c.startup_id, pairs.c.score)
+        .join(cut, cut.c.enterprise_id == pairs.c.enterprise_id)
+        .where(pairs.c.score > func.coalesce(cut.c.score, -1.0))
+    )
+
+    stmt = insert(StartupMatch).from_select(
+        ["id", "enterprise_id", "startup_id", "score"], scored
+    )
+    return stmt.on_conflict_do_update(
+        constraint="unique_startup_match",
+        set_={"score": stmt.excluded.score},
+        where=StartupMatch.score != stmt.excluded.score,
+    ).returning(StartupMatch.enterprise_id)
+
+
+def trim_matches_stmt(enterprise_ids):
+    """
+    Drop everything past the K-th entry of the given lists.
+
+    One index probe per list finds its K-th (score, startup_id); rows
+    ordered after it go. Unlike a row_number() window this stays linear
+    even when the planner's row estimates are off.
+    """
+    trimmed = func.unnest(
+        bindparam("enterprise_ids", enterprise_ids, type_=ARRAY(UUID(as_uuid=True)))
+    ).table_valued(column("enterprise_id", UUID(as_uuid=True)), name="trimmed").render_derived()
+    kth = (
+        select(StartupMatch.score, StartupMatch.startup_id)
+        .where(StartupMatch.enterprise_id == trimmed.c.enterprise_id)
+        .order_by(StartupMatch.score.desc(), StartupMatch.startup_id.desc())
+        .offset(MATCH_TOP_K - 1)
+        .limit(1)
+        .lateral("kth")
+    )
+    cut = (
+        select(trimmed.c.enterprise_id, kth.c.score, kth.c.startup_id)
+        .select_from(trimmed.join(kth, true()))
+        .subquery("cut")
+    )
+    return delete(StartupMatch).where(
+        StartupMatch.enterprise_id == cut.c.enterprise_id,
+        tuple_(StartupMatch.score, StartupMatch.startup_id)
+        < tuple_(cut.c.score, cut.c.startup_id),
+    )
+
+
+async def fan_out_startups(db: AsyncSession, startup_ids) -> int:
+    """
+    Push new or improved startups into every enterprise list they now
+    qualify for: one upsert plus one trim, no per-enterprise work.
+    Returns the number of lists touched; the caller commits.
+    """
+    if not startup_ids:
+        return 0
+    result = await db.execute(fan_out_matches_stmt(sorted(startup_ids)))
+    enterprise_ids = sorted(set(result.scalars()))
+    if enterprise_ids:
+        await db.execute(trim_matches_stmt(enterprise_ids))
+    return len(enterprise_ids)
+
+
+async def holders_of(db: AsyncSession, startup_ids) -> list:
+    """
+    Profiles whose current list contains any of the startups.
+    """
+    if not startup_ids:
+        return []
+    return (
+        await db.scalars(
+            select(EnterpriseProfile).where(
+                EnterpriseProfile.user_id.in_(
+                    select(StartupMatch.enterprise_id)
+                    .where(StartupMatch.startup_id.in_(startup_ids))
+                )
+            )
+        )
+    ).all()
+
+
+# -------------------------------------------------
+# READS
+# -------------------------------------------------
+
+async def get_enterprise_matches(db: AsyncSession, enterprise_id, limit: int) -> list:
+    """
+    Best `limit` (match, startup) pairs from the precomputed list.
+    """
+    profile = await db.scalar(
+        select(EnterpriseProfile).where(EnterpriseProfile.user_id == enterprise_id)
+    )
+    if profile is None:
+        return []
+    if profile.matches_computed_at is None:
+        # Never computed (e.g. profile saved moments ago): build it now.
+        # Empty lists are stamped too, so this runs once per profile.
+        await refresh_enterprise_matches(db, profile)
+        await db.commit()
+
+    query = (
+        select(StartupMatch, Startup)
+        .join(Startup, Startup.id == StartupMatch.startup_id)
+        .where(StartupMatch.enterprise_id == enterprise_id)
+        .order_by(StartupMatch.score.desc(), StartupMatch.startup_id.desc())
+        .limit(limit)
+    )
+    return (await db.execute(query)).all()
+
+
+async def match_id_for(db: AsyncSession, enterprise_id, startup_id):
+    return await db.scalar(
+        select(StartupMatch.id).where(
+            StartupMatch.enterprise_id == enterprise_id,
+            StartupMatch.startup_id == startup_id,
+        )
+    )
@@ -0,0 +1,204 @@
+# app/matches/worker.py
+
+import asyncio
+import logging
+import time
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import MATCH_INDEX_RESYNC_SECONDS, MATCH_REFRESH_DEBOUNCE_SECONDS
+from app.core.database import AsyncSessionLocal
+from app.enterprises.models import EnterpriseProfile
+from app.matches.engine import match_index
+from app.matches.service import fan_out_startups, holders_of, refresh_enterprises_matches
+from app.startups.models import Startup
+
+logger = logging.getLogger(__name__)
+
+
+class MatchRefreshWorker:
+    """
+    Keeps precomputed match lists current.
+
+    Profile edits and startup changes (new startup, new score) are
+    coalesced per window and applied by `refresh_changed`. The index is
+    also reloaded every `resync_interval` to pick up writes made by
+    other workers.
+    """
+
+    def __init__(self, window: float, resync_interval: float):
+        self.window = window
+        self.resync_interval = resync_interval
+        # enterprise user ids / startup ids waiting for the next window
+        self._profiles: set = set()
+        self._startups: set = set()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+        self.events = 0
+        self.batches = 0
+        self.refreshed = 0
+        self.errors = 0
+        self.last_batch_s = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def profile_changed(self, enterprise_id):
+        self.events += 1
+        self._profiles.add(enterprise_id)
+        self._wakeup.set()
+
+    def startups_changed(self, startup_ids):
+        self.events += 1
+        self._startups.update(startup_ids)
+        self._wakeup.set()
+
+    def start(self):
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        await self._resync()
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.resync_interval)
+            except asyncio.TimeoutError:
+                await self._resync()
+                continue
+            await asyncio.sleep(self.window)
+            self._wakeup.clear()
+            await self._flush()
+
+    async def _resync(self):
+        try:
+            async with AsyncSessionLocal() as db:
+                await match_index.load(db)
+        except Exception:
+            self.errors += 1
+            logger.exception("Match index reload failed")
+
+    async def _flush(self):
+        profiles, self._profiles = self._profiles, set()
+        startups, self._startups = self._startups, set()
+        if not profiles and not startups:
+            return
+
+        start = time.perf_counter()
+        try:
+            async with AsyncSessionLocal() as db:
+                refreshed = await refresh_changed(db, profiles, startups)
+                await db.commit()
+        except Exception:
+            self.errors += 1
+            logger.exception(
+                "Match refresh failed for %d profiles / %d startups",
+                len(profiles), len(startups),
+            )
+            # Retry on the next window
+            self._profiles |= profiles
+            self._startups |= startups
+            self._wakeup.set()
+            return
+
+        self.batches += 1
+        self.refreshed += refreshed
+        self.last_batch_s = time.perf_counter() - start
+
+    def metrics(self) -> dict:
+        return {
+            "running": self.running,
+            "index_ready": match_index.ready,
+            "indexed_startups": len(match_index),
+            "index_loads": match_index.loads,
+            "last_index_load_s": round(match_index.last_load_s, 3),
+            "pending_profiles": len(self._profiles),
+            "pending_startups": len(self._startups),
+            "events": self.events,
+            "batches": self.batches,
+            "refreshed": self.refreshed,
+            "errors": self.errors,
+            "last_batch_s": round(self.last_batch_s, 3),
+        }
+
+
+async def refresh_changed(db: AsyncSession, enterprise_ids, startup_ids) -> int:
+    """
+    Apply profile edits and startup changes to the match lists.
+
+    Changed startups are re-indexed and fanned out to every interested
+    enterprise in bulk. Only lists that currently hold a startup which
+    fell (lower score, different bucket) are recomputed in full, since
+    the startup that should replace it is not stored anywhere else.
+    Returns the number of lists touched; the caller commits.
+    """
+    changed, fell = set(), set()
+    if startup_ids:
+        rows = {
+            row.id: row
+            for row in await db.execute(
+                select(Startup.id, Startup.industry, Startup.arr_range, Startup.credibility_score)
+                .where(Startup.id.in_(startup_ids))
+            )
+        }
+        for startup_id in startup_ids:
+            before = match_index.get(startup_id)
+            row = rows.get(startup_id)
+            if row is None:
+                match_index.remove(startup_id)
+                continue
+            if not match_index.upsert(*row):
+                continue
+            changed.add(startup_id)
+            if before and (
+                before[:2] != (row.industry, row.arr_range)
+                or (row.credibility_score or 0) < before[2]
+            ):
+                fell.add(startup_id)
+
+    profiles = {profile.user_id: profile for profile in await holders_of(db, fell)}
+    if enterprise_ids:
+        for profile in await db.scalars(
+            select(EnterpriseProfile).where(EnterpriseProfile.user_id.in_(enterprise_ids))
+        ):
+            profiles[profile.user_id] = profile
+
+    # Exact lists first, so the fan-out's K-th score cut-off is current
+    await refresh_enterprises_matches(db, list(profiles.values()))
+    return len(profiles) + await fan_out_startups(db, changed)
+
+
+match_worker = MatchRefreshWorker(MATCH_REFRESH_DEBOUNCE_SECONDS, MATCH_INDEX_RESYNC_SECONDS)
+
+
+async def request_match_refresh(db: AsyncSession, enterprise_id):
+    """
+    Recompute an enterprise's list after a profile write (in the
+    background when the worker runs, otherwise now).
+    """
+    if match_worker.running:
+        match_worker.profile_changed(enterprise_id)
+        return
+    await refresh_changed(db, {enterprise_id}, set())
+    await db.commit()
+
+
+def notify_startups_changed(startup_ids):
+    """
+    New startups / new scores. Ignored outside the API process, where
+    scripts/rebuild_matches.py recomputes everything instead.
+    """
+    if startup_ids and match_worker.running:
+        match_worker.startups_changed(startup_ids)
@@ -1,15 +1,23 @@
-from sqlalchemy import Column, String, Boolean, ForeignKey, Text
+from sqlalchemy import Column, String, Boolean, ForeignKey, Text, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.core.models import BaseModel
 
 class Review(BaseModel):
     __tablename__ = "reviews"
+    __table_args__ = (
+        Index(
+            "ix_reviews_verified_startup_created_id",
+            "startup_id", "created_at", "id",
+            postgresql_where=text("verified"),
+        ),
+    )
 
     startup_id = Column(
         UUID(as_uuid=True),
         ForeignKey("startups.id"),
-        nullable=False
+        nullable=False,
+        index=True,
     )
 
     user_id = Column(
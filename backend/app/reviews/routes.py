@@ -1,36 +1,28 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
 
-from app.core.deps import get_db
+from app.core.deps import get_async_db, get_read_db, require_principal
+from app.core.pagination import PageParams, page_params, set_next_cursor
 from app.core.security import require_role
-from app.startups.service import get_startup_by_user
-from app.users.service import get_or_create_user
 from app.reviews.schemas import ReviewCreate, ReviewResponse
 from app.reviews.service import create_review, list_verified_reviews, verify_review
 
 router = APIRouter(prefix="/reviews", tags=["reviews"])
 
 @router.post("/", response_model=ReviewResponse)
-def submit_review(
+async def submit_review(
     payload: ReviewCreate,
-    db: Session = Depends(get_db),
-    user=Depends(require_role("startup")),
+    db: AsyncSession = Depends(get_async_db),
+    principal=Depends(require_principal("startup")),
 ):
-    db_user = get_or_create_user(
-        db,
-        clerk_user_id=user["clerk_user_id"],
-        email=user.get("email", "unknown@example.com"),
-        role=user["role"],
-    )
-
-    startup = get_startup_by_user(db, db_user.id)
-    if not startup:
+    if not principal["startup_id"]:
         raise HTTPException(status_code=400, detail="Startup not found")
 
-    review = create_review(
+    review = await create_review(
         db=db,
-        startup_id=startup.id,
-        user_id=db_user.id,
+        startup_id=principal["startup_id"],
+        user_id=principal["user_id"],
         reviewer_role="startup",
         content=payload.content,
     )
@@ -39,17 +31,24 @@ def submit_review(
 
 
 @router.get("/startup/{startup_id}", response_model=list[ReviewResponse])
-def get_public_reviews(startup_id: str, db: Session = Depends(get_db)):
-    return list_verified_reviews(db, startup_id)
+async def get_public_reviews(
+    startup_id: UUID,
+    response: Response,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+):
+    reviews, next_cursor = await list_verified_reviews(db, startup_id, page)
+    set_next_cursor(response, next_cursor)
+    return reviews
 
 
 @router.post("/{review_id}/verify", response_model=ReviewResponse)
-def admin_verify_review(
+async def admin_verify_review(
     review_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user=Depends(require_role("admin")),
 ):
-    review = verify_review(db, review_id)
+    review = await verify_review(db, review_id)
     if not review:
         raise HTTPException(status_code=404, detail="Review not found")
     return review
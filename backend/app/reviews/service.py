@@ -1,10 +1,13 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.pagination import PageParams, keyset_page
 from app.reviews.models import Review
-from app.startups.credibility import calculate_credibility
+from app.credibility.worker import request_credibility_recompute
+from app.credibility.stats import bump_startup_stats
 from uuid import UUID
 
-def create_review(
-    db: Session,
+async def create_review(
+    db: AsyncSession,
     startup_id: UUID,
     user_id: UUID,
     reviewer_role: str,
@@ -19,26 +22,36 @@ def create_review(
     )
 
     db.add(review)
-    db.commit()
-    db.refresh(review)
+    await bump_startup_stats(db, startup_id, unverified_reviews=1)
+    await db.commit()
+    await db.refresh(review)
     return review
 
 
-def list_verified_reviews(db: Session, startup_id):
-    return (
-        db.query(Review)
-        .filter_by(startup_id=startup_id, verified=True)
-        .all()
+async def list_verified_reviews(db: AsyncSession, startup_id, page: PageParams):
+    return await keyset_page(
+        db,
+        select(Review).filter_by(startup_id=startup_id, verified=True),
+        (Review.created_at, Review.id),
+        page,
     )
 
 
-def verify_review(db: Session, review_id):
-    review = db.query(Review).filter_by(id=review_id).first()
-    if not review:
-        return None
-    review.verified = True
-    db.commit()
-    
-    calculate_credibility(db, review.startup)
-    
-    return review
+async def verify_review(db: AsyncSession, review_id):
+    # Flip the flag only if it is still unset, so concurrent verifications
+    # of one review count it once
+    startup_id = await db.scalar(
+        update(Review)
+        .where(Review.id == review_id, Review.verified.is_not(True))
+        .values(verified=True)
+        .returning(Review.startup_id)
+    )
+    if startup_id is not None:
+        await bump_startup_stats(
+            db, startup_id, verified_reviews=1, unverified_reviews=-1
+        )
+        await db.commit()
+
+        await request_credibility_recompute(db, startup_id)
+
+    return await db.scalar(select(Review).filter_by(id=review_id))
@@ -1,9 +1,11 @@
 import math
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
-from app.launches.models import Launch
-from app.reviews.models import Review
-from app.feedback.models import EnterpriseFeedback
+from app.credibility.history import persist_scores_stmt
+from app.credibility.stats import fetch_credibility_stats
+from app.matches.worker import notify_startups_changed
+from app.startups.discover_cache import invalidate_discover
 from app.startups.models import Startup
 
 
@@ -21,7 +23,13 @@ def calculate_profile_completeness(startup: Startup) -> int:
     return int((filled / len(checks)) * 100)
 
 
-def calculate_credibility(db: Session, startup: Startup) -> dict:
+def build_credibility_breakdown(
+    startup: Startup,
+    total_upvotes: int,
+    verified_reviews_count: int,
+    feedback_count: int,
+    rating_sum: int,
+) -> dict:
     """
     Calculate an explainable credibility score for a startup.
 
@@ -35,9 +43,6 @@ def calculate_credibility(db: Session, startup: Startup) -> dict:
     # ─────────────────────────────
     # 1. Launch Engagement (25%)
     # ─────────────────────────────
-    launches = db.query(Launch).filter_by(startup_id=startup.id).all()
-    total_upvotes = sum(l.upvotes for l in launches)
-
     if total_upvotes > 0:
         # Logarithmic scaling with diminishing returns
         launch_score = min(
@@ -50,27 +55,14 @@ def calculate_credibility(db: Session, startup: Startup) -> dict:
     # ─────────────────────────────
     # 2. Verified Reviews (25%)
     # ─────────────────────────────
-    verified_reviews_count = (
-        db.query(Review)
-        .filter_by(startup_id=startup.id, verified=True)
-        .count()
-    )
-
     # 10 reviews → max score
     review_score = min(verified_reviews_count * 10, 100)
 
     # ─────────────────────────────
     # 3. Enterprise Feedback (30%)
     # ─────────────────────────────
-    verified_feedback = (
-        db.query(EnterpriseFeedback)
-        .filter_by(startup_id=startup.id, verified=True)
-        .all()
-    )
-
-    if verified_feedback:
-        avg_rating = sum(f.rating for f in verified_feedback) / len(verified_feedback)
-        feedback_count = len(verified_feedback)
+    if feedback_count:
+        avg_rating = rating_sum / feedback_count
 
         # Quality from rating
         base_score = int((avg_rating / 5) * 100)
@@ -101,10 +93,10 @@ def calculate_credibility(db: Session, startup: Startup) -> dict:
     has_data = (
         total_upvotes > 0
         or verified_reviews_count > 0
-        or len(verified_feedback) > 0
+        or feedback_count > 0
     )
 
-    breakdown = {
+    return {
         "launch_engagement": launch_score,
         "verified_reviews": review_score,
         "enterprise_feedback": enterprise_score,
@@ -114,18 +106,43 @@ def calculate_credibility(db: Session, startup: Startup) -> dict:
         "metadata": {
             "total_upvotes": total_upvotes,
             "verified_reviews_count": verified_reviews_count,
-            "enterprise_feedback_count": len(verified_feedback),
+            "enterprise_feedback_count": feedback_count,
             "avg_enterprise_rating": (
-                round(
-                    sum(f.rating for f in verified_feedback) / len(verified_feedback),
-                    1
-                ) if verified_feedback else None
+                round(rating_sum / feedback_count, 1)
+                if feedback_count else None
             ),
         },
     }
 
-    # Persist final score
-    startup.credibility_score = final_score
-    db.commit()
+
+def breakdown_from_stats(stats) -> dict:
+    """
+    Credibility breakdown from one `credibility_stats_query` row.
+    """
+    return build_credibility_breakdown(
+        stats.Startup,
+        stats.total_upvotes,
+        stats.verified_reviews,
+        stats.feedback_count,
+        stats.rating_sum,
+    )
+
+
+async def get_credibility_breakdown(db: AsyncSession, startup: Startup) -> dict:
+    [stats] = await fetch_credibility_stats(db, [startup.id])
+    return breakdown_from_stats(stats)
+
+
+async def calculate_credibility(db: AsyncSession, startup: Startup) -> dict:
+    breakdown = await get_credibility_breakdown(db, startup)
+
+    # Persist final score (snapshotted into the score history if it changed)
+    result = await db.execute(persist_scores_stmt([(startup.id, breakdown["final_score"])]))
+    changed = result.scalars().all()
+    await db.commit()
+    notify_startups_changed(changed)
+    invalidate_discover(changed)
+    set_committed_value(startup, "credibility_score", breakdown["final_score"])
 
     return breakdown
+
@@ -0,0 +1,67 @@
+# app/startups/discover_cache.py
+
+from pydantic import TypeAdapter
+
+from app.core.cache import TTLCache
+from app.core.config import (
+    DISCOVER_CACHE_SIZE,
+    DISCOVER_CACHE_TTL_SECONDS,
+    FACETS_CACHE_SIZE,
+    FACETS_CACHE_TTL_SECONDS,
+)
+from app.core.http_cache import CachedBody
+from app.startups.schemas import StartupResponse
+
+# discover_cache_key(...) -> (CachedBody, next_cursor, truncated)
+discover_cache = TTLCache(DISCOVER_CACHE_SIZE, DISCOVER_CACHE_TTL_SECONDS)
+# (q, industry, arr_range, min_score) -> facet counts (see facets.py)
+facets_cache = TTLCache(FACETS_CACHE_SIZE, FACETS_CACHE_TTL_SECONDS)
+
+_startup_list = TypeAdapter(list[StartupResponse])
+
+# Bumped by every invalidation; a page built across one is not stored
+_generation = 0
+
+
+def current_generation() -> int:
+    return _generation
+
+
+def discover_cache_key(q, industry, arr_range, min_score, sort, page) -> tuple:
+    """
+    Filters as discover_startups applies them (empty filters are no
+    filter; `sort` is the effective order from discover_sort), so
+    requests that run the same query share an entry.
+    """
+    return (q or None, industry or None, arr_range or None, min_score or None,
+            sort, page.limit, page.cursor)
+
+
+async def get_discover_page(key: tuple, build):
+    """
+    (CachedBody, next_cursor, truncated) for a discover page, running
+    `build()` (-> discover_startups' result) on a miss. Rows are serialized once
+    here; hits skip the query and pydantic entirely.
+    """
+    cached = discover_cache.get(key)
+    if cached is not None:
+        return cached
+
+    generation = _generation
+    startups, next_cursor, truncated = await build()
+    body = _startup_list.dump_json(_startup_list.validate_python(startups, from_attributes=True))
+    cached = (CachedBody(body), next_cursor, truncated)
+    # The query may predate a write that cleared the cache meanwhile
+    if generation == _generation:
+        discover_cache.set(key, cached)
+    return cached
+
+
+def invalidate_discover(startup_ids):
+    # Any new startup or score can move rows between pages (and facet
+    # counts) of any filter
+    global _generation
+    if startup_ids:
+        _generation += 1
+        discover_cache.clear()
+        facets_cache.clear()
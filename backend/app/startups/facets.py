@@ -0,0 +1,77 @@
+# app/startups/facets.py
+
+from sqlalchemy import Integer, func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.startups.discover_cache import current_generation, facets_cache
+from app.startups.service import discover_query, normalize_search
+
+# Credibility scores are 0-100, bucketed as "0-19", "20-39", ... "80-100"
+# (a perfect score joins the top band rather than a band of its own)
+SCORE_BAND_WIDTH = 20
+MAX_SCORE = 100
+
+
+def score_band(low: int) -> str:
+    high = low + SCORE_BAND_WIDTH - 1
+    return f"{low}-{MAX_SCORE if high >= MAX_SCORE - 1 else high}"
+
+
+async def get_discover_facets(
+    db: AsyncSession,
+    q=None,
+    industry=None,
+    arr_range=None,
+    min_score=None,
+) -> dict:
+    """
+    Startup counts per industry, arr_range and score band (plus the
+    total) for the current discover filters, in one scan:
+
+    SELECT ..., count(*) FROM startups WHERE <filters>
+    GROUP BY GROUPING SETS ((industry), (arr_range), (band), ())
+    """
+    # Keyed and filtered like /discover, so counts agree with its pages
+    q = normalize_search(q)
+    key = (q, industry, arr_range, min_score)
+    cached = facets_cache.get(key)
+    if cached is not None:
+        return cached
+
+    generation = current_generation()
+    filtered = discover_query(q, industry, arr_range, min_score).subquery()
+    # Width inlined (not bound) so grouping(band) matches GROUP BY band
+    width = literal_column(str(SCORE_BAND_WIDTH), Integer)
+    top = literal_column(str(MAX_SCORE - 1), Integer)
+    band = (
+        func.least(filtered.c.credibility_score, top, type_=Integer) // width * width
+    ).label("band")
+    sets = literal_column("GROUPING SETS ((industry), (arr_range), (band), ())")
+
+    rows = await db.execute(
+        select(
+            func.grouping(filtered.c.industry, filtered.c.arr_range, band).label("level"),
+            filtered.c.industry,
+            filtered.c.arr_range,
+            band,
+            func.count().label("count"),
+        ).group_by(sets)
+    )
+
+    facets = {"total": 0, "industry": {}, "arr_range": {}, "score_band": {}}
+    # grouping() sets a bit per column *not* grouped on, first argument
+    # highest: 0b011 = industry rows, 0b110 = band rows
+    for level, industry_, arr_range_, band_, count in rows:
+        if level == 0b111:
+            facets["total"] = count
+        elif level == 0b011:
+            facets["industry"][industry_] = count
+        elif level == 0b101:
+            facets["arr_range"][arr_range_] = count
+        elif level == 0b110:
+            facets["score_band"][score_band(band_)] = count
+
+    # Counts read before a write that invalidated the cache meanwhile
+    if generation == current_generation():
+        facets_cache.set(key, facets)
+    return facets
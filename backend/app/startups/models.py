@@ -1,12 +1,26 @@
-from sqlalchemy import Column, String, Integer, ForeignKey, Text
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, String, Integer, ForeignKey, Text, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import deferred, query_expression, relationship
 
 from app.core.models import BaseModel
 from app.users.models import User
 
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', name), 'A') || "
+    "setweight(to_tsvector('english', industry), 'B') || "
+    "setweight(to_tsvector('english', description), 'C')"
+)
+
+
 class Startup(BaseModel):
     __tablename__ = "startups"
+    __table_args__ = (
+        # Keyset pagination sort orders
+        Index("ix_startups_credibility_score_id", "credibility_score", "id"),
+        Index("ix_startups_created_id", "created_at", "id"),
+        # Full-text search (?q= on /startups/discover)
+        Index("ix_startups_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
 
@@ -15,5 +29,12 @@ class Startup(BaseModel):
     arr_range = Column(String, nullable=False)
     description = Column(Text, nullable=False)
 
-    credibility_score = Column(Integer, default=0)
+    credibility_score = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # Maintained by Postgres; name outranks industry outranks description.
+    # Deferred so plain listings never ship it over the wire.
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True)))
+    # ts_rank of the current search, populated only by discover_startups
+    search_rank = query_expression()
+
     user = relationship(User, backref="startup")
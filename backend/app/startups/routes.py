@@ -1,105 +1,159 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from uuid import UUID
 
-from app.core.deps import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.ai.schemas import SimilarStartupResponse
+from app.ai.service import get_similar_startups
+from app.core.config import SIMILAR_TOP_K_MAX
+from app.core.deps import get_async_db, get_read_db, get_principal, require_principal
 from app.core.security import get_current_user, require_role
-from app.users.service import get_or_create_user
-from app.startups.schemas import StartupCreate, StartupResponse
-from app.startups.service import create_startup, get_startup_by_user
-from app.startups.credibility import calculate_credibility
+from app.core.http_cache import cached_json_response
+from app.core.pagination import PageParams, page_params, set_next_cursor, set_truncated
+from app.credibility.cache import BREAKDOWN, get_or_build
+from app.users.service import principal_cache
+from app.startups.schemas import DiscoverFacetsResponse, StartupCreate, StartupResponse
+from app.startups.service import create_startup, get_startup, get_startup_by_user
+from app.startups.credibility import get_credibility_breakdown
 from app.startups.credibility_schemas import CredibilityOut
-from app.users.service import get_or_create_user
 from app.startups.service import get_all_startups
-from app.startups.service import discover_startups
-from app.core.security import require_role
+from app.startups.service import discover_sort, discover_startups, normalize_search
+from app.startups.discover_cache import discover_cache_key, get_discover_page
+from app.startups.facets import get_discover_facets
 
 router = APIRouter(prefix="/startups", tags=["startups"])
 
 @router.post("/", response_model=StartupResponse)
-def create_my_startup(
+async def create_my_startup(
     payload: StartupCreate,
-    db: Session = Depends(get_db),
-    user=Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    principal=Depends(get_principal),
 ):
-    db_user = get_or_create_user(
-        db,
-        clerk_user_id=user["clerk_user_id"], 
-        email=user["email"],
-        role=user["role"],
-    )
-
-
-    # Enforce one startup per user
-    existing = get_startup_by_user(db, db_user.id)
+    # Enforce one startup per user (authoritative check, not the cache)
+    existing = await get_startup_by_user(db, principal["user_id"])
     if existing:
         raise HTTPException(status_code=400, detail="Startup already exists")
 
-    return create_startup(db, db_user.id, payload)
+    startup = await create_startup(db, principal["user_id"], payload)
+    principal_cache.invalidate(principal["clerk_user_id"])
+    return startup
 
 @router.get("", response_model=list[StartupResponse])
-def list_startups(
-    db: Session = Depends(get_db),
+async def list_startups(
+    response: Response,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_async_db),
     user=Depends(get_current_user),
 ):
     # Allow enterprise + admin to browse
     if user["role"] not in ("enterprise", "admin"):
         raise HTTPException(status_code=403, detail="Not authorized")
 
-    return get_all_startups(db)
+    startups, next_cursor = await get_all_startups(db, page)
+    set_next_cursor(response, next_cursor)
+    return startups
 
 
 @router.get("/me", response_model=StartupResponse)
-def get_my_startup(
-    db: Session = Depends(get_db),
-    user=Depends(get_current_user),
+async def get_my_startup(
+    db: AsyncSession = Depends(get_async_db),
+    principal=Depends(get_principal),
 ):
-    db_user = get_or_create_user(
-        db,
-        clerk_user_id=user["clerk_user_id"],
-        email=user["email"],
-        role=user["role"],
-    )
-
-    startup = get_startup_by_user(db, db_user.id)
-    if not startup:
+    if not principal["startup_id"]:
         raise HTTPException(status_code=404, detail="Startup not found")
 
-    return startup
+    return await get_startup(db, principal["startup_id"])
 
 
 
 @router.get("/me/credibility", response_model=CredibilityOut)
-def get_my_credibility(
-    db: Session = Depends(get_db),
-    user=Depends(require_role("startup")),
+async def get_my_credibility(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    principal=Depends(require_principal("startup")),
 ):
-    db_user = get_or_create_user(
-        db,
-        clerk_user_id=user["clerk_user_id"],
-        email=user.get("email", "unknown@example.com"),
-        role=user["role"],
-    )
-
-    startup = get_startup_by_user(db, db_user.id)
-    if not startup:
+    if not principal["startup_id"]:
         raise HTTPException(status_code=404, detail="Startup not found")
 
-    return calculate_credibility(db, startup)
+    async def build():
+        # Read-only: persisting the score is the recompute worker's job
+        startup = await get_startup(db, principal["startup_id"])
+        return CredibilityOut(**await get_credibility_breakdown(db, startup))
+
+    entry = await get_or_build(BREAKDOWN, principal["startup_id"], build)
+    return cached_json_response(request, entry)
 
 
 @router.get("/discover", response_model=list[StartupResponse])
-def discover_startups_endpoint(
+async def discover_startups_endpoint(
+    request: Request,
+    q: str | None = Query(None, max_length=200),
     industry: str | None = None,
     arr_range: str | None = None,
     min_score: int | None = None,
-    sort: str = "credibility",
-    db: Session = Depends(get_db),
+    sort: str | None = None,
+    page: PageParams = Depends(page_params),
+    # Misses fill the shared cache: read them on the primary, not a lagging replica
+    db: AsyncSession = Depends(get_async_db),
     user=Depends(require_role("enterprise")),
 ):
-    return discover_startups(
+    q = normalize_search(q)
+    sort = discover_sort(q, sort)
+
+    async def build():
+        return await discover_startups(
+            db=db,
+            q=q,
+            industry=industry,
+            arr_range=arr_range,
+            min_score=min_score,
+            sort=sort,
+            page=page,
+        )
+
+    key = discover_cache_key(q, industry, arr_range, min_score, sort, page)
+    entry, next_cursor, truncated = await get_discover_page(key, build)
+    response = cached_json_response(request, entry)
+    set_next_cursor(response, next_cursor)
+    set_truncated(response, truncated)
+    return response
+
+
+@router.get("/discover/facets", response_model=DiscoverFacetsResponse)
+async def discover_facets_endpoint(
+    q: str | None = Query(None, max_length=200),
+    industry: str | None = None,
+    arr_range: str | None = None,
+    min_score: int | None = None,
+    # Misses fill the shared cache: read them on the primary, not a lagging replica
+    db: AsyncSession = Depends(get_async_db),
+    user=Depends(require_role("enterprise")),
+):
+    # Same filters as /discover, so the sidebar matches the result list
+    return await get_discover_facets(
         db=db,
+        q=q,
         industry=industry,
         arr_range=arr_range,
         min_score=min_score,
-        sort=sort,
-    )
\ No newline at end of file
+    )
+
+
+@router.get("/{startup_id}/similar", response_model=list[SimilarStartupResponse])
+async def similar_startups_endpoint(
+    startup_id: UUID,
+    limit: int = Query(10, ge=1, le=SIMILAR_TOP_K_MAX),
+    db: AsyncSession = Depends(get_read_db),
+    user=Depends(get_current_user),
+):
+    # Same audience as the startup listings
+    if user["role"] not in ("enterprise", "admin"):
+        raise HTTPException(status_code=403, detail="Not authorized")
+
+    similar = await get_similar_startups(db, startup_id, limit)
+    if similar is None:
+        raise HTTPException(status_code=404, detail="Startup not found")
+    return [
+        {"score": round(score, 4), "startup": startup}
+        for score, startup in similar
+    ]
@@ -29,3 +29,11 @@ class StartupResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class DiscoverFacetsResponse(BaseModel):
+    # Counts for the current discover filters; keys are facet values
+    total: int
+    industry: dict[str, int]
+    arr_range: dict[str, int]
+    score_band: dict[str, int]
@@ -1,7 +1,14 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import Float, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import with_expression
+from app.core.config import SEARCH_RANK_CANDIDATES
+from app.core.pagination import PageParams, keyset_page
+from app.ai.service import index_startup
+from app.matches.worker import notify_startups_changed
+from app.startups.discover_cache import invalidate_discover
 from app.startups.models import Startup
 
-def create_startup(db: Session, user_id, data):
+async def create_startup(db: AsyncSession, user_id, data):
     startup = Startup(
         user_id=user_id,
         name=data.name,
@@ -11,25 +18,29 @@ def create_startup(db: Session, user_id, data):
         credibility_score=0,
     )
     db.add(startup)
-    db.commit()
-    db.refresh(startup)
+    await db.commit()
+    await db.refresh(startup)
+    notify_startups_changed([startup.id])
+    invalidate_discover([startup.id])
+    await index_startup(db, startup.id)
     return startup
 
-def get_startup_by_user(db: Session, user_id):
-    return db.query(Startup).filter_by(user_id=user_id).first()
+async def get_startup_by_user(db: AsyncSession, user_id):
+    return await db.scalar(select(Startup).filter_by(user_id=user_id))
 
 
-def get_all_startups(db: Session):
-    return db.query(Startup).all()
+async def get_all_startups(db: AsyncSession, page: PageParams):
+    return await keyset_page(db, select(Startup), (Startup.created_at, Startup.id), page)
 
-def discover_startups(
-    db,
-    industry=None,
-    arr_range=None,
-    min_score=None,
-    sort="credibility",
-):
-    query = db.query(Startup)
+
+def discover_query(q=None, industry=None, arr_range=None, min_score=None):
+    """
+    Startups matching the discover filters (shared with the facet counts).
+    """
+    query = select(Startup)
+
+    if q:
+        query = query.filter(Startup.search_vector.op("@@")(search_query(q)))
 
     if industry:
         query = query.filter(Startup.industry == industry)
@@ -40,9 +51,78 @@ def discover_startups(
     if min_score:
         query = query.filter(Startup.credibility_score >= min_score)
 
-    if sort == "recent":
-        query = query.order_by(Startup.created_at.desc())
+    return query
+
+
+def normalize_search(q):
+    """
+    Whitespace never changes a websearch query; fold it so variants of
+    one search share cache entries (None for a blank search).
+    """
+    return " ".join((q or "").split()) or None
+
+
+def search_query(q):
+    # websearch syntax: "quoted phrases", OR, -excluded
+    return func.websearch_to_tsquery("english", q)
+
+
+def discover_sort(q=None, sort=None) -> str:
+    """
+    Effective order: "relevance" (only with q), "recent" or "credibility".
+    """
+    sort = sort or ("relevance" if q else "credibility")
+    if sort == "relevance" and q:
+        return sort
+    return "recent" if sort == "recent" else "credibility"
+
+
+async def discover_startups(
+    db: AsyncSession,
+    page: PageParams,
+    q=None,
+    industry=None,
+    arr_range=None,
+    min_score=None,
+    sort=None,
+):
+    """
+    (startups, next_cursor, truncated): `truncated` is True when a
+    relevance search had too many matches to rank them all.
+    """
+    query = discover_query(q, industry, arr_range, min_score)
+
+    sort = discover_sort(q, sort)
+    truncated = False
+    if sort == "relevance":
+        # ts_rank has to read every match. Up to SEARCH_RANK_CANDIDATES
+        # matches are all ranked; past that (a common word can match 100k+
+        # rows) only the most credible ones are, and the list is flagged
+        # as truncated
+        matches = query.with_only_columns(Startup.id)
+        probe = matches.limit(SEARCH_RANK_CANDIDATES + 1).subquery()
+        truncated = (
+            await db.scalar(select(func.count()).select_from(probe))
+            > SEARCH_RANK_CANDIDATES
+        )
+        if truncated:
+            candidates = (
+                matches
+                .order_by(Startup.credibility_score.desc(), Startup.id.desc())
+                .limit(SEARCH_RANK_CANDIDATES)
+            )
+            query = select(Startup).where(Startup.id.in_(candidates))
+        rank = func.ts_rank(Startup.search_vector, search_query(q), type_=Float).label("search_rank")
+        query = query.options(with_expression(Startup.search_rank, rank))
+        keys = (rank, Startup.id)
+    elif sort == "recent":
+        keys = (Startup.created_at, Startup.id)
     else:
-        query = query.order_by(Startup.credibility_score.desc())
+        keys = (Startup.credibility_score, Startup.id)
+
+    startups, next_cursor = await keyset_page(db, query, keys, page)
+    return startups, next_cursor, truncated
+
 
-    return query.all()
+async def get_startup(db: AsyncSession, startup_id):
+    return await db.get(Startup, startup_id)
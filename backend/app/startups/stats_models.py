@@ -0,0 +1,34 @@
+from sqlalchemy import Column, Integer, BigInteger, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class StartupStats(Base):
+    """
+    Denormalized counters feeding the credibility formulas.
+
+    Maintained in the same transaction as the writes that change them;
+    `scripts/rebuild_startup_stats.py` regenerates it from source tables.
+    """
+    __tablename__ = "startup_stats"
+
+    startup_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("startups.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    total_upvotes = Column(BigInteger, nullable=False, default=0, server_default="0")
+    launch_count = Column(Integer, nullable=False, default=0, server_default="0")
+    verified_reviews = Column(Integer, nullable=False, default=0, server_default="0")
+    unverified_reviews = Column(Integer, nullable=False, default=0, server_default="0")
+    feedback_count = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_sum = Column(BigInteger, nullable=False, default=0, server_default="0")
+
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
@@ -1,19 +1,127 @@
+from sqlalchemy import select, union_all, literal
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from app.core.cache import TTLCache
+from app.core.config import PRINCIPAL_CACHE_SIZE, PRINCIPAL_CACHE_TTL_SECONDS
 from app.users.models import User
+from app.startups.models import Startup
 import uuid
 
-def get_or_create_user(
+# clerk_user_id -> {"user_id", "role", "startup_id"}
+principal_cache = TTLCache(PRINCIPAL_CACHE_SIZE, PRINCIPAL_CACHE_TTL_SECONDS)
+
+
+async def upsert_user_identity(
+    db: AsyncSession,
+    clerk_user_id: str,
+    email: str,
+    role: str,
+):
+    """
+    Resolve a Clerk user to (users.id, role, owned startup id) in one statement.
+
+    INSERT ... ON CONFLICT DO NOTHING RETURNING creates the user if needed;
+    otherwise the existing row is selected. Returns None if the insert hit
+    a different unique conflict (the email belongs to another Clerk user).
+    """
+    inserted = (
+        insert(User)
+        .values(
+            id=uuid.uuid4(),
+            clerk_user_id=clerk_user_id,
+            email=email,
+            role=role,
+        )
+        .on_conflict_do_nothing()
+        .returning(User.id, User.role)
+        .cte("inserted")
+    )
+    candidates = union_all(
+        select(inserted.c.id, inserted.c.role, literal(True).label("created")),
+        select(User.id, User.role, literal(False).label("created"))
+        .where(User.clerk_user_id == clerk_user_id),
+    ).subquery("candidates")
+
+    row = (
+        await db.execute(
+            select(
+                candidates.c.id,
+                candidates.c.role,
+                candidates.c.created,
+                Startup.id.label("startup_id"),
+            )
+            .outerjoin(Startup, Startup.user_id == candidates.c.id)
+            .limit(1)
+        )
+    ).first()
+
+    if row is None:
+        await db.rollback()
+        # Lost a first-login race: the winner's row is visible now
+        row = (
+            await db.execute(
+                select(
+                    User.id,
+                    User.role,
+                    literal(False).label("created"),
+                    Startup.id.label("startup_id"),
+                )
+                .outerjoin(Startup, Startup.user_id == User.id)
+                .where(User.clerk_user_id == clerk_user_id)
+                .limit(1)
+            )
+        ).first()
+        if row is None:
+            return None
+
+    if row.created:
+        await db.commit()
+
+    return {
+        "user_id": row.id,
+        "role": row.role,
+        "startup_id": row.startup_id,
+    }
+
+
+async def resolve_principal(db: AsyncSession, user: dict):
+    """
+    Extend a verified JWT user with DB identity, cached per process.
+    """
+    identity = principal_cache.get(user["clerk_user_id"])
+    if identity is None:
+        identity = await upsert_user_identity(
+            db,
+            clerk_user_id=user["clerk_user_id"],
+            email=user.get("email") or "unknown@example.com",
+            role=user["role"],
+        )
+        if identity is None:
+            return None
+        # A startup user without a startup is about to create one; don't
+        # pin the empty answer for a whole TTL
+        if identity["startup_id"] is not None or user["role"] != "startup":
+            principal_cache.set(user["clerk_user_id"], identity)
+
+    return {**user, **identity}
+
+
+def get_or_create_user_sync(
     db: Session,
     clerk_user_id: str,
     email: str,
     role: str,
 ):
+    """
+    Sync variant used by the seed scripts.
+    """
     user = db.query(User).filter_by(clerk_user_id=clerk_user_id).first()
     if user:
         return user
 
     user = User(
-        id=uuid.uuid4(),         
+        id=uuid.uuid4(),
         clerk_user_id=clerk_user_id,
         email=email,
         role=role,
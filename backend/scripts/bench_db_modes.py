@@ -0,0 +1,83 @@
+# backend/scripts/bench_db_modes.py
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from dotenv import load_dotenv
+
+# -------------------------------------------------
+# ENV + PATH SETUP
+# -------------------------------------------------
+load_dotenv()
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy.orm import Session
+
+from app.core.deps import get_db
+from app.launches.models import Launch
+from app.launches.schemas import LaunchResponse
+from app.main import app as async_app
+
+# -------------------------------------------------
+# SYNC BASELINE APP
+# -------------------------------------------------
+# Same query and response model as GET /launches/, served the way every
+# route used to be: a sync `def` running in the anyio threadpool.
+sync_app = FastAPI()
+
+
+@sync_app.get("/launches/", response_model=list[LaunchResponse])
+def get_public_launches_sync(db: Session = Depends(get_db)):
+    return db.query(Launch).order_by(Launch.upvotes.desc()).all()
+
+
+# -------------------------------------------------
+# LOAD GENERATOR
+# -------------------------------------------------
+async def run(app, path: str, total: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    queue = asyncio.Queue()
+    for _ in range(total):
+        queue.put_nowait(None)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm up pools before timing
+        await client.get(path)
+
+        async def worker():
+            while not queue.empty():
+                queue.get_nowait()
+                response = await client.get(path)
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return total / elapsed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Compare sync vs async DB request throughput")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"\n🏁 GET /launches/ × {args.requests} (concurrency {args.concurrency})\n")
+
+    sync_rps = await run(sync_app, "/launches/", args.requests, args.concurrency)
+    print(f"🐢 sync  (threadpool + Session):   {sync_rps:8.1f} req/s")
+
+    async_rps = await run(async_app, "/launches/", args.requests, args.concurrency)
+    print(f"⚡ async (event loop + AsyncSession): {async_rps:8.1f} req/s")
+
+    print(f"\n📈 speedup: {async_rps / sync_rps:.2f}x\n")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,158 @@
+# backend/scripts/bench_discover_cache.py
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+import uuid
+
+from dotenv import load_dotenv
+
+# -------------------------------------------------
+# ENV + PATH SETUP
+# -------------------------------------------------
+load_dotenv()
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from sqlalchemy import delete, text
+
+from app.core.database import AsyncSessionLocal, SessionLocal, async_engine
+from app.core.pagination import PageParams
+from app.startups.discover_cache import (
+    discover_cache_key,
+    get_discover_page,
+    invalidate_discover,
+)
+from app.startups.models import Startup
+from app.startups.schemas import StartupResponse
+from app.startups.service import discover_sort, discover_startups
+from app.users.models import User
+
+INDUSTRIES = ["SaaS", "Fintech", "Healthtech", "Edtech", "Logistics",
+              "Climate", "Security", "Retail", "Media", "Robotics"]
+ARR_RANGES = ["0-5 Cr", "5-25 Cr", "25-100 Cr", "100+ Cr"]
+
+# The filter combinations the discover page actually sends
+CASES = [
+    ("no filters", dict()),
+    ("industry", dict(industry="Fintech")),
+    ("industry + arr_range", dict(industry="Climate", arr_range="5-25 Cr")),
+    ("min_score", dict(min_score=70)),
+    ("sort=recent", dict(sort="recent")),
+]
+PAGE = PageParams(limit=50, cursor=None)
+
+
+# -------------------------------------------------
+# FIXTURES
+# -------------------------------------------------
+def create_startups(n: int):
+    db = SessionLocal()
+    try:
+        owner = User(id=uuid.uuid4(), clerk_user_id=f"bench-{uuid.uuid4().hex[:8]}",
+                     email=f"bench-{uuid.uuid4().hex[:8]}@ethaum.dev", role="startup")
+        db.add(owner)
+        db.commit()
+        db.execute(
+            text("""
+                INSERT INTO startups (id, user_id, name, industry, arr_range,
+                                      description, credibility_score, created_at)
+                SELECT gen_random_uuid(), :owner, 'Bench ' || s,
+                       (:industries)[1 + floor(random() * 10)::int],
+                       (:arr_ranges)[1 + floor(random() * 4)::int],
+                       'Synthetic startup used by the discover cache benchmark',
+                       floor(random() * 100)::int,
+                       now() - random() * interval '365 days'
+                FROM generate_series(1, :n) s
+            """),
+            {"owner": owner.id, "industries": INDUSTRIES, "arr_ranges": ARR_RANGES, "n": n},
+        )
+        db.execute(text("ANALYZE startups"))
+        db.commit()
+        return owner.id
+    finally:
+        db.close()
+
+
+def drop_startups(owner_id):
+    db = SessionLocal()
+    try:
+        db.execute(delete(Startup).where(Startup.user_id == owner_id))
+        db.execute(delete(User).where(User.id == owner_id))
+        db.commit()
+    finally:
+        db.close()
+
+
+# -------------------------------------------------
+# TIMING
+# -------------------------------------------------
+async def bench(repeats: int) -> bool:
+    ok = True
+    async with AsyncSessionLocal() as db:
+        print(f"{'filters':<24} {'uncached':>10} {'cached':>10}")
+        for label, filters in CASES:
+            sort = discover_sort(filters.get("q"), filters.get("sort"))
+            params = {**filters, "sort": sort}
+
+            async def build():
+                return await discover_startups(db, PAGE, **params)
+
+            key = discover_cache_key(
+                params.get("q"), params.get("industry"), params.get("arr_range"),
+                params.get("min_score"), sort, PAGE,
+            )
+
+            # What the endpoint did before: query + validate every row
+            uncached = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                startups, _, _ = await build()
+                [StartupResponse.model_validate(s).model_dump(mode="json") for s in startups]
+                uncached.append(time.perf_counter() - start)
+
+            invalidate_discover(["bench"])
+            entry, _, _ = await get_discover_page(key, build)
+            cached = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                await get_discover_page(key, build)
+                cached.append(time.perf_counter() - start)
+
+            startups, _, _ = await build()
+            fresh = [StartupResponse.model_validate(s).model_dump(mode="json") for s in startups]
+            ok &= json.loads(entry.body) == fresh
+
+            print(f"{label:<24} {statistics.median(uncached) * 1000:>8.2f}ms "
+                  f"{statistics.median(cached) * 1e6:>8.1f}µs")
+
+        print(f"\n{'✅' if ok else '❌'} cached bodies equal a fresh serialization")
+    await async_engine.dispose()
+    return ok
+
+
+# -------------------------------------------------
+# MAIN
+# -------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Discover response cache: hit vs miss")
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--repeats", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"\n🗂  Discover cache benchmark ({args.size:,} startups, page of "
+          f"{PAGE.limit}, median of {args.repeats})\n")
+    owner_id = create_startups(args.size)
+    try:
+        ok = asyncio.run(bench(args.repeats))
+    finally:
+        drop_startups(owner_id)
+        print("🧹 Cleaned up\n")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+# backend/scripts/bench_leaderboard.py
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from types import SimpleNamespace
+
+from dotenv import load_dotenv
+
+# -------------------------------------------------
+# ENV + PATH SETUP
+# -------------------------------------------------
+load_dotenv()
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from sqlalchemy import delete, insert, select
+
+from app.core.database import AsyncSessionLocal, SessionLocal, async_engine
+from app.core.pagination import PageParams
+from app.launches.leaderboard import LaunchLeaderboard
+from app.launches.models import Launch
+from app.launches.service import launch_rank, list_launches
+from app.startups.models import Startup
+from app.users.models import User
+
+PAGE = PageParams(limit=50, cursor=None)
+
+
+def timed(fn, repeats: int) -> float:
+    """
+    Median seconds per call.
+    """
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+async def atimed(fn, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def report(label: str, seconds: float):
+    print(f"   {label:<38} {seconds * 1e6:>12,.1f} µs")
+
+
+# -------------------------------------------------
+# IN-MEMORY
+# -------------------------------------------------
+def bench_memory(n: int, repeats: int):
+    board = LaunchLeaderboard(resync_interval=0)
+    # The ranking only needs each launch's id and count
+    launches = [
+        SimpleNamespace(id=uuid.uuid4(), upvotes=int(random.paretovariate(1.2)))
+        for _ in range(n)
+    ]
+
+    start = time.perf_counter()
+    for launch in launches:
+        board.upsert(launch)
+    print(f"🧠 In-memory leaderboard ({n:,} launches, seeded in "
+          f"{time.perf_counter() - start:.2f}s)")
+
+    _, cursor = board.page_keys(PAGE)
+    deep = PageParams(limit=50, cursor=cursor)
+    ids = [launch.id for launch in random.sample(launches, 1000)]
+
+    report("top 50 keys (page one)", timed(lambda: board.page_keys(PAGE), repeats))
+    report("next 50 keys (cursor page)", timed(lambda: board.page_keys(deep), repeats))
+    report("rank of a launch", timed(lambda: board.rank(random.choice(ids)), repeats))
+    report(
+        "upvote (re-key one launch)",
+        timed(lambda: board.set_upvotes(i := random.choice(ids), board.upvotes(i) + 1), repeats),
+    )
+    print()
+
+
+# -------------------------------------------------
+# SQL
+# -------------------------------------------------
+def create_launches(n: int):
+    db = SessionLocal()
+    try:
+        owner = User(id=uuid.uuid4(), clerk_user_id=f"bench-{uuid.uuid4().hex[:8]}",
+                     email=f"bench-{uuid.uuid4().hex[:8]}@ethaum.dev", role="startup")
+        db.add(owner)
+        db.flush()
+        startup = Startup(user_id=owner.id, name="Leaderboard bench", industry="SaaS",
+                          arr_range="0-5 Cr", description="Throwaway startup for benchmarks")
+        db.add(startup)
+        db.flush()
+
+        for i in range(0, n, 10_000):
+            db.execute(insert(Launch), [
+                {"id": uuid.uuid4(), "startup_id": startup.id, "title": f"Launch {j}",
+                 "tagline": "Synthetic", "description": "Synthetic",
+                 "upvotes": int(random.paretovariate(1.2)), "featured": False}
+                for j in range(i, min(i + 10_000, n))
+            ])
+        db.commit()
+        return owner.id, startup.id
+    finally:
+        db.close()
+
+
+def drop_launches(owner_id, startup_id):
+    db = SessionLocal()
+    try:
+        db.execute(delete(Launch).where(Launch.startup_id == startup_id))
+        db.execute(delete(Startup).where(Startup.id == startup_id))
+        db.execute(delete(User).where(User.id == owner_id))
+        db.commit()
+    finally:
+        db.close()
+
+
+async def bench_sql(repeats: int):
+    async with AsyncSessionLocal() as db:
+        launch_id = (await db.scalars(select(Launch.id).limit(1))).first()
+
+        async def full_sort():
+            # The pre-pagination GET /launches/ query
+            (await db.scalars(select(Launch).order_by(Launch.upvotes.desc()))).all()
+
+        print("🐘 SQL")
+        report("ORDER BY upvotes DESC (all rows)", await atimed(full_sort, max(repeats // 20, 3)))
+        report("keyset top 50 (index)", await atimed(lambda: list_launches(db, PAGE), repeats))
+
+        board = LaunchLeaderboard(resync_interval=0)
+        start = time.perf_counter()
+        await board.resync()
+        report("leaderboard resync (all launches)", time.perf_counter() - start)
+        report("leaderboard top 50 (keys + PK load)",
+               await atimed(lambda: board.page(db, PAGE), repeats))
+        report("rank of a launch (index count)",
+               await atimed(lambda: launch_rank(db, launch_id), repeats))
+    await async_engine.dispose()
+    print()
+
+
+# -------------------------------------------------
+# MAIN
+# -------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="In-memory leaderboard vs SQL")
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--repeats", type=int, default=200)
+    parser.add_argument("--sql", action="store_true",
+                        help="also insert --size launches and time the SQL path")
+    args = parser.parse_args()
+
+    print("\n🏁 Launch leaderboard benchmark (median per call)\n")
+    bench_memory(args.size, args.repeats)
+
+    if args.sql:
+        owner_id, startup_id = create_launches(args.size)
+        try:
+            asyncio.run(bench_sql(args.repeats))
+        finally:
+            drop_launches(owner_id, startup_id)
+
+
+if __name__ == "__main__":
+    main()
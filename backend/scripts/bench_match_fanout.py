@@ -0,0 +1,202 @@
+# backend/scripts/bench_match_fanout.py
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+import uuid
+
+from dotenv import load_dotenv
+
+# -------------------------------------------------
+# ENV + PATH SETUP
+# -------------------------------------------------
+load_dotenv()
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from sqlalchemy import delete, insert, select, update
+
+from app.core.config import MATCH_TOP_K
+from app.core.database import AsyncSessionLocal, SessionLocal, async_engine
+from app.enterprises.models import EnterpriseProfile
+from app.matches.engine import STAGE_CREDIBILITY_WEIGHTS, match_index
+from app.matches.models import StartupMatch
+from app.matches.service import (
+    interested_enterprises_condition,
+    refresh_enterprises_matches,
+)
+from app.matches.worker import refresh_changed
+from app.startups.models import Startup
+from app.users.models import User
+
+INDUSTRIES = ["SaaS", "Fintech", "Healthtech", "Edtech", "Logistics", "Climate",
+              "Security", "Retail", "Media", "Robotics", "AI", "Agritech"]
+ARR_RANGES = ["0-5 Cr", "5-25 Cr", "25-100 Cr", "100+ Cr"]
+
+
+# -------------------------------------------------
+# FIXTURES
+# -------------------------------------------------
+async def create_fixtures(db, startups: int, enterprises: int):
+    owner_id = uuid.uuid4()
+    users = [{"id": owner_id, "clerk_user_id": f"bench-{owner_id.hex[:8]}",
+              "email": f"bench-{owner_id.hex[:8]}@ethaum.dev", "role": "startup"}]
+    enterprise_ids = [uuid.uuid4() for _ in range(enterprises)]
+    users += [{"id": user_id, "clerk_user_id": f"bench-{user_id.hex[:8]}",
+               "email": f"bench-{user_id.hex[:8]}@ethaum.dev", "role": "enterprise"}
+              for user_id in enterprise_ids]
+    # users.id is mapped as String; psycopg2 lets Postgres cast, asyncpg does not
+    with SessionLocal() as sync_db:
+        sync_db.execute(insert(User), users)
+        sync_db.commit()
+
+    await db.execute(insert(EnterpriseProfile), [
+        {"id": uuid.uuid4(), "user_id": user_id, "company_name": "Bench", "industry": "Bench",
+         "company_size": "1000+", "location": "Bench",
+         "interested_industries": random.sample(INDUSTRIES, random.randint(1, 3)),
+         "preferred_arr_ranges": random.sample(ARR_RANGES, random.randint(1, 2)),
+         "engagement_stage": random.choice([None, *map(str.title, STAGE_CREDIBILITY_WEIGHTS)])}
+        for user_id in enterprise_ids
+    ])
+    await db.execute(insert(Startup), [
+        {"id": uuid.uuid4(), "user_id": owner_id, "name": f"Bench {i}",
+         "industry": random.choice(INDUSTRIES), "arr_range": random.choice(ARR_RANGES),
+         "description": "Synthetic", "credibility_score": random.randint(0, 100)}
+        for i in range(startups)
+    ])
+    await db.commit()
+    return owner_id, enterprise_ids
+
+
+async def drop_fixtures(db, owner_id, enterprise_ids):
+    await db.rollback()
+    await db.execute(delete(StartupMatch).where(StartupMatch.enterprise_id.in_(enterprise_ids)))
+    await db.execute(delete(Startup).where(Startup.user_id == owner_id))
+    await db.execute(delete(EnterpriseProfile).where(EnterpriseProfile.user_id.in_(enterprise_ids)))
+    await db.commit()
+    with SessionLocal() as sync_db:
+        sync_db.execute(delete(User).where(User.id.in_([str(owner_id), *map(str, enterprise_ids)])))
+        sync_db.commit()
+
+
+# -------------------------------------------------
+# VERIFY
+# -------------------------------------------------
+async def stored_lists(db, enterprise_ids) -> dict:
+    lists = {user_id: [] for user_id in enterprise_ids}
+    rows = await db.execute(
+        select(StartupMatch.enterprise_id, StartupMatch.score)
+        .where(StartupMatch.enterprise_id.in_(enterprise_ids))
+        .order_by(StartupMatch.enterprise_id, StartupMatch.score.desc())
+    )
+    for enterprise_id, score in rows:
+        lists[enterprise_id].append(round(score, 6))
+    return lists
+
+
+async def verify(db, enterprise_ids) -> int:
+    """
+    Every stored list must equal a from-scratch top K (by score; ties
+    may pick different startups).
+    """
+    profiles = (await db.scalars(
+        select(EnterpriseProfile).where(EnterpriseProfile.user_id.in_(enterprise_ids))
+    )).all()
+    stored = await stored_lists(db, enterprise_ids)
+    bad = 0
+    for profile in profiles:
+        expected = [round(s, 6) for s, _ in match_index.top_matches(profile, MATCH_TOP_K)]
+        if stored[profile.user_id] != expected:
+            bad += 1
+    return bad
+
+
+# -------------------------------------------------
+# MAIN
+# -------------------------------------------------
+async def run(args):
+    async with AsyncSessionLocal() as db:
+        owner_id, enterprise_ids = await create_fixtures(db, args.startups, args.enterprises)
+        try:
+            await match_index.load(db)
+            profiles = (await db.scalars(
+                select(EnterpriseProfile).where(EnterpriseProfile.user_id.in_(enterprise_ids))
+            )).all()
+            await refresh_enterprises_matches(db, profiles)
+            await db.commit()
+            print(f"📦 {args.startups:,} startups, {args.enterprises:,} enterprises, "
+                  f"top {MATCH_TOP_K} each\n")
+
+            startup_ids = (await db.scalars(
+                select(Startup.id).where(Startup.user_id == owner_id)
+            )).all()
+
+            fan_out_s, touched = 0.0, 0
+            for _ in range(args.rounds):
+                # Mix of score jumps, drops and industry moves
+                batch = random.sample(startup_ids, args.batch)
+                for startup_id in batch:
+                    values = {"credibility_score": random.randint(0, 100)}
+                    if random.random() < 0.1:
+                        values["industry"] = random.choice(INDUSTRIES)
+                    await db.execute(update(Startup).where(Startup.id == startup_id).values(**values))
+                await db.commit()
+
+                start = time.perf_counter()
+                touched += await refresh_changed(db, set(), set(batch))
+                await db.commit()
+                fan_out_s += time.perf_counter() - start
+
+            bad = await verify(db, enterprise_ids)
+            print(f"{'✅' if not bad else '❌'} {args.enterprises - bad}/{args.enterprises} "
+                  f"lists equal a full recompute after {args.rounds} rounds\n")
+
+            # Baseline: recompute every interested enterprise, one by one
+            startup = await db.get(Startup, startup_ids[0])
+            interested = (await db.scalars(
+                select(EnterpriseProfile)
+                .where(EnterpriseProfile.user_id.in_(enterprise_ids))
+                .where(interested_enterprises_condition(startup.industry, startup.arr_range))
+            )).all()
+            start = time.perf_counter()
+            for profile in interested:
+                await refresh_enterprises_matches(db, [profile])
+            await db.commit()
+            loop_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            await db.execute(update(Startup).where(Startup.id == startup.id)
+                             .values(credibility_score=(startup.credibility_score + 13) % 101))
+            await db.commit()
+            await refresh_changed(db, set(), {startup.id})
+            await db.commit()
+            one_s = time.perf_counter() - start
+
+            print(f"⚡ batched fan-out: {fan_out_s / args.rounds * 1000:8.1f} ms per "
+                  f"{args.batch}-startup batch ({touched / args.rounds:.0f} lists touched)")
+            print(f"⚡ one startup:     {one_s * 1000:8.1f} ms")
+            print(f"🐢 per-enterprise loop for one startup ({len(interested)} enterprises): "
+                  f"{loop_s * 1000:8.1f} ms\n")
+            return bad
+        finally:
+            await drop_fixtures(db, owner_id, enterprise_ids)
+            await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reverse-match fan-out correctness + timing")
+    parser.add_argument("--startups", type=int, default=20_000)
+    parser.add_argument("--enterprises", type=int, default=5_000)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--batch", type=int, default=50)
+    args = parser.parse_args()
+
+    print("\n🔁 Match fan-out benchmark\n")
+    bad = asyncio.run(run(args))
+    sys.exit(1 if bad else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# backend/scripts/bench_matches.py
+
+import argparse
+import heapq
+import os
+import random
+import sys
+import time
+import uuid
+from types import SimpleNamespace
+
+from dotenv import load_dotenv
+
+# -------------------------------------------------
+# ENV + PATH SETUP
+# -------------------------------------------------
+load_dotenv()
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.matches.engine import STAGE_CREDIBILITY_WEIGHTS, MatchIndex, match_score
+
+INDUSTRIES = ["SaaS", "Fintech", "Healthtech", "Edtech", "Logistics", "Climate",
+              "Security", "Retail", "Media", "Robotics", "AI", "Agritech"]
+ARR_RANGES = ["0-5 Cr", "5-25 Cr", "25-100 Cr", "100+ Cr"]
+
+
+def random_profile():
+    return SimpleNamespace(
+        interested_industries=random.sample(INDUSTRIES, random.randint(1, 4)),
+        preferred_arr_ranges=random.sample(ARR_RANGES, random.randint(1, 2)),
+        engagement_stage=random.choice([None, *STAGE_CREDIBILITY_WEIGHTS]),
+    )
+
+
+def brute_force(startups, profile, k):
+    """
+    Score the whole catalog (what the index avoids).
+    """
+    scored = (
+        (match_score(profile, industry, arr_range, score), startup_id)
+        for startup_id, (industry, arr_range, score) in startups.items()
+        if industry in profile.interested_industries
+        or arr_range in profile.preferred_arr_ranges
+    )
+    return heapq.nlargest(k, scored)
+
+
+# -------------------------------------------------
+# MAIN
+# -------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Match index parity + latency")
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--profiles", type=int, default=200)
+    parser.add_argument("--k", type=int, default=50)
+    args = parser.parse_args()
+
+    startups = {
+        uuid.uuid4(): (random.choice(INDUSTRIES), random.choice(ARR_RANGES), random.randint(0, 100))
+        for _ in range(args.size)
+    }
+    index = MatchIndex()
+    start = time.perf_counter()
+    for startup_id, entry in startups.items():
+        index.upsert(startup_id, *entry)
+    print(f"\n📇 Indexed {args.size:,} startups in {time.perf_counter() - start:.2f}s\n")
+
+    profiles = [random_profile() for _ in range(args.profiles)]
+
+    # Parity: scores must match a full scan (ties may order differently)
+    for profile in profiles[:20]:
+        fast = [round(score, 9) for score, _ in index.top_matches(profile, args.k)]
+        slow = [round(score, 9) for score, _ in brute_force(startups, profile, args.k)]
+        assert fast == slow, (profile, fast[:5], slow[:5])
+    print("✅ Top-K scores match a full scan\n")
+
+    start = time.perf_counter()
+    for profile in profiles:
+        index.top_matches(profile, args.k)
+    indexed = (time.perf_counter() - start) / len(profiles)
+
+    start = time.perf_counter()
+    for profile in profiles[:10]:
+        brute_force(startups, profile, args.k)
+    scan = (time.perf_counter() - start) / 10
+
+    # Incremental update: a score change re-keys one bucket entry
+    ids = random.sample(list(startups), 1000)
+    start = time.perf_counter()
+    for startup_id in ids:
+        industry, arr_range, score = startups[startup_id]
+        index.upsert(startup_id, industry, arr_range, (score + 7) % 101)
+    update = (time.perf_counter() - start) / len(ids)
+
+    print(f"⚡ index top-{args.k}:   {indexed * 1000:8.3f} ms / profile")
+    print(f"🐢 full scan top-{args.k}: {scan * 1000:8.3f} ms / profile")
+    print(f"🔁 score update:      {update * 1e6:8.1f} µs / startup\n")
+
+
+if __name__ == "__main__":
+    main()
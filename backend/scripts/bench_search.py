@@ -0,0 +1,187 @@
+# backend/scripts/bench_search.py
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import uuid
+
+from dotenv import load_dotenv
+
+# -------------------------------------------------
+# ENV + PATH SETUP
+# -------------------------------------------------
+load_dotenv()
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from sqlalchemy import delete, select, text
+
+from app.core.database import AsyncSessionLocal, SessionLocal, async_engine
+from app.core.pagination import PageParams
+from app.startups.models import Startup
+from app.startups.service import discover_startups
+from app.users.models import User
+
+INDUSTRIES = ["SaaS", "Fintech", "Healthtech", "Edtech", "Logistics",
+              "Climate", "Security", "Retail", "Media", "Robotics"]
+
+# A few real words plus a long tail, drawn with a skew so some terms
+# match a large share of rows and others only a handful
+DOMAIN_WORDS = ["payments", "analytics", "platform", "automation", "compliance",
+                "marketplace", "insurance", "lending", "procurement", "warehouse",
+                "diagnostics", "telemedicine", "learning", "carbon", "battery",
+                "fraud", "identity", "checkout", "inventory", "drone"]
+VOCABULARY = DOMAIN_WORDS + [f"term{i}" for i in range(20_000)]
+
+PAGE = PageParams(limit=20, cursor=None)
+
+
+# -------------------------------------------------
+# FIXTURES
+# -------------------------------------------------
+def create_startups(n: int):
+    db = SessionLocal()
+    try:
+        owner = User(id=uuid.uuid4(), clerk_user_id=f"bench-{uuid.uuid4().hex[:8]}",
+                     email=f"bench-{uuid.uuid4().hex[:8]}@ethaum.dev", role="startup")
+        db.add(owner)
+        db.commit()
+
+        start = time.perf_counter()
+        for offset in range(0, n, 100_000):
+            db.execute(
+                text("""
+                    INSERT INTO startups (id, user_id, name, industry, arr_range,
+                                          description, credibility_score, created_at)
+                    SELECT gen_random_uuid(), :owner,
+                           initcap(_bench_word(:words, 0.5)) || ' ' || initcap(_bench_word(:words, 2)),
+                           (:industries)[1 + floor(random() * 10)::int],
+                           '0-5 Cr',
+                           -- correlated on s so every row gets its own words
+                           (SELECT string_agg(_bench_word(:words, 3), ' ')
+                            FROM generate_series(1, 12 + s * 0)),
+                           floor(random() * 100)::int,
+                           now() - random() * interval '365 days'
+                    FROM generate_series(1, :batch) s
+                """),
+                {"owner": owner.id, "industries": INDUSTRIES, "words": VOCABULARY,
+                 "batch": min(100_000, n - offset)},
+            )
+            db.commit()
+            print(f"   inserted {min(offset + 100_000, n):,}")
+        db.execute(text("ANALYZE startups"))
+        db.commit()
+        print(f"📦 {n:,} startups in {time.perf_counter() - start:.0f}s\n")
+        return owner.id
+    finally:
+        db.close()
+
+
+def create_word_function():
+    # skew > 1 concentrates picks on the front of the vocabulary
+    db = SessionLocal()
+    try:
+        db.execute(text("""
+            CREATE OR REPLACE FUNCTION _bench_word(words text[], skew float8)
+            RETURNS text LANGUAGE sql VOLATILE AS $$
+                SELECT words[1 + floor(power(random(), skew + 1) * array_length(words, 1))::int]
+            $$
+        """))
+        db.commit()
+    finally:
+        db.close()
+
+
+def drop_startups(owner_id):
+    db = SessionLocal()
+    try:
+        db.execute(delete(Startup).where(Startup.user_id == owner_id))
+        db.execute(delete(User).where(User.id == owner_id))
+        db.execute(text("DROP FUNCTION IF EXISTS _bench_word(text[], float8)"))
+        db.commit()
+    finally:
+        db.close()
+
+
+# -------------------------------------------------
+# TIMING
+# -------------------------------------------------
+async def timed(fn, repeats: int):
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = await fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000, result
+
+
+async def bench(repeats: int):
+    async with AsyncSessionLocal() as db:
+        async def count(q):
+            return await db.scalar(
+                select(text("count(*)")).select_from(Startup)
+                .where(Startup.search_vector.op("@@")(text("websearch_to_tsquery('english', :q)")))
+                .params(q=q)
+            )
+
+        cases = [
+            ("rare term", dict(q="term19999")),
+            ("mid term", dict(q="term40")),
+            ("common term", dict(q="payments")),
+            ("phrase", dict(q='"fraud identity"')),
+            ("two terms + industry", dict(q="carbon battery", industry="Climate")),
+            ("common + sort=credibility", dict(q="payments", sort="credibility")),
+        ]
+
+        print(f"{'query':<28} {'matches':>9} {'page 1':>10} {'page 2':>10}")
+        for label, filters in cases:
+            matches = await count(filters["q"])
+            first_ms, (_, cursor, _) = await timed(
+                lambda: discover_startups(db, PAGE, **filters), repeats
+            )
+            next_ms = float("nan")
+            if cursor:
+                next_ms, _ = await timed(
+                    lambda: discover_startups(db, PageParams(20, cursor), **filters), repeats
+                )
+            print(f"{label:<28} {matches:>9,} {first_ms:>8.1f}ms {next_ms:>8.1f}ms")
+
+        ilike_ms, _ = await timed(
+            lambda: db.execute(
+                select(Startup.id).where(Startup.description.ilike("%term19999%")).limit(20)
+            ),
+            3,
+        )
+        print(f"\n🐢 baseline ILIKE '%term19999%' (seq scan): {ilike_ms:.0f}ms")
+    await async_engine.dispose()
+
+
+# -------------------------------------------------
+# MAIN
+# -------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Full-text startup search latency")
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--keep", action="store_true",
+                        help="leave the synthetic startups in place (EXPLAIN afterwards)")
+    args = parser.parse_args()
+
+    print(f"\n🔎 Startup search benchmark ({args.size:,} startups, median of "
+          f"{args.repeats})\n")
+    create_word_function()
+    owner_id = create_startups(args.size)
+    try:
+        asyncio.run(bench(args.repeats))
+    finally:
+        if args.keep:
+            print(f"\n📌 Kept; synthetic startups belong to user {owner_id}\n")
+        else:
+            drop_startups(owner_id)
+            print("🧹 Cleaned up\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+# backend/scripts/bench_similar.py
+
+import argparse
+import asyncio
+import math
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+
+from dotenv import load_dotenv
+
+# -------------------------------------------------
+# ENV + PATH SETUP
+# -------------------------------------------------
+load_dotenv()
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.ai.similar import SimilarStartupIndex, build_matrix, document_terms
+from app.core.config import SIMILAR_CANDIDATES, SIMILAR_DIM
+
+INDUSTRIES = ["SaaS", "Fintech", "Healthtech", "Edtech", "Logistics", "Climate",
+              "Security", "Retail", "Media", "Robotics", "AI", "Agritech"]
+
+
+# -------------------------------------------------
+# SYNTHETIC CATALOG
+# -------------------------------------------------
+def synthetic_documents(n: int, topics: int) -> tuple[dict, dict]:
+    """
+    Startups drawn from `topics` themes: most words come from the theme's
+    own vocabulary, the rest from a shared one. Same theme = relevant.
+    """
+    rng = random.Random(7)
+    shared = [f"common{i}" for i in range(5_000)]
+    themes = [[f"t{t}w{i}" for i in range(200)] for t in range(topics)]
+
+    def words(topic, count):
+        return " ".join(
+            rng.choice(themes[topic]) if rng.random() < 0.6 else rng.choice(shared)
+            for _ in range(count)
+        )
+
+    documents, topic_of = {}, {}
+    for _ in range(n):
+        startup_id = uuid.uuid4()
+        topic = rng.randrange(topics)
+        taglines = [words(topic, 6) for _ in range(rng.randint(0, 3))]
+        documents[startup_id] = document_terms(
+            INDUSTRIES[topic % len(INDUSTRIES)], words(topic, 30), taglines
+        )
+        topic_of[startup_id] = topic
+    return documents, topic_of
+
+
+def precision(results, query_id, topic_of) -> float:
+    if not results:
+        return 0.0
+    return sum(topic_of[i] == topic_of[query_id] for _, i in results) / len(results)
+
+
+# -------------------------------------------------
+# BASELINE: exact sparse TF-IDF, pure Python scan
+# -------------------------------------------------
+def sparse_vectors(documents: dict) -> dict:
+    df = {}
+    for counts in documents.values():
+        for term in counts:
+            df[term] = df.get(term, 0) + 1
+    n = len(documents)
+    vectors = {}
+    for startup_id, counts in documents.items():
+        vector = {
+            term: (1 + math.log(tf)) * (math.log((1 + n) / (1 + df[term])) + 1)
+            for term, tf in counts.items()
+        }
+        norm = math.sqrt(sum(w * w for w in vector.values()))
+        vectors[startup_id] = {term: w / norm for term, w in vector.items()}
+    return vectors
+
+
+def sparse_similar(vectors: dict, query_id, k: int) -> list:
+    query = vectors[query_id]
+    scores = [
+        (sum(w * query.get(term, 0.0) for term, w in vector.items()), startup_id)
+        for startup_id, vector in vectors.items()
+        if startup_id != query_id
+    ]
+    scores.sort(reverse=True)
+    return scores[:k]
+
+
+# -------------------------------------------------
+# MAIN
+# -------------------------------------------------
+async def run(args):
+    documents, topic_of = synthetic_documents(args.size, args.topics)
+    ids = list(documents)
+    queries = random.Random(1).sample(ids, args.queries)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = SimilarStartupIndex(
+            args.dim, args.candidates, os.path.join(tmp, "similar.npz"), 3600
+        )
+
+        start = time.perf_counter()
+        built = build_matrix(documents, args.dim)
+        build_s = time.perf_counter() - start
+        index._install(*built, datetime.now(timezone.utc))
+        vectors, terms = built[0], built[1]
+
+        samples, hits = [], []
+        for query_id in queries:
+            start = time.perf_counter()
+            results = index.similar(query_id, args.k)
+            samples.append(time.perf_counter() - start)
+            hits.append(precision(results, query_id, topic_of))
+        query_ms = statistics.median(samples) * 1000
+
+        upserts = []
+        for startup_id in queries[:100]:
+            start = time.perf_counter()
+            index.upsert(startup_id, documents[startup_id])
+            upserts.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await index.save()
+        save_s = time.perf_counter() - start
+        file_mb = os.path.getsize(index.path) / 2**20
+
+        reloaded = SimilarStartupIndex(args.dim, args.candidates, index.path, 3600)
+        start = time.perf_counter()
+        reloaded.load_file()
+        load_s = time.perf_counter() - start
+        same = all(
+            reloaded.similar(query_id, args.k) == index.similar(query_id, args.k)
+            for query_id in queries[:20]
+        )
+
+    terms_mb = sum(keys.nbytes + weights.nbytes for keys, weights in terms) / 2**20
+    print(f"📦 {args.size:,} startups, dim {args.dim}, {args.candidates} candidates: matrix "
+          f"{vectors.nbytes / 2**20:.0f} MB + terms {terms_mb:.0f} MB (file {file_mb:.0f} MB)\n")
+    print(f"🏗  full build:        {build_s:8.2f} s")
+    print(f"💾 save / load:       {save_s:8.2f} s / {load_s:.2f} s "
+          f"({'✅ same results' if same else '❌ results differ'} after reload)")
+    print(f"✏️  upsert:            {statistics.median(upserts) * 1e6:8.0f} µs")
+    print(f"⚡ top-{args.k} query:      {query_ms:8.2f} ms   "
+          f"precision@{args.k} {statistics.mean(hits):.2f}")
+
+    # Baseline on a subset: it is O(catalog * terms) Python per query
+    sample = dict(list(documents.items())[: args.baseline_size])
+    sparse = sparse_vectors(sample)
+    baseline_queries = [query_id for query_id in queries if query_id in sample][:20] or ids[:20]
+    samples, hits = [], []
+    for query_id in baseline_queries:
+        start = time.perf_counter()
+        results = sparse_similar(sparse, query_id, args.k)
+        samples.append(time.perf_counter() - start)
+        hits.append(precision(results, query_id, topic_of))
+    scale = args.size / len(sample)
+    print(f"🐢 exact sparse scan: {statistics.median(samples) * 1000 * scale:8.0f} ms   "
+          f"precision@{args.k} {statistics.mean(hits):.2f} "
+          f"(timed on {len(sample):,}, scaled to {args.size:,})\n")
+    return same
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Similar-startups index latency + quality")
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=SIMILAR_DIM)
+    parser.add_argument("--candidates", type=int, default=SIMILAR_CANDIDATES)
+    parser.add_argument("--topics", type=int, default=200)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--baseline-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print("\n🧭 Similar startups benchmark\n")
+    same = asyncio.run(run(args))
+    sys.exit(0 if same else 1)
+
+
+if __name__ == "__main__":
+    main()
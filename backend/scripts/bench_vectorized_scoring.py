@@ -0,0 +1,181 @@
+# backend/scripts/bench_vectorized_scoring.py
+
+import argparse
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import numpy as np
+from dotenv import load_dotenv
+
+# -------------------------------------------------
+# ENV + PATH SETUP
+# -------------------------------------------------
+load_dotenv()
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.credibility.service import (
+    calculate_launch_score,
+    calculate_review_score,
+    calculate_enterprise_score,
+)
+from app.credibility.vectorized import credibility_scores, overall_scores
+from app.startups.credibility import (
+    build_credibility_breakdown,
+    calculate_profile_completeness,
+)
+
+COMPONENTS = (
+    "launch_engagement",
+    "verified_reviews",
+    "enterprise_feedback",
+    "profile_completeness",
+    "final_score",
+)
+
+PROFILES = [
+    SimpleNamespace(name="Acme", industry="SaaS", arr_range="1-5M",
+                    description="Workflow automation for finance teams"),
+    SimpleNamespace(name="Acme", industry="SaaS", arr_range=None,
+                    description="Workflow automation for finance teams"),
+    SimpleNamespace(name="Ac", industry=None, arr_range="0-1M", description="short"),
+    SimpleNamespace(name=None, industry=None, arr_range=None, description=None),
+]
+
+
+# -------------------------------------------------
+# SYNTHETIC INPUTS
+# -------------------------------------------------
+def random_inputs(n: int, seed: int):
+    rng = np.random.default_rng(seed)
+    feedback_count = rng.integers(0, 12, n)
+    return {
+        # Heavy tail so every launch tier and the log saturation are hit
+        "total_upvotes": np.where(
+            rng.random(n) < 0.1, 0, rng.integers(0, 3000, n) // rng.integers(1, 50, n)
+        ),
+        "verified_reviews": rng.integers(0, 15, n),
+        "unverified_reviews": rng.integers(0, 15, n),
+        "feedback_count": feedback_count,
+        "rating_sum": feedback_count * rng.integers(1, 6, n),
+        "profile": rng.integers(0, len(PROFILES), n),
+    }
+
+
+# -------------------------------------------------
+# PARITY (vectorized == scalar, element by element)
+# -------------------------------------------------
+def check_parity(n: int, seed: int):
+    data = random_inputs(n, seed)
+    completeness = [calculate_profile_completeness(p) for p in PROFILES]
+    profile = np.array(completeness)[data["profile"]]
+
+    vector = credibility_scores(
+        data["total_upvotes"],
+        data["verified_reviews"],
+        data["feedback_count"],
+        data["rating_sum"],
+        profile,
+    )
+    ratings = np.where(
+        data["feedback_count"] > 0,
+        data["rating_sum"] / np.maximum(data["feedback_count"], 1),
+        np.nan,
+    )
+    overall = overall_scores(
+        data["total_upvotes"],
+        data["verified_reviews"],
+        data["unverified_reviews"],
+        ratings,
+        np.zeros(n, dtype=np.int64),
+    )
+
+    for i in range(n):
+        upvotes = int(data["total_upvotes"][i])
+        verified = int(data["verified_reviews"][i])
+        unverified = int(data["unverified_reviews"][i])
+        count = int(data["feedback_count"][i])
+        rating_sum = int(data["rating_sum"][i])
+
+        scalar = build_credibility_breakdown(
+            PROFILES[data["profile"][i]], upvotes, verified, count, rating_sum
+        )
+        for key in COMPONENTS:
+            assert scalar[key] == vector[key][i], (key, i, scalar[key], vector[key][i])
+
+        avg_rating = rating_sum / count if count else None
+        expected = (
+            calculate_launch_score(upvotes),
+            calculate_review_score(verified, unverified),
+            calculate_enterprise_score(avg_rating),
+        )
+        actual = (
+            overall["launch_engagement"][i],
+            overall["peer_reviews"][i],
+            overall["enterprise_feedback"][i],
+        )
+        assert expected == actual, (i, expected, actual)
+
+    print(f"✅ Parity: {n} random startups match the scalar engines exactly")
+
+
+# -------------------------------------------------
+# BENCHMARK
+# -------------------------------------------------
+def bench(n: int, seed: int):
+    data = random_inputs(n, seed)
+    completeness = [calculate_profile_completeness(p) for p in PROFILES]
+    profile = np.array(completeness)[data["profile"]]
+
+    columns = (
+        data["total_upvotes"].tolist(),
+        data["verified_reviews"].tolist(),
+        data["feedback_count"].tolist(),
+        data["rating_sum"].tolist(),
+    )
+    profiles = [PROFILES[i] for i in data["profile"]]
+
+    start = time.perf_counter()
+    scalar = [
+        build_credibility_breakdown(p, u, v, c, r)["final_score"]
+        for p, u, v, c, r in zip(profiles, *columns)
+    ]
+    scalar_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vector = credibility_scores(
+        data["total_upvotes"],
+        data["verified_reviews"],
+        data["feedback_count"],
+        data["rating_sum"],
+        profile,
+    )["final_score"]
+    vector_elapsed = time.perf_counter() - start
+
+    assert vector.tolist() == scalar
+    print(f"🐢 Scalar:     {scalar_elapsed:8.3f}s  ({n / scalar_elapsed:,.0f} startups/s)")
+    print(f"🚀 Vectorized: {vector_elapsed:8.3f}s  ({n / vector_elapsed:,.0f} startups/s)")
+    print(f"📈 Speedup:    {scalar_elapsed / vector_elapsed:,.1f}x\n")
+
+
+# -------------------------------------------------
+# MAIN
+# -------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Vectorized vs scalar credibility scoring")
+    parser.add_argument("--parity", type=int, default=100_000,
+                        help="startups checked element by element")
+    parser.add_argument("--size", type=int, default=1_000_000,
+                        help="startups scored in the benchmark")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print("\n🧮 Credibility scoring: scalar vs numpy\n")
+    check_parity(args.parity, args.seed)
+    print(f"\n⏱️  Scoring {args.size:,} startups\n")
+    bench(args.size, args.seed + 1)
+
+
+if __name__ == "__main__":
+    main()
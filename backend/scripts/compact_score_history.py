@@ -0,0 +1,39 @@
+# backend/scripts/compact_score_history.py
+
+import os
+import sys
+import time
+
+from dotenv import load_dotenv
+
+# -------------------------------------------------
+# ENV + PATH SETUP
+# -------------------------------------------------
+load_dotenv()
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.core.config import SCORE_HISTORY_RAW_DAYS, SCORE_HISTORY_DAILY_DAYS
+from app.core.database import SessionLocal
+from app.credibility.history import compact_score_history_sync
+
+# -------------------------------------------------
+# MAIN (run daily, e.g. from cron)
+# -------------------------------------------------
+def main():
+    print(f"\n🗜️  Downsampling score history: raw > {SCORE_HISTORY_RAW_DAYS}d -> daily, "
+          f"daily > {SCORE_HISTORY_DAILY_DAYS}d -> weekly\n")
+    db = SessionLocal()
+
+    try:
+        start = time.perf_counter()
+        result = compact_score_history_sync(db)
+        elapsed = time.perf_counter() - start
+    finally:
+        db.close()
+
+    print(f"✅ {result['day_buckets']} daily and {result['week_buckets']} weekly "
+          f"buckets written in {elapsed:.2f}s\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# backend/scripts/rebuild_hot_scores.py
+
+import os
+import sys
+import time
+
+from dotenv import load_dotenv
+
+# -------------------------------------------------
+# ENV + PATH SETUP
+# -------------------------------------------------
+load_dotenv()
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.core.config import TRENDING_HALF_LIFE_HOURS
+from app.core.database import SessionLocal
+from app.launches.trending import rebuild_hot_scores_sync
+
+# -------------------------------------------------
+# MAIN
+# -------------------------------------------------
+def main():
+    print(f"\n🔥 Rebuilding trending scores from launch_upvotes "
+          f"(half-life {TRENDING_HALF_LIFE_HOURS:g}h)...\n")
+    db = SessionLocal()
+
+    try:
+        start = time.perf_counter()
+        rows = rebuild_hot_scores_sync(db)
+        elapsed = time.perf_counter() - start
+    finally:
+        db.close()
+
+    print(f"✅ {rows} launches rescored in {elapsed:.2f}s\n")
+
+
+if __name__ == "__main__":
+    main()
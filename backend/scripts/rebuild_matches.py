@@ -0,0 +1,53 @@
+# backend/scripts/rebuild_matches.py
+
+import asyncio
+import os
+import sys
+import time
+
+from dotenv import load_dotenv
+
+# -------------------------------------------------
+# ENV + PATH SETUP
+# -------------------------------------------------
+load_dotenv()
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from sqlalchemy import select
+
+from app.core.config import MATCH_TOP_K
+from app.core.database import AsyncSessionLocal, async_engine
+from app.enterprises.models import EnterpriseProfile
+from app.matches.engine import match_index
+from app.matches.service import refresh_enterprises_matches
+
+
+async def rebuild() -> int:
+    async with AsyncSessionLocal() as db:
+        await match_index.load(db)
+        print(f"📇 Indexed {len(match_index)} startups in {match_index.last_load_s:.2f}s")
+
+        profiles = (await db.scalars(select(EnterpriseProfile))).all()
+        await refresh_enterprises_matches(db, profiles)
+        await db.commit()
+    await async_engine.dispose()
+    return len(profiles)
+
+
+# -------------------------------------------------
+# MAIN
+# -------------------------------------------------
+def main():
+    # After bulk rescoring (scripts/rescore_all.py) or scoring changes;
+    # the API only refreshes lists for changes it sees itself
+    print(f"\n🤝 Rebuilding top-{MATCH_TOP_K} match lists...\n")
+
+    start = time.perf_counter()
+    profiles = asyncio.run(rebuild())
+    elapsed = time.perf_counter() - start
+
+    print(f"✅ {profiles} enterprise lists rebuilt in {elapsed:.2f}s\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+# backend/scripts/rebuild_startup_stats.py
+
+import os
+import sys
+import time
+
+from dotenv import load_dotenv
+
+# -------------------------------------------------
+# ENV + PATH SETUP
+# -------------------------------------------------
+load_dotenv()
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.core.database import SessionLocal
+from app.credibility.stats import rebuild_startup_stats_sync
+
+# -------------------------------------------------
+# MAIN
+# -------------------------------------------------
+def main():
+    print("\n🔁 Rebuilding startup_stats from launches, reviews and feedback...\n")
+    db = SessionLocal()
+
+    try:
+        start = time.perf_counter()
+        rows = rebuild_startup_stats_sync(db)
+        elapsed = time.perf_counter() - start
+    finally:
+        db.close()
+
+    print(f"✅ {rows} startup_stats rows rebuilt in {elapsed:.2f}s\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# backend/scripts/reconcile_upvotes.py
+
+import os
+import sys
+import time
+
+from dotenv import load_dotenv
+
+# -------------------------------------------------
+# ENV + PATH SETUP
+# -------------------------------------------------
+load_dotenv()
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.core.database import SessionLocal
+from app.credibility.rescore import rescore_startups_sync
+from app.credibility.stats import rebuild_startup_stats_sync
+from app.launches.counters import reconcile_upvote_counters_sync
+from app.launches.trending import rebuild_hot_scores_sync
+
+# -------------------------------------------------
+# MAIN (after a crash, with the API stopped)
+# -------------------------------------------------
+def main():
+    print("\n🧾 Reconciling launches.upvotes with launch_upvotes...\n")
+    db = SessionLocal()
+
+    try:
+        start = time.perf_counter()
+        startup_ids = reconcile_upvote_counters_sync(db)
+        if startup_ids:
+            rebuild_startup_stats_sync(db, startup_ids)
+            rescore_startups_sync(db, startup_ids)
+        # Buffered vote weights were lost along with the increments
+        rebuild_hot_scores_sync(db)
+        elapsed = time.perf_counter() - start
+    finally:
+        db.close()
+
+    print(f"✅ Counters fixed for {len(startup_ids)} startups in {elapsed:.2f}s\n")
+
+
+if __name__ == "__main__":
+    main()
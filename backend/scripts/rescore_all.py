@@ -0,0 +1,113 @@
+# backend/scripts/rescore_all.py
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from dotenv import load_dotenv
+
+# -------------------------------------------------
+# ENV + PATH SETUP
+# -------------------------------------------------
+load_dotenv()
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from sqlalchemy import select
+
+from app.core.database import SessionLocal, engine
+from app.credibility.rescore import rescore_startups_sync
+from app.startups.models import Startup
+
+DEFAULT_CHECKPOINT = ".rescore_checkpoint.json"
+
+
+# -------------------------------------------------
+# CHECKPOINT (resumability)
+# -------------------------------------------------
+def load_checkpoint(path: str) -> set:
+    if not os.path.exists(path):
+        return set()
+    with open(path) as f:
+        return {tuple(r) for r in json.load(f)["done"]}
+
+
+def save_checkpoint(path: str, done: set):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump({"done": sorted(done)}, f)
+    os.replace(tmp, path)
+
+
+# -------------------------------------------------
+# WORKER PROCESS
+# -------------------------------------------------
+def init_worker():
+    # Never share pooled connections inherited across fork
+    engine.dispose(close=False)
+
+
+def rescore_chunk(startup_ids: list, from_source: bool):
+    db = SessionLocal()
+    try:
+        updated = rescore_startups_sync(db, startup_ids, from_source)
+    finally:
+        db.close()
+    return (startup_ids[0], startup_ids[-1]), len(startup_ids), updated
+
+
+# -------------------------------------------------
+# MAIN
+# -------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Rescore every startup's credibility")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    parser.add_argument("--from-source", action="store_true",
+                        help="aggregate launches/reviews/feedback instead of startup_stats")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT)
+    parser.add_argument("--restart", action="store_true",
+                        help="ignore an existing checkpoint")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    ids = [str(i) for i in db.scalars(select(Startup.id).order_by(Startup.id))]
+    db.close()
+
+    done = set() if args.restart else load_checkpoint(args.checkpoint)
+    chunks = [
+        ids[i : i + args.chunk_size]
+        for i in range(0, len(ids), args.chunk_size)
+    ]
+    pending = [c for c in chunks if (c[0], c[-1]) not in done]
+
+    print(f"\n🧮 Rescoring {len(ids)} startups in {len(chunks)} chunks "
+          f"({len(chunks) - len(pending)} already done, {args.workers} workers)\n")
+
+    start = time.perf_counter()
+    scored = updated = 0
+
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker) as pool:
+        futures = [pool.submit(rescore_chunk, c, args.from_source) for c in pending]
+        for n, future in enumerate(as_completed(futures), start=1):
+            key, count, changed = future.result()
+            done.add(key)
+            save_checkpoint(args.checkpoint, done)
+
+            scored += count
+            updated += changed
+            rate = scored / (time.perf_counter() - start)
+            print(f"📦 {n}/{len(pending)} chunks · {scored} scored · "
+                  f"{updated} changed · {rate:,.0f} startups/s")
+
+    elapsed = time.perf_counter() - start
+    # Finished cleanly: the next run starts from scratch
+    if os.path.exists(args.checkpoint):
+        os.remove(args.checkpoint)
+    print(f"\n✅ Rescored {scored} startups ({updated} changed) in {elapsed:.2f}s\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,13 +13,14 @@ load_dotenv()
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from app.core.database import SessionLocal
-from app.users.service import get_or_create_user
+from app.users.service import get_or_create_user_sync as get_or_create_user
 from app.startups.models import Startup
 from app.enterprises.models import EnterpriseProfile
 from app.launches.models import Launch
 from app.reviews.models import Review
 from app.feedback.models import EnterpriseFeedback
-from app.startups.credibility import calculate_credibility
+from app.credibility.stats import rebuild_startup_stats_sync
+from app.credibility.rescore import rescore_startups_sync
 
 from clerk_backend_api import Clerk
 
@@ -232,8 +233,8 @@ def main():
         seed_enterprise_feedback(db, s, enterprise_db_ids)
 
     # RECALCULATE
-    for s in startups:
-        calculate_credibility(db, s)
+    rebuild_startup_stats_sync(db)
+    rescore_startups_sync(db, [s.id for s in startups])
 
     print("✅ Seeding complete.")
     print(f"🔐 Login password for ALL users: {PASSWORD}")
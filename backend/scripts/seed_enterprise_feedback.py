@@ -2,6 +2,7 @@ from app.core.database import SessionLocal
 from app.startups.models import Startup
 from app.feedback.models import EnterpriseFeedback
 from app.users.models import User
+from app.credibility.stats import rebuild_startup_stats_sync
 
 # -------------------------------------------------------------------
 # ENTERPRISE FEEDBACK DATA (High-signal, buyer perspective)
@@ -98,6 +99,8 @@ def seed_enterprise_feedback():
                 f"({rating}/5)"
             )
 
+    # Scoring reads the counters, not the source tables
+    rebuild_startup_stats_sync(db)
     db.close()
     print(f"\n🎉 Phase 6 complete — {created} enterprise feedback entries created.\n")
 
@@ -3,6 +3,7 @@
 from app.core.database import SessionLocal
 from app.launches.models import Launch
 from app.startups.models import Startup
+from app.credibility.stats import rebuild_startup_stats_sync
 
 # -------------------------------------------------------------------
 # UPVOTE DISTRIBUTION (Realistic, deterministic)
@@ -58,6 +59,8 @@ def seed_launch_upvotes():
 
         db.commit()
 
+    # Scoring reads the counters, not the source tables
+    rebuild_startup_stats_sync(db)
     db.close()
     print(f"\n🎉 Phase 4 complete — {updated} launches updated.\n")
 
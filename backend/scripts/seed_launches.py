@@ -3,6 +3,7 @@
 from app.core.database import SessionLocal
 from app.startups.models import Startup
 from app.launches.models import Launch
+from app.credibility.stats import rebuild_startup_stats_sync
 
 # -------------------------------------------------------------------
 # LAUNCH SEED DATA (Enterprise-grade, realistic)
@@ -202,6 +203,8 @@ def seed_launches():
 
             print(f"✅ {startup.name} → {title}")
 
+    # Scoring reads the counters, not the source tables
+    rebuild_startup_stats_sync(db)
     db.close()
     print(f"\n🎉 Phase 3 complete — {created} launches created.\n")
 
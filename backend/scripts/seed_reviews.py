@@ -4,6 +4,7 @@ from app.core.database import SessionLocal
 from app.startups.models import Startup
 from app.reviews.models import Review
 from app.users.models import User
+from app.credibility.stats import rebuild_startup_stats_sync
 
 # -------------------------------------------------------------------
 # REVIEW SEED DATA (Enterprise-grade, opinionated)
@@ -114,6 +115,8 @@ def seed_reviews():
             badge = "✅ VERIFIED" if verified else "🟡 UNVERIFIED"
             print(f"{badge} {startup.name}: {content[:50]}...")
 
+    # Scoring reads the counters, not the source tables
+    rebuild_startup_stats_sync(db)
     db.close()
     print(f"\n🎉 Phase 5 complete — {created} reviews created.\n")
 
@@ -0,0 +1,173 @@
+# backend/scripts/stress_upvotes.py
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+
+from dotenv import load_dotenv
+
+# -------------------------------------------------
+# ENV + PATH SETUP
+# -------------------------------------------------
+load_dotenv()
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from sqlalchemy import delete, func, select
+
+from app.core.config import DB_POOL_SIZE, DB_MAX_OVERFLOW
+from app.core.database import AsyncSessionLocal, SessionLocal, async_engine
+from app.credibility.worker import credibility_worker
+from app.launches.counters import upvote_buffer
+from app.launches.models import Launch
+from app.launches.service import upvote_launch
+from app.launches.vote_models import LaunchUpvote
+from app.startups.models import Startup
+from app.startups.stats_models import StartupStats
+from app.users.models import User
+
+RUN_TAG = f"stress-{uuid.uuid4().hex[:8]}"
+
+
+# -------------------------------------------------
+# FIXTURES (throwaway rows, removed afterwards)
+# -------------------------------------------------
+def create_fixtures(voters: int):
+    db = SessionLocal()
+    try:
+        owner = User(id=uuid.uuid4(), clerk_user_id=f"{RUN_TAG}-owner", email=f"{RUN_TAG}-owner@ethaum.dev",
+                     role="startup")
+        db.add(owner)
+        db.flush()
+
+        startup = Startup(user_id=owner.id, name=f"Stress {RUN_TAG}", industry="SaaS",
+                          arr_range="0-5 Cr", description="Throwaway startup for stress tests",
+                          credibility_score=0)
+        db.add(startup)
+        db.flush()
+
+        launch = Launch(startup_id=startup.id, title="Stress", tagline="Stress",
+                        description="Stress", upvotes=0, featured=False)
+        users = [
+            User(id=uuid.uuid4(), clerk_user_id=f"{RUN_TAG}-{i}", email=f"{RUN_TAG}-{i}@ethaum.dev",
+                 role="enterprise")
+            for i in range(voters)
+        ]
+        db.add(launch)
+        db.add_all(users)
+        db.commit()
+        return owner.id, startup.id, launch.id, [u.id for u in users]
+    finally:
+        db.close()
+
+
+def drop_fixtures(owner_id, startup_id, launch_id, user_ids):
+    db = SessionLocal()
+    try:
+        db.execute(delete(LaunchUpvote).where(LaunchUpvote.launch_id == launch_id))
+        db.execute(delete(Launch).where(Launch.id == launch_id))
+        db.execute(delete(Startup).where(Startup.id == startup_id))
+        db.execute(delete(User).where(User.id.in_([owner_id, *user_ids])))
+        db.commit()
+    finally:
+        db.close()
+
+
+# -------------------------------------------------
+# LOAD
+# -------------------------------------------------
+async def fire(launch_id, user_ids, repeats: int, concurrency: int):
+    gate = asyncio.Semaphore(concurrency)
+    outcomes = {"ok": 0, "duplicate": 0, "error": 0}
+
+    async def one(user_id):
+        async with gate:
+            async with AsyncSessionLocal() as db:
+                try:
+                    await upvote_launch(db, launch_id, user_id)
+                    outcomes["ok"] += 1
+                except ValueError:
+                    outcomes["duplicate"] += 1
+                except Exception as exc:
+                    outcomes["error"] += 1
+                    print(f"❌ {type(exc).__name__}: {exc}")
+
+    # Every voter votes `repeats` times, interleaved, so conflicts race too
+    await asyncio.gather(*(one(u) for _ in range(repeats) for u in user_ids))
+    return outcomes
+
+
+async def run(launch_id, startup_id, user_ids, repeats: int, concurrency: int, mode: str):
+    credibility_worker.start()
+    if mode == "buffered":
+        upvote_buffer.start()
+    try:
+        start = time.perf_counter()
+        outcomes = await fire(launch_id, user_ids, repeats, concurrency)
+        elapsed = time.perf_counter() - start
+    finally:
+        # Drains buffered increments, as on API shutdown
+        await upvote_buffer.stop()
+        await credibility_worker.stop()
+
+    if mode == "buffered":
+        m = upvote_buffer.metrics()
+        print(f"🪣 {m['flushes']} flushes · max {m['max_flush_votes']} votes/flush · "
+              f"max lag {m['max_lag_s']}s")
+
+    async with AsyncSessionLocal() as db:
+        counter = await db.scalar(select(Launch.upvotes).where(Launch.id == launch_id))
+        rows = await db.scalar(
+            select(func.count()).select_from(LaunchUpvote)
+            .where(LaunchUpvote.launch_id == launch_id)
+        )
+        stats = await db.scalar(
+            select(StartupStats.total_upvotes).where(StartupStats.startup_id == startup_id)
+        )
+    await async_engine.dispose()
+    return outcomes, elapsed, counter, rows, stats
+
+
+# -------------------------------------------------
+# MAIN
+# -------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Fire parallel upvotes at one launch")
+    parser.add_argument("--voters", type=int, default=2000)
+    parser.add_argument("--repeats", type=int, default=2,
+                        help="votes per voter (all but the first must be rejected)")
+    parser.add_argument("--concurrency", type=int, default=DB_POOL_SIZE + DB_MAX_OVERFLOW)
+    parser.add_argument("--mode", choices=["sync", "buffered"], default="sync",
+                        help="counter update path (see UPVOTE_COUNTER_MODE)")
+    args = parser.parse_args()
+
+    print(f"\n🔥 {args.voters * args.repeats} upvotes from {args.voters} voters, "
+          f"{args.concurrency} in flight ({args.mode} counters)\n")
+
+    owner_id, startup_id, launch_id, user_ids = create_fixtures(args.voters)
+    try:
+        outcomes, elapsed, counter, rows, stats = asyncio.run(
+            run(launch_id, startup_id, user_ids, args.repeats, args.concurrency, args.mode)
+        )
+    finally:
+        drop_fixtures(owner_id, startup_id, launch_id, user_ids)
+
+    total = args.voters * args.repeats
+    print(f"⏱️  {elapsed:.2f}s · {total / elapsed:,.0f} upvotes/s")
+    print(f"📊 accepted={outcomes['ok']} duplicate={outcomes['duplicate']} "
+          f"errors={outcomes['error']}")
+    print(f"🔢 launches.upvotes={counter} launch_upvotes rows={rows} "
+          f"startup_stats.total_upvotes={stats}\n")
+
+    ok = (
+        outcomes["error"] == 0
+        and counter == rows == stats == outcomes["ok"] == args.voters
+    )
+    print("✅ Counters match" if ok else "❌ Counter drift detected")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
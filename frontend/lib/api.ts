@@ -28,6 +28,25 @@ export const setAuthToken = (token: string | null) => {
   }
 };
 
+// Read-your-writes: after a write the API returns X-Primary-Until; sending
+// it back keeps our reads off the (lagging) replica until then
+let primaryUntil: string | null = null;
+
+api.interceptors.response.use((response) => {
+  const until = response.headers["x-primary-until"];
+  if (until) {
+    primaryUntil = until;
+  }
+  return response;
+});
+
+api.interceptors.request.use((config) => {
+  if (primaryUntil && Number(primaryUntil) * 1000 > Date.now()) {
+    config.headers["X-Primary-Until"] = primaryUntil;
+  }
+  return config;
+});
+
 // --- STARTUP ENDPOINTS ---
 
 export const getMyStartup = async (): Promise<Startup> => {
@@ -145,6 +164,15 @@ export const getStartupCredibilityScore = async (
   return data;
 };
 
+export const getCredibilityScores = async (
+  startupIds: string[]
+): Promise<CredibilityScoreResponse[]> => {
+  const { data } = await api.post("/credibility-score/batch", {
+    startup_ids: startupIds,
+  });
+  return data;
+};
+
 export default api;
 
 